@@ -0,0 +1,22 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Offline benchmarks for the SWS client's hot paths, run against the mock
+resources with injected latency:
+
+    python -m benchmarks --latency 20 --output results.json
+    python -m benchmarks.memory
+"""
+import os
+from os.path import abspath, dirname
+from commonconf.backends import use_configparser_backend
+
+
+def configure():
+    """
+    Configures commonconf with the test settings, which use the mock
+    resources.
+    """
+    use_configparser_backend(abspath(os.path.join(
+        dirname(__file__), "..", "conf", "test.conf")), "SWS")
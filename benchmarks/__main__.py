@@ -0,0 +1,88 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from os.path import dirname
+from benchmarks import configure
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the SWS client against mock resources.")
+    parser.add_argument("-n", "--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="median injected latency per request, in ms")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", action="append", default=[],
+                        help="run only the named benchmark (repeatable)")
+    parser.add_argument("-o", "--output", default="benchmark-results.json",
+                        help="path of the json results file")
+    parser.add_argument("--compare", metavar="RESULTS",
+                        help="an earlier json results file to compare with")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure()
+
+    from benchmarks.cases import BENCHMARKS
+    from benchmarks.harness import compare, run_benchmark
+    from uw_sws.faults import FaultProfile, FaultRule, inject_faults, lognormal
+
+    rules = []
+    if args.latency > 0:
+        rules.append(FaultRule(r".", latency=lognormal(args.latency / 1000)))
+
+    results = []
+    with inject_faults(FaultProfile(rules, seed=args.seed)) as profile:
+        for benchmark in BENCHMARKS:
+            if args.only and benchmark.name not in args.only:
+                continue
+            result = run_benchmark(benchmark, args.iterations, args.warmup)
+            results.append(result)
+            print("{name:40} {throughput_per_second:>10}/s "
+                  "p50 {p50_ms:>9}ms p99 {p99_ms:>9}ms "
+                  "alloc {alloc_peak_bytes:>9}B "
+                  "rss {peak_rss_kb}KB".format(**result))
+        requests = profile.stats.get("requests", 0)
+
+    with open(os.path.join(dirname(__file__), "..", "uw_sws",
+                           "VERSION")) as f:
+        version = f.read().strip()
+
+    document = {
+        "version": version,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "latency_ms": args.latency,
+            "seed": args.seed,
+        },
+        "requests": requests,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(document, f, indent=2)
+    print("Wrote {}".format(args.output))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for name, metric, old, new, ratio in compare(results, baseline):
+            print("{:40} {:22} {:>12} -> {:>12} ({}x)".format(
+                name, metric, old, new, ratio))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+The benchmarked hot paths. Importing this module requires a configured
+commonconf backend.
+"""
+import json
+from datetime import date
+from benchmarks.harness import Benchmark
+from uw_sws import _fetch, get_resource
+from uw_sws.cache import MemoryCache, ResponseCache
+from uw_sws.encoder import encode_json
+from uw_sws.enrollment import enrollment_search_by_regid
+from uw_sws.models import Term
+from uw_sws.registration import (
+    get_active_registrations_by_section, get_schedule_by_regid_and_term)
+from uw_sws.section import (
+    get_changed_sections_by_term, get_section_by_label, _json_to_section)
+from uw_sws.serialization import dumps, loads
+from uw_sws.term import get_current_term
+from uw_sws.ttl import CacheRule, TTLPolicy
+from uw_sws.worker import Worker
+
+STUDENT_REGID = "9136CCB8F66711D5BE060004AC494FFE"
+PCE_REGID = "AABBCCDDEEFFAABBCCDDEEFFAABBCCDC"
+SECTION_URL = "/student/v5/course/2013,spring,MATH,125/H.json"
+TERM_URL = "/student/v5/term/2013,spring.json"
+
+
+class TermFetcher(Worker):
+    """
+    Fetches the same term resource once per task.
+    """
+    def __init__(self, count):
+        self.task_ids = [str(i) for i in range(count)]
+
+    def get_task_ids(self):
+        return self.task_ids
+
+    def task(self, tid):
+        return get_resource(TERM_URL)
+
+
+def _schedule(term):
+    return get_schedule_by_regid_and_term(STUDENT_REGID, term)
+
+
+def _registrations(section):
+    return get_active_registrations_by_section(
+        section, transcriptable_course="all", include_major_class_info=True)
+
+
+def _dashboard_sections():
+    """
+    An instructor dashboard's sections: the same section parsed 40 times,
+    each with its own instructor lookups.
+    """
+    data = get_resource(SECTION_URL)
+    term = Term(data=get_resource(TERM_URL))
+    return [_json_to_section(data, term) for i in range(40)]
+
+
+def _json_dumps(models):
+    if isinstance(models, list):
+        return json.dumps([model.json_data() for model in models]).encode()
+    return json.dumps(models.json_data()).encode()
+
+
+def _changed_sections(arg):
+    return get_changed_sections_by_term(
+        date(2013, 12, 1), Term(quarter="winter", year=2013))
+
+
+def _expiring_cache(max_stale):
+    """
+    Returns a cache that expires the term resource as soon as it is
+    cached.
+    """
+    return ResponseCache(MemoryCache(10), policy=TTLPolicy(
+        [CacheRule(r"/term/", 1e-6)]), max_stale=max_stale)
+
+
+def _cached_term(cache):
+    return cache.fetch(TERM_URL, lambda: _fetch(TERM_URL))
+
+
+BENCHMARKS = [
+    Benchmark("get_schedule_by_regid_and_term", _schedule,
+              setup=get_current_term),
+    Benchmark("serialization.dumps(schedule)", dumps,
+              setup=lambda: _schedule(get_current_term())),
+    Benchmark("serialization.loads(schedule)", loads,
+              setup=lambda: dumps(_schedule(get_current_term()))),
+    Benchmark("json.dumps(schedule.json_data())", _json_dumps,
+              setup=lambda: _schedule(get_current_term())),
+    Benchmark("encode_json(schedule)", encode_json,
+              setup=lambda: _schedule(get_current_term())),
+    Benchmark("json.dumps(40 sections' json_data())", _json_dumps,
+              setup=_dashboard_sections),
+    Benchmark("encode_json(40 sections)", encode_json,
+              setup=_dashboard_sections),
+    Benchmark("get_active_registrations_by_section", _registrations,
+              setup=lambda: get_section_by_label("2017,autumn,EDC&I,552/A")),
+    Benchmark("_json_to_section", _json_to_section,
+              setup=lambda: get_resource(SECTION_URL)),
+    Benchmark("Term(data=...)", lambda data: Term(data=data),
+              setup=lambda: get_resource(TERM_URL)),
+    Benchmark("enrollment_search_by_regid",
+              lambda arg: enrollment_search_by_regid(PCE_REGID)),
+    Benchmark("get_changed_sections_by_term", _changed_sections),
+    Benchmark("ResponseCache.fetch through expiry", _cached_term,
+              setup=lambda: _expiring_cache(0)),
+    Benchmark("ResponseCache.fetch through expiry, stale", _cached_term,
+              setup=lambda: _expiring_cache(60)),
+    Benchmark("Worker.run_tasks", lambda worker: worker.run_tasks(),
+              setup=lambda: TermFetcher(50)),
+]
@@ -0,0 +1,142 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures the resident memory held by the sections of a term crawl, with
+string interning off and on, and with shared terms (see uw_sws.intern).
+Each variant runs in its own process:
+
+    python -m benchmarks.crawl --term 2013,autumn -r 50 -o crawl.json
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+from os.path import dirname
+from benchmarks import configure
+
+COURSE_DIR = os.path.join(dirname(dirname(__file__)), "uw_sws", "resources",
+                          "sws", "file", "student", "v5", "course")
+
+VARIANTS = (
+    ("no interning", {}),
+    ("interned", {}),
+    ("interned, shared terms", {"RESTCLIENTS_SWS_SHARED_TERMS": True}),
+)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.crawl",
+        description="Measure the memory held by a crawl of a term's "
+                    "sections.")
+    parser.add_argument("--term", default="2013,autumn",
+                        help="year,quarter of the mock sections crawled")
+    parser.add_argument("-r", "--repeat", type=int, default=50,
+                        help="times the term's sections are crawled and held")
+    parser.add_argument("-o", "--output",
+                        help="path of a json results file")
+    parser.add_argument("--variant", type=int, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def section_urls(term):
+    """
+    Returns the urls of the mock section resources of the term.
+    """
+    prefix = term.replace(",", "_") + "_"
+    urls = []
+    for course in sorted(os.listdir(COURSE_DIR)):
+        path = os.path.join(COURSE_DIR, course)
+        if not (course.startswith(prefix) and os.path.isdir(path)):
+            continue
+        curriculum, number = course[len(prefix):].rsplit("_", 1)
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".json"):
+                urls.append("/student/v5/course/{},{},{}/{}".format(
+                    term, curriculum, number, name))
+    return urls
+
+
+def crawl(urls):
+    from restclients_core.exceptions import DataFailureException
+    from uw_sws.section import get_section_by_url
+
+    sections = []
+    for url in urls:
+        try:
+            sections.append(get_section_by_url(url))
+        except DataFailureException:
+            pass
+    return sections
+
+
+def measure(args):
+    """
+    Crawls the term repeat times in this process, with the variant's
+    settings, and returns the resident memory held by the sections.
+    """
+    from commonconf import override_settings
+    from benchmarks.harness import current_rss_kb
+    from uw_sws.intern import REGISTRY
+
+    name, settings = VARIANTS[args.variant]
+    if not args.variant:
+        REGISTRY.max_values = 0
+    urls = section_urls(args.term)
+
+    with override_settings(**settings):
+        # once, for the imports and the mock resource lookups
+        crawl(urls)
+        REGISTRY.clear()
+        gc.collect()
+        before = current_rss_kb()
+        start = time.perf_counter()
+        held = [crawl(urls) for i in range(args.repeat)]
+        seconds = time.perf_counter() - start
+        gc.collect()
+        after = current_rss_kb()
+
+    count = sum(len(sections) for sections in held)
+    return {
+        "name": name,
+        "sections": count,
+        "seconds": round(seconds, 3),
+        "rss_kb": after - before,
+        "bytes_per_section": (after - before) * 1024 // max(count, 1),
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure()
+
+    if args.variant is not None:
+        print(json.dumps(measure(args)))
+        return
+
+    results = []
+    for variant in range(len(VARIANTS)):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.crawl", "--term", args.term,
+             "-r", str(args.repeat), "--variant", str(variant)],
+            check=True, stdout=subprocess.PIPE, universal_newlines=True,
+            cwd=dirname(dirname(os.path.abspath(__file__)))).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        results.append(result)
+        print("{name:24} {sections:>6} sections {rss_kb:>8} KB RSS "
+              "{bytes_per_section:>7} bytes/section {seconds:>7} s".format(
+                  **result))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"term": args.term, "repeat": args.repeat,
+                       "results": results}, f, indent=2)
+        print("Wrote {}".format(args.output))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
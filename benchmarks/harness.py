@@ -0,0 +1,161 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Timing, allocation and memory measurement for benchmark cases.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+class Benchmark(object):
+    """
+    A named operation to measure. setup() is called once, untimed, and
+    its return value is passed to each call of func.
+    """
+    def __init__(self, name, func, setup=None):
+        self.name = name
+        self.func = func
+        self.setup = setup
+
+
+def percentile(values, pct):
+    """
+    Returns the pct percentile of values, by nearest rank.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1,
+                      int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def peak_rss_kb():
+    """
+    Returns the peak resident set size of this process in KB.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, KB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def current_rss_kb():
+    """
+    Returns the current resident set size of this process in KB, where
+    /proc is available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * resource.getpagesize() // 1024 if resource else None
+
+
+def run_benchmark(benchmark, iterations=100, warmup=5):
+    """
+    Returns a dict of measurements for the benchmark. Latencies are timed
+    without tracemalloc; allocations are measured in a separate pass.
+    """
+    arg = benchmark.setup() if benchmark.setup else None
+    for i in range(warmup):
+        benchmark.func(arg)
+
+    gc.collect()
+    latencies = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        call_start = time.perf_counter()
+        benchmark.func(arg)
+        latencies.append(time.perf_counter() - call_start)
+    total = time.perf_counter() - start
+
+    alloc_iterations = max(1, min(iterations, 20))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peak_bytes = 0
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            benchmark.func(arg)
+            peak_bytes = max(peak_bytes,
+                             tracemalloc.get_traced_memory()[1] - base)
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "name": benchmark.name,
+        "iterations": iterations,
+        "total_seconds": round(total, 6),
+        "throughput_per_second": round(iterations / total, 3)
+        if total else None,
+        "mean_ms": round(total / iterations * 1000, 4),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 4),
+        "alloc_peak_bytes": peak_bytes,
+        "alloc_retained_bytes_per_call": retained // alloc_iterations,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def measure_retained(build, count=1000):
+    """
+    Returns a dict of the time and the memory per object to build and
+    hold count objects returned by build().
+    """
+    build()
+    gc.collect()
+    start = time.perf_counter()
+    objects = [build() for i in range(count)]
+    seconds = time.perf_counter() - start
+    del objects
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [build() for i in range(count)]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del objects
+
+    return {
+        "count": count,
+        "us_per_object": round(seconds / count * 1e6, 2),
+        "bytes_per_object": retained // count,
+    }
+
+
+def compare(results, baseline):
+    """
+    Returns a list of (name, metric, baseline, current, ratio) for the
+    metrics shared by results and a baseline results document.
+    """
+    previous = {r["name"]: r for r in baseline.get("results", [])}
+    rows = []
+    for result in results:
+        base = previous.get(result["name"])
+        if base is None:
+            continue
+        for metric in ("throughput_per_second", "p50_ms", "p99_ms",
+                       "alloc_peak_bytes"):
+            old, new = base.get(metric), result.get(metric)
+            if old and new is not None:
+                rows.append((result["name"], metric, old, new,
+                             round(new / old, 3)))
+    return rows
@@ -0,0 +1,117 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares the memory and build time of the models with their lite and
+lazy variants (see uw_sws.lite), for objects held in bulk:
+
+    python -m benchmarks.memory -n 1000 -o memory.json
+"""
+import argparse
+import json
+import sys
+from benchmarks import configure
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.memory",
+        description="Measure the memory held by parsed SWS models.")
+    parser.add_argument("-n", "--count", type=int, default=1000,
+                        help="objects built and held per measurement")
+    parser.add_argument("-o", "--output",
+                        help="path of a json results file")
+    return parser.parse_args(argv)
+
+
+VARIANTS = (
+    ("", {}),
+    ("Lite", {"RESTCLIENTS_SWS_LITE_MODELS": True}),
+    ("Lazy", {"RESTCLIENTS_SWS_LAZY_MODELS": True}),
+)
+
+
+def cases():
+    """
+    Returns a list of (name, builder), with builder(settings) returning
+    a function that builds one object, reading a field or two from it,
+    with the given settings, or None if the settings change nothing.
+    """
+    from commonconf import override_settings
+    from uw_sws import get_resource
+    from uw_sws.lite import model_class
+    from uw_sws.models import Enrollment, Registration, Term
+    from uw_sws.section import _json_to_section
+    from benchmarks.cases import SECTION_URL, TERM_URL, PCE_REGID
+
+    term_data = get_resource(TERM_URL)
+    section_data = get_resource(SECTION_URL)
+    enrollment_data = get_resource(
+        "/student/v5/enrollment.json?reg_id={}&verbose=true"
+        "&transcriptable_course=all&changed_since_date=".format(
+            PCE_REGID))["Enrollments"][0]
+    reg_data = enrollment_data["Registrations"][0]
+    term = Term(data=term_data)
+
+    def section(settings):
+        if "RESTCLIENTS_SWS_LAZY_MODELS" in settings:
+            return None
+        settings = override_settings(**settings)
+        with settings:
+            # parse once, for the PWS lookups of the instructors
+            _json_to_section(section_data, term)
+
+        def build():
+            with settings:
+                return _json_to_section(section_data, term)
+        return build
+
+    def model(cls, data, field, **kwargs):
+        def builder(settings):
+            with override_settings(**settings):
+                built = model_class(cls)
+            if settings and built is cls:
+                return None
+
+            def build():
+                obj = built(data=data, **kwargs)
+                getattr(obj, field)
+                return obj
+            return build
+        return builder
+
+    return [
+        ("Term", model(Term, term_data, "quarter")),
+        ("Section", section),
+        ("Registration", model(Registration, reg_data, "grade")),
+        ("Enrollment", model(Enrollment, enrollment_data, "class_level",
+                             term=term)),
+    ]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure()
+
+    from benchmarks.harness import measure_retained
+
+    results = []
+    for name, builder in cases():
+        for prefix, settings in VARIANTS:
+            build = builder(settings)
+            if build is None:
+                continue
+            result = measure_retained(build, args.count)
+            result["name"] = prefix + name
+            results.append(result)
+            print("{name:16} {bytes_per_object:>9} bytes/object "
+                  "{us_per_object:>9} us/object".format(**result))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"count": args.count, "results": results}, f, indent=2)
+        print("Wrote {}".format(args.output))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures the SWS requests and time of worker processes reading the same
+sections, with a cache per process, a SQLite store, and a shared memory
+store (see uw_sws.sharedcache), as the workers of one host would:
+
+    python -m benchmarks.shared -w 16 --latency 20 -o shared.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from tempfile import TemporaryDirectory
+from benchmarks import configure
+from benchmarks.crawl import section_urls
+
+VARIANTS = (
+    ("memory per process", {
+        "RESTCLIENTS_SWS_CACHE_MEMORY_SIZE": 1000}),
+    ("sqlite store", {
+        "RESTCLIENTS_SWS_CACHE_STORE": "sqlite"}),
+    ("shared memory store", {
+        "RESTCLIENTS_SWS_CACHE_STORE": "shared"}),
+    ("shared memory store + memory", {
+        "RESTCLIENTS_SWS_CACHE_MEMORY_SIZE": 1000,
+        "RESTCLIENTS_SWS_CACHE_STORE": "shared"}),
+)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.shared",
+        description="Measure a response cache shared by worker processes.")
+    parser.add_argument("-w", "--workers", type=int, default=8,
+                        help="worker processes")
+    parser.add_argument("-r", "--rounds", type=int, default=3,
+                        help="times each worker reads the sections")
+    parser.add_argument("--latency", type=float, default=20.0,
+                        help="median injected latency per request, in ms")
+    parser.add_argument("--term", default="2013,autumn",
+                        help="year,quarter of the mock sections read")
+    parser.add_argument("-o", "--output",
+                        help="path of a json results file")
+    return parser.parse_args(argv)
+
+
+def work(worker, settings, urls, args, barrier, results):
+    """
+    Reads the urls, in an order of its own, rounds times in this worker
+    process, and puts its request count, seconds and RSS on results.
+    """
+    from commonconf import override_settings
+    from restclients_core.exceptions import DataFailureException
+    from benchmarks.harness import current_rss_kb
+    from uw_sws import get_resource
+    from uw_sws.faults import FaultProfile, FaultRule, inject_faults, lognormal
+
+    urls = list(urls)
+    random.Random(worker).shuffle(urls)
+    rules = [FaultRule(r".", latency=lognormal(args.latency / 1000))]
+    # override_settings replaces the settings of inject_faults
+    with inject_faults(FaultProfile(rules, seed=worker)) as profile, \
+            override_settings(
+                RESTCLIENTS_SWS_DAO_CLASS="uw_sws.faults.FaultInjectingDAO",
+                **settings):
+        barrier.wait()
+        start = time.perf_counter()
+        for round in range(args.rounds):
+            for url in urls:
+                try:
+                    get_resource(url)
+                except DataFailureException:
+                    pass
+        seconds = time.perf_counter() - start
+        results.put({"requests": profile.stats.get("requests", 0),
+                     "seconds": seconds, "rss_kb": current_rss_kb()})
+
+
+def measure(name, settings, urls, args):
+    context = multiprocessing.get_context("fork")
+    barrier = context.Barrier(args.workers + 1)
+    results = context.Queue()
+    with TemporaryDirectory() as directory:
+        settings = dict(settings)
+        if "RESTCLIENTS_SWS_CACHE_STORE" in settings:
+            settings["RESTCLIENTS_SWS_CACHE_PATH"] = os.path.join(
+                directory, "sws.cache")
+        workers = [context.Process(target=work, args=(
+            worker, settings, urls, args, barrier, results))
+            for worker in range(args.workers)]
+        for process in workers:
+            process.start()
+        barrier.wait()
+        start = time.perf_counter()
+        reports = [results.get() for process in workers]
+        seconds = time.perf_counter() - start
+        for process in workers:
+            process.join()
+
+    return {
+        "name": name,
+        "workers": args.workers,
+        "reads": args.workers * args.rounds * len(urls),
+        "requests": sum(report["requests"] for report in reports),
+        "seconds": round(seconds, 3),
+        "worker_seconds_max": round(
+            max(report["seconds"] for report in reports), 3),
+        "worker_rss_kb": sum(report["rss_kb"] for report in reports) //
+        len(reports),
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    configure()
+
+    urls = section_urls(args.term) + [
+        "/student/v5/term/{}.json".format(args.term)]
+    results = []
+    for name, settings in VARIANTS:
+        result = measure(name, settings, urls, args)
+        results.append(result)
+        print("{name:30} {workers:>3} workers {reads:>7} reads "
+              "{requests:>6} SWS requests {seconds:>8} s "
+              "{worker_rss_kb:>8} KB RSS/worker".format(**result))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"term": args.term, "rounds": args.rounds,
+                       "latency_ms": args.latency, "results": results},
+                      f, indent=2)
+        print("Wrote {}".format(args.output))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,14 +2,24 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+from time import perf_counter
 from urllib.parse import quote
 from restclients_core.exceptions import DataFailureException
 from uw_pws import PWS
 from uw_sws.dao import SWS_DAO, SWS_TIMEZONE, sws_now
+from uw_sws.cache import get_cache
+from uw_sws.deadline import check_deadline
+from uw_sws import metrics, tracing
+from uw_sws.etag import ETagCache
+from uw_sws.nplusone import check_request
+from uw_sws.ratelimit import get_limiter
+from uw_sws.retry import load_with_retries
+from uw_sws.util import iter_json_array
 
 QUARTER_SEQ = ["winter", "spring", "summer", "autumn"]
 DAO = SWS_DAO()
 UWPWS = PWS()
+ETAGS = ETagCache()
 
 
 def use_v5_resources():
@@ -26,30 +36,168 @@ def get_resource(url):
     and return a response in json format.
     :returns: http response with content in json
     """
-    response = DAO.getURL(url, {'Accept': 'application/json',
-                                'Connection': 'keep-alive'})
+    return _decode("GET", url, _get_response(url))
+
+
+def get_resource_with_etag(url):
+    """
+    Issue a GET request to SWS with the given url and return a tuple of
+    the response in json format and its ETag header value.
+    """
+    response = _get_response(url)
+    return _decode("GET", url, response), response.headers.get('ETag')
+
+
+def get_resource_items(url, key):
+    """
+    Issue a GET request to SWS with the given url and return an iterator
+    over the elements of the named top-level array in the json response,
+    decoded incrementally.
+    """
+    return iter_json_array(_get_response(url).data, key)
+
+
+def _get_response(url):
+    check_request(DAO, url)
+    cache = get_cache(DAO)
+    if cache is not None:
+        return cache.fetch(url, lambda: _fetch(url))
+    return _fetch(url)
+
+
+def _fetch(url):
+    response = _load("GET", url, {'Accept': 'application/json',
+                                  'Connection': 'keep-alive'})
     if response.status != 200:
         raise DataFailureException(url, response.status, response.data)
-    return json.loads(response.data)
+    ETAGS.set(url, _get_etag(response))
+    return response
+
+
+def _load(method, url, headers, body=None):
+    """
+    Issue a request through the DAO, with the configured retries and
+    circuit breaker.
+    """
+    return load_with_retries(
+        DAO, method, url, lambda: _load_once(method, url, headers, body))
+
+
+def _load_once(method, url, headers, body=None):
+    """
+    Issue a request through the DAO once the rate limiter allows it,
+    unless the current deadline has passed, reporting it to the metrics
+    sink and trace collector.
+    """
+    check_deadline(url)
+    limiter = get_limiter(DAO)
+    if limiter is not None:
+        limiter.acquire()
+        check_deadline(url)
+
+    sink = metrics._sink
+    if sink is None:
+        return _dao_request(method, url, headers, body)
+
+    start = perf_counter()
+    try:
+        response = _dao_request(method, url, headers, body)
+    except Exception:
+        sink.request(method, metrics.url_template(url), 0,
+                     perf_counter() - start, 0)
+        raise
+    sink.request(method, metrics.url_template(url), response.status,
+                 perf_counter() - start, metrics.response_size(response))
+    return response
+
+
+def _dao_request(method, url, headers, body):
+    if tracing._collector is None:
+        return _send(method, url, headers, body)
+
+    with tracing.span("http {}".format(method), url=url) as request_span:
+        response = _send(method, url, headers, body)
+        if request_span is not None:
+            request_span.set_attribute("status", response.status)
+            request_span.set_attribute(
+                "bytes", metrics.response_size(response))
+        return response
+
+
+def _send(method, url, headers, body):
+    if method == "PUT":
+        return DAO.putURL(url, headers, body)
+    return DAO.getURL(url, headers)
 
 
-def put_resource(url, headers={}, body={}):
+def _decode(method, url, response):
+    sink = metrics._sink
+    if sink is None and tracing._collector is None:
+        return json.loads(response.data)
+
+    start = perf_counter()
+    with tracing.span("json decode", url=url):
+        data = json.loads(response.data)
+    if sink is not None:
+        sink.decode(method, metrics.url_template(url),
+                    perf_counter() - start)
+    return data
+
+
+def _get_etag(response):
+    return response.headers.get('ETag') if response.headers else None
+
+
+def put_resource(url, headers=None, body=None, etag=None, optimistic=None):
     """
     Issue a GET request to SWS with the given url in order to obtain
     an ETag header, followed by a PUT request to the same url. Returns
-    a response in json format.
+    a response in json format. If an etag is passed, the GET request
+    is skipped and the etag is sent as the If-Match header.
+    In optimistic mode (the OPTIMISTIC_PUT setting), the ETag from an
+    earlier GET of the url is used instead, and the GET is only issued
+    if SWS rejects that ETag with 412 Precondition Failed.
     :returns: http response with content in json
     """
-    response = DAO.getURL(url, {'Accept': 'application/json'})
+    if optimistic is None:
+        optimistic = DAO.get_service_setting("OPTIMISTIC_PUT", False)
+
+    if etag is None and optimistic:
+        cached_etag = ETAGS.get(url)
+        if cached_etag is not None:
+            response = _put_response(url, headers, body, cached_etag)
+            if response.status != 412:
+                ETAGS.record_preflight_avoided()
+                return _put_result(url, response)
+            ETAGS.record_precondition_failure()
+            ETAGS.discard(url)
+    elif etag is not None:
+        response = _put_response(url, headers, body, etag)
+        if response.status != 412:
+            ETAGS.record_preflight_avoided()
+        else:
+            ETAGS.record_precondition_failure()
+        return _put_result(url, response)
+
+    # bypasses the response cache, which may hold the rejected ETag
+    etag = _get_etag(_fetch(url)) or '*'
+    return _put_result(url, _put_response(url, headers, body, etag))
 
-    if response.status != 200:
-        raise DataFailureException(url, response.status, response.data)
 
-    headers['If-Match'] = response.headers.get('ETag', '*')
+def _put_response(url, headers, body, etag):
+    headers = dict(headers or {})
+    headers['If-Match'] = etag
     headers['Content-Type'] = 'application/json; charset=utf-8'
+    return _load("PUT", url, headers,
+                 json.dumps({} if body is None else body))
 
-    response = DAO.putURL(url, headers, json.dumps(body))
 
+def _put_result(url, response):
+    cache = get_cache(DAO)
+    if cache is not None:
+        cache.delete(url)
     if response.status != 200:
+        ETAGS.discard(url)
         raise DataFailureException(url, response.status, response.data)
-    return json.loads(response.data)
+    ETAGS.set(url, _get_etag(response))
+    return _decode("PUT", url, response)
@@ -0,0 +1,402 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+A two-tier cache of SWS GET responses: an in-memory LRU over an
+optional store shared by processes: a SQLite file kept across restarts,
+or a memory-mapped file (see uw_sws.sharedcache) through which the
+processes of a host share each response one of them fetches.
+
+Responses are cached for the ttl chosen by a TTLPolicy (see uw_sws.ttl)
+from the url's endpoint and, for sections and registrations, the
+calendar of their term. Other endpoints are not cached. On creation,
+the memory tier is warmed from the persisted entries.
+
+ResponseCache.fetch() serves a response expired for no longer than
+max_stale seconds at once, while a single background thread refreshes
+it, so that the expiry of a hot url does not stall its callers; and,
+with lock, concurrent misses for a url wait for one request instead of
+each making their own.
+
+Settings:
+    CACHE_MEMORY_SIZE: responses held in memory; 0 (the default) and no
+        CACHE_PATH disable the cache
+    CACHE_PATH: the store file, holding the responses of rules that
+        persist them
+    CACHE_STORE: "sqlite" (the default) or "shared", for a memory-mapped
+        store
+    CACHE_SHARED_SIZE: bytes of a shared store, defaults to 64 MB
+    CACHE_WARM_START: load the persisted responses into memory on start,
+        defaults to True
+    CACHE_RULES: a list of [endpoint pattern, ttl seconds or None for no
+        expiry, persist], matched before the default rules of the policy
+    CACHE_MAX_STALE: seconds an expired response may be served while it
+        is refreshed, defaults to 60; 0 disables stale responses
+    CACHE_LOCK: make concurrent misses for a url wait for one request,
+        defaults to True
+"""
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock, Thread
+from restclients_core.models import CacheHTTP
+from uw_sws.sharedcache import DEFAULT_SIZE, SharedMemoryStore
+from uw_sws.ttl import DEFAULT_RULES, CacheRule, TTLPolicy
+
+DEFAULT_MEMORY_SIZE = 1000
+DEFAULT_MAX_STALE = 60
+STORE_SQLITE = "sqlite"
+STORE_SHARED = "shared"
+
+logger = logging.getLogger(__name__)
+
+# {(memory size, path, warm start, rules, max stale, lock, store,
+#   shared size): ResponseCache}
+_caches = {}
+_caches_lock = Lock()
+
+
+class MemoryCache(object):
+    """
+    A bounded, thread-safe LRU map of url to (data, etag, expires).
+    """
+    def __init__(self, max_size=DEFAULT_MEMORY_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url, entry):
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, url):
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteStore(object):
+    """
+    Entries persisted in a SQLite file. Each process opens its own
+    connection, so the store can be shared by forked workers.
+    """
+    SCHEMA = ("CREATE TABLE IF NOT EXISTS responses ("
+              "url TEXT PRIMARY KEY, data BLOB, etag TEXT, "
+              "stored REAL, expires REAL)")
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = Lock()
+        self._connection = None
+        self._pid = None
+
+    def _connect(self):
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, timeout=10, check_same_thread=False,
+                isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(self.SCHEMA)
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, url):
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT data, etag, expires FROM responses WHERE url = ?",
+                (url,)).fetchone()
+        return tuple(row) if row is not None else None
+
+    def set(self, url, entry):
+        data, etag, expires = entry
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (url, data, etag, time.time(), expires))
+
+    def delete(self, url):
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM responses WHERE url = ?", (url,))
+
+    def items(self, limit, now=None):
+        """
+        Returns up to limit (url, entry) pairs of unexpired entries, the
+        most recently stored first.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT url, data, etag, expires FROM responses "
+                "WHERE expires IS NULL OR expires > ? "
+                "ORDER BY stored DESC LIMIT ?", (now, limit)).fetchall()
+        return [(row[0], tuple(row[1:])) for row in rows]
+
+    def purge(self, now=None):
+        """
+        Deletes the expired entries.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM responses WHERE expires <= ?", (now,))
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+
+
+class ResponseCache(object):
+    """
+    The memory tier over an optional persistent store, caching the
+    responses of urls for the ttls of policy.
+    """
+    def __init__(self, memory=None, store=None, policy=None,
+                 max_stale=DEFAULT_MAX_STALE, lock=True):
+        self.memory = memory if memory is not None else MemoryCache()
+        self.store = store
+        self.policy = policy if policy is not None else TTLPolicy()
+        self.max_stale = max_stale
+        self.lock = lock
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._lock = Lock()
+        self._loads = {}
+        self._refreshing = set()
+
+    def _entry(self, url, now):
+        """
+        Returns the entry of url, unless it expired more than max_stale
+        seconds ago. The store is read when memory has no fresh entry,
+        as another process may have stored a fresher one.
+        """
+        oldest = now - self.max_stale
+        entry = self.memory.get(url)
+        if self.store is not None and (entry is None or
+                                       not _fresh(entry, now)):
+            stored = self.store.get(url)
+            if (stored is not None and _fresh(stored, oldest) and
+                    _fresher(stored, entry)):
+                self.policy.observe(url, stored[0])
+                self.memory.set(url, stored)
+                entry = stored
+        if entry is None or not _fresh(entry, oldest):
+            return None
+        return entry
+
+    def get(self, url, now=None):
+        """
+        Returns the unexpired cached response for url, or None.
+        """
+        now = time.time() if now is None else now
+        entry = self._entry(url, now)
+        if entry is None or not _fresh(entry, now):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _response(entry)
+
+    def fetch(self, url, load, now=None):
+        """
+        Returns the cached response for url, or else caches and returns
+        the response of load(). A stale response is returned while load()
+        refreshes it in the background.
+        """
+        now = time.time() if now is None else now
+        entry = self._entry(url, now)
+        if entry is not None:
+            if _fresh(entry, now):
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+                self._refresh(url, load)
+            return _response(entry)
+
+        if not self.lock:
+            self.misses += 1
+            return self._load(url, load)
+        with self._url_lock(url):
+            # loaded by another thread while this one waited
+            entry = self._entry(url, now)
+            if entry is not None and _fresh(entry, now):
+                self.hits += 1
+                return _response(entry)
+            self.misses += 1
+            return self._load(url, load)
+
+    def _load(self, url, load):
+        response = load()
+        self.set(url, response)
+        return response
+
+    @contextmanager
+    def _url_lock(self, url):
+        with self._lock:
+            lock = self._loads.get(url)
+            if lock is None:
+                lock = self._loads[url] = [Lock(), 0]
+            lock[1] += 1
+        try:
+            with lock[0]:
+                yield
+        finally:
+            with self._lock:
+                lock[1] -= 1
+                if lock[1] == 0:
+                    del self._loads[url]
+
+    def _refresh(self, url, load):
+        with self._lock:
+            if url in self._refreshing:
+                return
+            self._refreshing.add(url)
+        Thread(target=self._run_refresh, args=(url, load),
+               daemon=True).start()
+
+    def _run_refresh(self, url, load):
+        try:
+            self._load(url, load)
+            self.refreshes += 1
+        except Exception as ex:
+            logger.warning("Refreshing {} failed: {}".format(url, ex))
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+
+    def set(self, url, response, now=None):
+        """
+        Caches the response for url, if the policy allows it.
+        """
+        data = response.data
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.policy.observe(url, data)
+        ttl, persist = self.policy.get(url)
+        if ttl == 0:
+            return
+        now = time.time() if now is None else now
+        entry = (data, _header(response, "ETag"),
+                 None if ttl is None else now + ttl)
+        self.memory.set(url, entry)
+        if persist and self.store is not None:
+            self.store.set(url, entry)
+
+    def delete(self, url):
+        self.memory.delete(url)
+        if self.store is not None:
+            self.store.delete(url)
+
+    def warm(self, limit=None):
+        """
+        Loads up to limit persisted responses, by default as many as the
+        memory tier holds, into memory. Returns the number loaded.
+        """
+        if self.store is None:
+            return 0
+        entries = self.store.items(limit or self.memory.max_size)
+        # least recent first, so the most recent are kept longest
+        for url, entry in reversed(entries):
+            self.policy.observe(url, entry[0])
+            self.memory.set(url, entry)
+        return len(entries)
+
+    def clear(self):
+        self.memory.clear()
+        if self.store is not None:
+            self.store.clear()
+
+
+def _fresh(entry, now):
+    return entry[2] is None or entry[2] > now
+
+
+def _fresher(entry, other):
+    """
+    Returns True if entry expires after other, which may be None.
+    """
+    if other is None or entry[2] is None:
+        return True
+    return other[2] is not None and entry[2] > other[2]
+
+
+def _header(response, name):
+    headers = getattr(response, "headers", None) or {}
+    return headers.get(name)
+
+
+def _response(entry):
+    response = CacheHTTP()
+    response.status = 200
+    response.data = entry[0]
+    response.headers = {"ETag": entry[1]} if entry[1] else {}
+    return response
+
+
+def _rules(settings):
+    rules = [CacheRule(pattern, ttl, bool(persist))
+             for pattern, ttl, persist in settings or ()]
+    return tuple(rules) + DEFAULT_RULES
+
+
+def _store(path, kind, size):
+    if not path:
+        return None
+    if kind == STORE_SHARED:
+        return SharedMemoryStore(path, size)
+    if kind == STORE_SQLITE:
+        return SQLiteStore(path)
+    raise ValueError("Unknown CACHE_STORE {}".format(kind))
+
+
+def get_cache(dao):
+    """
+    Returns the ResponseCache configured for the dao, or None if
+    responses are not cached.
+    """
+    size = int(dao.get_service_setting("CACHE_MEMORY_SIZE", 0) or 0)
+    path = dao.get_service_setting("CACHE_PATH")
+    if size <= 0 and not path:
+        return None
+
+    rules = dao.get_service_setting("CACHE_RULES")
+    key = (size, path, bool(dao.get_service_setting("CACHE_WARM_START", True)),
+           repr(rules),
+           int(dao.get_service_setting("CACHE_MAX_STALE", DEFAULT_MAX_STALE)),
+           bool(dao.get_service_setting("CACHE_LOCK", True)),
+           dao.get_service_setting("CACHE_STORE", STORE_SQLITE),
+           int(dao.get_service_setting("CACHE_SHARED_SIZE", DEFAULT_SIZE)))
+    cache = _caches.get(key)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(key)
+            if cache is None:
+                cache = ResponseCache(
+                    MemoryCache(size), _store(path, key[6], key[7]),
+                    TTLPolicy(_rules(rules)), key[4], key[5])
+                if key[2]:
+                    cache.warm()
+                _caches[key] = cache
+    return cache
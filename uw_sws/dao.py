@@ -10,10 +10,18 @@ import re
 from zoneinfo import ZoneInfo
 from datetime import datetime, timedelta, timezone
 from os.path import abspath, dirname
+from threading import Lock
+from urllib.parse import unquote
 from restclients_core.dao import DAO, MockDAO
+from restclients_core.exceptions import DataFailureException
+from restclients_core.models import MockHTTP
+from restclients_core.util.mock import convert_to_platform_safe
 
 SWS_TIMEZONE = ZoneInfo('America/Los_Angeles')
 
+# {url: (date, original data, edited data)} for the date-relative mock edits
+_mock_edits = {}
+
 
 def sws_now():
     """
@@ -31,6 +39,17 @@ class SWS_DAO(DAO):
     def service_mock_paths(self):
         return [abspath(os.path.join(dirname(__file__), "resources"))]
 
+    def get_implementation(self):
+        implementation = super(SWS_DAO, self).get_implementation()
+
+        record_path = self.get_service_setting("RECORD_PATH")
+        if record_path:
+            from uw_sws.recording import (
+                RecordingImplementation, get_recorder)
+            return RecordingImplementation(
+                implementation, get_recorder(record_path))
+        return implementation
+
     def _custom_headers(self, method, url, headers, body):
         custom_headers = {}
 
@@ -57,31 +76,54 @@ class SWS_DAO(DAO):
 
         if ("/student/v5/notice" in url and
                 response.status == 200):
-            self._make_notice_date(response)
+            self._make_notice_date(url, response)
 
         # This is to enable mock data grading.
-        if (re.match(r'/student/v\d/term/current.json', url) or
+        if response.status == 200 and (
+                re.match(r'/student/v\d/term/current.json', url) or
                 re.match(r'/student/v\d/term/2013,spring.json', url)):
-            now = sws_now()
-            tomorrow = now + timedelta(days=1)
-            yesterday = now - timedelta(days=1)
-            json_data = json.loads(response.data)
-
-            json_data["GradeSubmissionDeadline"] =\
-                tomorrow.strftime("%Y-%m-%dT17:00:00")
-            json_data["GradingPeriodClose"] =\
-                tomorrow.strftime("%Y-%m-%dT17:00:00")
-            json_data["GradingPeriodOpen"] =\
-                yesterday.strftime("%Y-%m-%dT17:00:00")
-            json_data["GradingPeriodOpenATerm"] =\
-                yesterday.strftime("%Y-%m-%dT17:00:00")
-
-            response.data = json.dumps(json_data)
-
-    def _make_notice_date(self, response):
+            response.data = self._edited_mock_data(
+                url, response.data, self._set_grading_period)
+
+    def _edited_mock_data(self, url, data, edit):
+        """
+        Returns edit(data), reusing the previous result for the url while
+        the date and the original data are unchanged.
+        """
+        today = sws_now().date()
+        cached = _mock_edits.get(url)
+        if cached is not None and cached[0] == today and cached[1] == data:
+            return cached[2]
+
+        edited = edit(data)
+        _mock_edits[url] = (today, data, edited)
+        return edited
+
+    def _set_grading_period(self, data):
+        now = sws_now()
+        tomorrow = now + timedelta(days=1)
+        yesterday = now - timedelta(days=1)
+        json_data = json.loads(data)
+
+        json_data["GradeSubmissionDeadline"] =\
+            tomorrow.strftime("%Y-%m-%dT17:00:00")
+        json_data["GradingPeriodClose"] =\
+            tomorrow.strftime("%Y-%m-%dT17:00:00")
+        json_data["GradingPeriodOpen"] =\
+            yesterday.strftime("%Y-%m-%dT17:00:00")
+        json_data["GradingPeriodOpenATerm"] =\
+            yesterday.strftime("%Y-%m-%dT17:00:00")
+
+        return json.dumps(json_data)
+
+    def _make_notice_date(self, url, response):
         """
         Set the date attribte value in the notice mock data
         """
+        response.data = self._edited_mock_data(
+            url, response.data, self._set_notice_dates)
+
+    def _set_notice_dates(self, data):
         today = sws_now().date()
         yesterday = today - timedelta(days=1)
         tomorrow = today + timedelta(days=1)
@@ -90,7 +132,7 @@ class SWS_DAO(DAO):
         future = today + timedelta(weeks=3)
         future_end = today + timedelta(weeks=5)
 
-        json_data = json.loads(response.data)
+        json_data = json.loads(data)
         for notice in json_data["Notices"]:
             if notice["NoticeAttributes"] and\
                     len(notice["NoticeAttributes"]) > 0:
@@ -113,7 +155,141 @@ class SWS_DAO(DAO):
                         else:
                             pass   # use original
 
-        response.data = json.dumps(json_data)
+        return json.dumps(json_data)
+
+
+class MockResourceIndex(object):
+    """
+    An in-memory copy of a mock resource directory, read once per process.
+    """
+    _indexes = {}
+    _lock = Lock()
+
+    def __init__(self, root):
+        self.files = {}  # {"/student/v5/campus.json": b"..."}
+        self.dirs = {}   # {"/student/v5/": ["campus.json", ...]}
+        for dir_path, dir_names, file_names in os.walk(root):
+            rel_dir = dir_path[len(root):].replace(os.sep, "/") + "/"
+            self.dirs[rel_dir] = file_names
+            for name in file_names:
+                with open(os.path.join(dir_path, name), "rb") as handle:
+                    self.files[rel_dir + name] = handle.read()
+
+    @classmethod
+    def get(cls, root):
+        with cls._lock:
+            if root not in cls._indexes:
+                cls._indexes[root] = cls(root) if (
+                    os.path.isdir(root)) else None
+            return cls._indexes[root]
+
+    def find(self, path):
+        """
+        Mirrors the candidate file names of restclients_core's open_file.
+        """
+        unquoted = unquote(path)
+        for candidate in (convert_to_platform_safe(path), path,
+                          convert_to_platform_safe(unquoted), unquoted):
+            for name in (candidate, "{}/index.html".format(candidate)):
+                name = re.sub(r'/{2,}', '/', name)
+                if name in self.files:
+                    return self.files[name]
+
+    def find_query_permutation(self, url, is_header_file):
+        """
+        Mirrors restclients_core's attempt_open_query_permutations.
+        """
+        directory = dirname(convert_to_platform_safe(url)) + "/"
+        filenames = self.dirs.get(directory)
+        if filenames is None:
+            return None
+
+        orig_path = url + ".http-headers" if is_header_file else url
+        orig_len = len(unquote(orig_path)) - len(unquote(directory))
+        filenames = [f for f in filenames
+                     if (".http-headers" in f) == is_header_file and
+                     len(unquote(f)) == orig_len]
+
+        base, params = url.split("/")[-1].split("?")[0:2]
+        filenames = [f for f in filenames if f.startswith(base)]
+        for param in params.split("&"):
+            param = convert_to_platform_safe(unquote(param))
+            filenames = [f for f in filenames if param in f]
+
+        if len(filenames) == 1:
+            return self.find(directory + filenames[0])
+
+        if len(filenames) > 1:
+            raise DataFailureException(url,
+                                       "Multiple mock data files matched " +
+                                       "the parameters provided!",
+                                       404)
+
+
+class IndexedMockDAO(MockDAO):
+    """
+    A drop-in replacement for the file based MockDAO that indexes the mock
+    resource directories once per process and serves them from memory.
+    Enable with RESTCLIENTS_SWS_DAO_CLASS='uw_sws.dao.IndexedMockDAO'
+    """
+    def load(self, method, url, headers, body):
+        for path in self._get_mock_paths():
+            index = MockResourceIndex.get(
+                os.path.join(path, self._service_name, "file"))
+            if index is not None:
+                response = self._load_from_index(index, url)
+                if response.status != 404:
+                    return response
+
+        response = MockHTTP()
+        response.status = 404
+        response.reason = "Not Found"
+        return response
+
+    def _load_from_index(self, index, url):
+        response = MockHTTP()
+        response.status = 404
+        response.headers = None
+
+        data = index.find(url)
+        if data is not None:
+            response.status = 200
+            response.data = data
+
+        header_data = index.find(url + ".http-headers")
+        if header_data is not None:
+            self._read_header(header_data, response)
+
+        if "?" in url:
+            data = index.find_query_permutation(url, False)
+            if data is not None and response.status == 404:
+                response.status = 200
+                response.data = data
+
+            header_data = index.find_query_permutation(url, True)
+            if header_data is not None and response.headers is None:
+                self._read_header(header_data, response)
+
+        return response
+
+    def _read_header(self, header_data, response):
+        try:
+            file_values = json.loads(header_data)
+        except UnicodeDecodeError:
+            return
+
+        if response.headers is None:
+            response.headers = {
+                "X-Data-Source": self._service_name + " file mock data",
+            }
+
+        if "headers" in file_values:
+            response.headers.update(file_values['headers'])
+
+            if 'status' in file_values:
+                response.status = file_values['status']
+        else:
+            response.headers.update(file_values)
 
 
 # For testing MUWM-2411
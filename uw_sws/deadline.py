@@ -0,0 +1,88 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Deadlines for fan-out operations. A deadline set with deadline_scope()
+applies to every SWS request made in the block, including those from
+the threads it fans out to: once it expires, or is cancelled after a
+fatal error, requests not yet sent raise DeadlineExceeded instead.
+Requests already in flight are bounded by the DAO's own timeout.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from uw_sws.exceptions import DeadlineExceeded
+
+_deadline = ContextVar("uw_sws_deadline", default=None)
+
+
+class Deadline(object):
+    """
+    An expiry time, within any enclosing deadline, that can also be
+    cancelled early.
+    """
+    def __init__(self, timeout=None, parent=None):
+        self.parent = parent
+        self.expires_at = (None if timeout is None
+                           else time.monotonic() + float(timeout))
+        if parent is not None and parent.expires_at is not None and (
+                self.expires_at is None or
+                parent.expires_at < self.expires_at):
+            self.expires_at = parent.expires_at
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Stops the remaining work under this deadline.
+        """
+        self.cancelled = True
+
+    def remaining(self):
+        """
+        Returns the seconds left, or None if there is no expiry time.
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        if self.cancelled or (
+                self.parent is not None and self.parent.expired()):
+            return True
+        return self.expires_at is not None and self.remaining() <= 0
+
+    def check(self, url=None):
+        """
+        Raises DeadlineExceeded if the deadline has passed or the work
+        has been cancelled.
+        """
+        if self.expired():
+            raise DeadlineExceeded(url, "cancelled" if self.cancelled
+                                   else "deadline exceeded")
+
+
+def current_deadline():
+    return _deadline.get()
+
+
+@contextmanager
+def deadline_scope(timeout=None):
+    """
+    Runs the block under a new Deadline of timeout seconds, or under no
+    further expiry time if timeout is None. Yields the Deadline.
+    """
+    deadline = Deadline(timeout, _deadline.get())
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def check_deadline(url=None):
+    """
+    Raises DeadlineExceeded if the current deadline has passed.
+    """
+    deadline = _deadline.get()
+    if deadline is not None:
+        deadline.check(url)
@@ -0,0 +1,138 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Writes the json_data() of class schedules and sections, and lists of
+them, as json bytes, without building the whole json_data() tree first.
+
+Blocks repeated across sections are encoded once per ModelEncoder: each
+term, and each instructor (by uwregid, uwnetid and display name, as the
+instructors of one response are the same PWS people). Sections and
+meetings are read through lite copies (see uw_sws.lite), and their
+scalar fields written with the json module's C encoder, with their
+sub-trees spliced in. iter_encode() yields the bytes a section at a
+time, so that a response can be streamed.
+"""
+import json
+from datetime import date
+from uw_sws.lite import lite_copy
+from uw_sws.models import ClassSchedule, Section, Term, _model_type
+
+
+def _default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError("Object of type {} is not JSON serializable".format(
+        type(value).__name__))
+
+
+_encode = json.JSONEncoder(default=_default).encode
+
+
+class ModelEncoder(object):
+    """
+    Encodes models as json bytes equal to json.dumps(model.json_data()).
+    An encoder memoizes the blocks it has written, so only reuse one
+    while the models it encoded are unchanged (typically, for one
+    response).
+    """
+    def __init__(self):
+        self._terms = {}
+        self._instructors = {}
+
+    def encode(self, obj):
+        """
+        Returns the json bytes of obj: a model, or a list or tuple of
+        models.
+        """
+        return b"".join(self.iter_encode(obj))
+
+    def iter_encode(self, obj):
+        """
+        Yields the json bytes of obj in chunks.
+        """
+        if isinstance(obj, (list, tuple)):
+            yield b"["
+            for index, item in enumerate(obj):
+                if index:
+                    yield b", "
+                yield from self.iter_encode(item)
+            yield b"]"
+            return
+
+        model = _model_type(obj)
+        if model is ClassSchedule:
+            yield from self._schedule(obj)
+        elif model is Section:
+            yield self._section(obj)
+        elif model is Term:
+            yield self._term(obj)
+        else:
+            yield _encode(obj.json_data()).encode()
+
+    def _schedule(self, schedule):
+        yield _encode({
+            'year': schedule.term.year,
+            'quarter': schedule.term.quarter,
+        })[:-1].encode()
+        yield b', "term": ' + self._term(schedule.term)
+        yield b', "sections": ['
+        for index, section in enumerate(schedule.sections):
+            if index:
+                yield b", "
+            yield self._section(section)
+        tail = {'registered_summer_terms': schedule.registered_summer_terms}
+        if schedule.failed_sections:
+            tail['failed_sections'] = [
+                failure.json_data() for failure in schedule.failed_sections]
+        yield b"], " + _encode(tail)[1:].encode()
+
+    def _section(self, section):
+        section = lite_copy(section)
+        chunks = [_encode(section._json_fields())[:-1].encode(),
+                  b', "meetings": [']
+        for index, meeting in enumerate(section.meetings):
+            if index:
+                chunks.append(b", ")
+            chunks.append(self._meeting(meeting))
+        chunks.append(b"]")
+        if section.final_exam is not None:
+            chunks.append(b', "final_exam": ' +
+                          _encode(section.final_exam.json_data()).encode())
+        chunks.append(b"}")
+        return b"".join(chunks)
+
+    def _meeting(self, meeting):
+        meeting = lite_copy(meeting)
+        return b"".join([
+            _encode(meeting._json_fields())[:-1].encode(),
+            b', "instructors": [',
+            b", ".join([self._instructor(instructor)
+                        for instructor in meeting.instructors]),
+            b"]}"])
+
+    def _term(self, term):
+        entry = self._terms.get(id(term))
+        if entry is None:
+            # hold the term, so that its id is not reused
+            entry = self._terms[id(term)] = (
+                term, _encode(term.json_data()).encode())
+        return entry[1]
+
+    def _instructor(self, instructor):
+        key = (instructor.uwregid, instructor.uwnetid,
+               instructor.display_name)
+        block = self._instructors.get(key)
+        if block is None:
+            block = _encode(instructor.json_data()).encode()
+            if instructor.uwregid is not None:
+                self._instructors[key] = block
+        return block
+
+
+def encode_json(obj):
+    """
+    Returns the json bytes of the json_data() of obj: a model, or a list
+    of models.
+    """
+    return ModelEncoder().encode(obj)
@@ -12,6 +12,9 @@ from uw_sws import get_resource, UWPWS
 from uw_sws.section import get_section_by_url
 from uw_sws.term import Term, get_term_by_year_and_quarter
 from uw_sws.worker import Worker
+from uw_sws.deadline import check_deadline, deadline_scope
+from uw_sws.lite import model_class
+from uw_sws.tracing import traced
 
 
 logger = logging.getLogger(__name__)
@@ -19,18 +22,24 @@ enrollment_res_url_prefix = "/student/v5/enrollment"
 enrollment_search_url_prefix = "/student/v5/enrollment.json"
 
 
-def get_grades_by_regid_and_term(regid, term):
+@traced()
+def get_grades_by_regid_and_term(regid, term, timeout=None):
     """
-    Returns a StudentGrades model for the regid and term.
+    Returns a StudentGrades model for the regid and term. Raises
+    DeadlineExceeded if not done within timeout seconds.
     """
     url = "{}/{},{},{}.json".format(enrollment_res_url_prefix,
                                     term.year,
                                     term.quarter,
                                     regid)
     logger.debug(f"Get grades {url}")
-    return _json_to_grades(get_resource(url), regid, term)
+    with deadline_scope(timeout):
+        data = get_resource(url)
+        check_deadline(url)
+        return _json_to_grades(data, regid, term)
 
 
+@traced()
 def _json_to_grades(data, regid, term):
     grades = StudentGrades()
     grades.term = term
@@ -72,6 +81,7 @@ def _enrollment_search(regid,
     return get_resource(url)
 
 
+@traced()
 def enrollment_search_by_regid(regid,
                                verbose=True,
                                transcriptable_course="all",
@@ -106,11 +116,12 @@ def _get_term(term_enro_json_data):
 def _json_to_enrollment_list(json_data,
                              include_unfinished_pce_course):
     enrollment_list = []
+    enrollment_class = model_class(Enrollment)
     for term_enr in json_data.get("Enrollments", []):
         term = _get_term(term_enr)
         # no longer a meaningful enrollment record without the term
         if term:
-            enrollment = Enrollment(
+            enrollment = enrollment_class(
                 data=term_enr,
                 term=term,
                 include_unfinished_pce_course_reg=include_unfinished_pce_course
@@ -128,11 +139,13 @@ def _json_to_term_enrollment_dict(json_data,
     return enrollment_dict
 
 
+@traced()
 def get_enrollment_by_regid_and_term(regid, term):
     term_enrollment_dict = enrollment_search_by_regid(regid)
     return term_enrollment_dict.get(term)
 
 
+@traced()
 def get_enrollment_history_by_regid(regid,
                                     verbose=True,
                                     transcriptable_course='all',
@@ -148,6 +161,7 @@ def get_enrollment_history_by_regid(regid,
         results, include_unfinished_pce_course_reg)
 
 
+@traced()
 def get_majors_by_regid_and_term(regid, term):
     """
     A light weight function to get student term specific majors, class level
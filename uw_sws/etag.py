@@ -0,0 +1,61 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+A process-wide record of the ETags returned by SWS GET requests, so that
+a later PUT to the same url can skip its preflight GET.
+"""
+from collections import OrderedDict
+from threading import Lock
+
+
+class ETagCache(object):
+    """
+    A bounded, thread-safe map of resource url to its last seen ETag.
+    Least recently used urls are dropped first.
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._etags = OrderedDict()
+        self._lock = Lock()
+        self.preflights_avoided = 0
+        self.precondition_failures = 0
+
+    def get(self, url):
+        with self._lock:
+            etag = self._etags.get(url)
+            if etag is not None:
+                self._etags.move_to_end(url)
+            return etag
+
+    def set(self, url, etag):
+        if etag is None:
+            return self.discard(url)
+
+        with self._lock:
+            self._etags[url] = etag
+            self._etags.move_to_end(url)
+            while len(self._etags) > self.max_size:
+                self._etags.popitem(last=False)
+
+    def discard(self, url):
+        with self._lock:
+            self._etags.pop(url, None)
+
+    def clear(self):
+        with self._lock:
+            self._etags.clear()
+            self.preflights_avoided = 0
+            self.precondition_failures = 0
+
+    def record_preflight_avoided(self):
+        with self._lock:
+            self.preflights_avoided += 1
+
+    def record_precondition_failure(self):
+        with self._lock:
+            self.precondition_failures += 1
+
+    def __len__(self):
+        return len(self._etags)
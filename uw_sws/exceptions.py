@@ -32,3 +32,33 @@ class InvalidSectionURL(Exception):
 class InvalidCourseID(Exception):
     """Exception for invalid section id."""
     pass
+
+
+class NPlusOneError(Exception):
+    """Exception for an operation repeating a request past the threshold."""
+    def __init__(self, msg, template, count, stack):
+        super(NPlusOneError, self).__init__(msg)
+        self.template = template
+        self.count = count
+        self.stack = stack
+
+    def __str__(self):
+        return "{}\n{}".format(self.args[0], self.stack)
+
+
+class CircuitOpenError(DataFailureException):
+    """Exception for a request failed fast by an open circuit breaker."""
+    def __init__(self, template):
+        super(CircuitOpenError, self).__init__(
+            template, 503, "Circuit open for {}".format(template))
+
+
+class DeadlineExceeded(DataFailureException):
+    """Exception for work stopped by an expired or cancelled deadline."""
+    def __init__(self, url, msg="deadline exceeded"):
+        super(DeadlineExceeded, self).__init__(url, 504, msg)
+
+
+class SerializationError(ValueError):
+    """Exception for a model that cannot be serialized, or invalid data."""
+    pass
@@ -0,0 +1,178 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+A mock DAO implementation that injects latency and failures into the
+SWS mock resources, for reproducible offline concurrency benchmarks.
+"""
+import math
+import random
+import re
+import time
+from contextlib import contextmanager
+from threading import Lock
+from commonconf import override_settings
+from restclients_core.dao import DAOImplementation
+from restclients_core.exceptions import DataFailureException
+from restclients_core.models import MockHTTP
+from uw_sws.dao import IndexedMockDAO
+
+
+def fixed(seconds):
+    """
+    A latency of exactly the given seconds.
+    """
+    return lambda rng: seconds
+
+
+def uniform(low, high):
+    """
+    A latency uniformly distributed between low and high seconds.
+    """
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median, sigma=0.5):
+    """
+    A long-tailed latency around the given median seconds.
+    """
+    mu = 0.0 if median <= 0 else math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+class FaultRule(object):
+    """
+    The latency and failure rates applied to the urls matching pattern.
+    """
+    def __init__(self, pattern, latency=None, error_rate=0.0,
+                 error_status=500, throttle_rate=0.0, unavailable_rate=0.0,
+                 timeout_rate=0.0, timeout=None):
+        self.pattern = re.compile(pattern)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle_rate = throttle_rate
+        self.unavailable_rate = unavailable_rate
+        self.timeout_rate = timeout_rate
+        self.timeout = timeout
+
+    def matches(self, url):
+        return self.pattern.search(url) is not None
+
+
+class FaultProfile(object):
+    """
+    An ordered list of FaultRules; the first rule matching a url applies.
+    Each request draws from a generator seeded by (seed, method, url, n),
+    where n counts the earlier requests for that url, so outcomes do not
+    depend on thread scheduling.
+    """
+    def __init__(self, rules=None, seed=0, timeout=10.0):
+        self.rules = rules or []
+        self.seed = seed
+        self.timeout = timeout
+        self._lock = Lock()
+        self._request_counts = {}
+        self.stats = {}
+
+    def rule_for(self, url):
+        for rule in self.rules:
+            if rule.matches(url):
+                return rule
+
+    def outcome(self, method, url):
+        """
+        Returns a tuple of (delay seconds, fault) for the next request,
+        where fault is None, "timeout" or an http status code.
+        """
+        with self._lock:
+            key = (method, url)
+            count = self._request_counts.get(key, 0)
+            self._request_counts[key] = count + 1
+
+        rule = self.rule_for(url)
+        if rule is None:
+            return 0.0, self._record(None)
+
+        rng = random.Random("{}:{}:{}:{}".format(
+            self.seed, method, url, count))
+        delay = max(0.0, rule.latency(rng)) if rule.latency else 0.0
+
+        roll = rng.random()
+        for fault, rate in (("timeout", rule.timeout_rate),
+                            (429, rule.throttle_rate),
+                            (503, rule.unavailable_rate),
+                            (rule.error_status, rule.error_rate)):
+            if roll < rate:
+                if fault == "timeout":
+                    delay += (rule.timeout if rule.timeout is not None
+                              else self.timeout)
+                return delay, self._record(fault)
+            roll -= rate
+        return delay, self._record(None)
+
+    def _record(self, fault):
+        with self._lock:
+            self.stats["requests"] = self.stats.get("requests", 0) + 1
+            if fault is not None:
+                self.stats[fault] = self.stats.get(fault, 0) + 1
+        return fault
+
+    def reset(self):
+        with self._lock:
+            self._request_counts = {}
+            self.stats = {}
+
+
+class FaultInjectingDAO(DAOImplementation):
+    """
+    Wraps the in-memory mock resources with the latency and failures of
+    the installed FaultProfile.
+    Enable with RESTCLIENTS_SWS_DAO_CLASS='uw_sws.faults.FaultInjectingDAO'
+    or the inject_faults context manager.
+    """
+    profile = None
+
+    def __init__(self, service_name, dao):
+        super(FaultInjectingDAO, self).__init__(service_name, dao)
+        self.backend = IndexedMockDAO(service_name, dao)
+
+    def is_mock(self):
+        return True
+
+    def load(self, method, url, headers, body):
+        profile = FaultInjectingDAO.profile
+        if profile is None:
+            return self.backend.load(method, url, headers, body)
+
+        delay, fault = profile.outcome(method, url)
+        if delay:
+            time.sleep(delay)
+
+        if fault is None:
+            return self.backend.load(method, url, headers, body)
+
+        if fault == "timeout":
+            raise DataFailureException(url, 0, "Injected read timeout")
+
+        response = MockHTTP()
+        response.status = fault
+        response.reason = "Injected fault"
+        response.data = ""
+        return response
+
+
+@contextmanager
+def inject_faults(profile):
+    """
+    Routes SWS requests through FaultInjectingDAO with the given profile
+    for the duration of the block.
+    """
+    previous = FaultInjectingDAO.profile
+    FaultInjectingDAO.profile = profile
+    try:
+        with override_settings(
+                RESTCLIENTS_SWS_DAO_CLASS="uw_sws.faults.FaultInjectingDAO"):
+            yield profile
+    finally:
+        FaultInjectingDAO.profile = previous
@@ -0,0 +1,107 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+A process-wide registry of the values repeated across parsed models.
+
+The parsers pass low-cardinality strings such as curriculum
+abbreviations, buildings, quarters, campuses and grading systems, and
+dates, through intern(), so that the many sections, meetings and
+registrations holding the same value share one copy of it. Free text,
+such as course descriptions, is not interned. The registry keeps the
+MAX_VALUES most recently used values.
+
+With the SHARED_TERMS setting, the Term parsed from an unchanged term
+resource is also shared (a flyweight) by everything referring to it.
+Shared terms must not be modified; unshared_term() returns a copy that
+can be.
+"""
+import copy
+import datetime
+from collections import OrderedDict
+from threading import Lock
+from uw_sws import DAO
+
+MAX_VALUES = 100000
+
+# Types whose equal values are interchangeable; not datetime, as equal
+# datetimes may be in different time zones
+_INTERNED_TYPES = frozenset((str, datetime.date))
+
+
+class InternRegistry(object):
+    """
+    Shared copies of immutable values, the max_values most recently used
+    of them, and the last Term parsed for each (year, quarter).
+    """
+    def __init__(self, max_values=MAX_VALUES):
+        self.max_values = max_values
+        self._lock = Lock()
+        self._values = OrderedDict()
+        self._terms = {}
+
+    def intern(self, value):
+        """
+        Returns the shared copy of a str or date equal to value, or value
+        itself.
+        """
+        if type(value) not in _INTERNED_TYPES:
+            return value
+        values = self._values
+        shared = values.get(value)
+        if shared is not None:
+            try:
+                values.move_to_end(value)
+            except KeyError:
+                pass
+            return shared
+        with self._lock:
+            shared = values.setdefault(value, value)
+            while len(values) > self.max_values:
+                values.popitem(last=False)
+        return shared
+
+    def term(self, data, build):
+        """
+        Returns the Term last built for term resource json equal to data,
+        or else build(data), which is then kept for later json.
+        """
+        key = (data.get("Year"), data.get("Quarter"))
+        entry = self._terms.get(key)
+        if entry is not None and entry[0] == data:
+            return entry[1]
+        term = build(data)
+        self._terms[key] = (data, term)
+        return term
+
+    def is_shared(self, term):
+        entry = self._terms.get((term.year, term.quarter))
+        return entry is not None and entry[1] is term
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+        self._terms.clear()
+
+    def __len__(self):
+        return len(self._values)
+
+
+REGISTRY = InternRegistry()
+
+
+def shared_terms_enabled():
+    return bool(DAO.get_service_setting("SHARED_TERMS", False))
+
+
+def intern(value):
+    return REGISTRY.intern(value)
+
+
+def unshared_term(term):
+    """
+    Returns term, or a copy of it if it is shared.
+    """
+    if term is not None and REGISTRY.is_shared(term):
+        return copy.copy(term)
+    return term
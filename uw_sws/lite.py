@@ -0,0 +1,396 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Lightweight variants of the models built in bulk. Each has the same
+attributes and methods as the model it mirrors, but not restclients_core
+field descriptors, and is not an instance of that model.
+
+Their methods and other descriptors are looked up on the model when
+they are accessed, so patching a model's method patches its variants.
+
+Lite models (Term, Section, SectionMeeting, Registration, Enrollment)
+store their attributes in __slots__, so they take a fraction of the
+memory and are faster to build. Attributes beyond the model's fields
+and those the parsers set cannot be added to them.
+
+Lazy models (Registration, Enrollment) keep their source json and parse
+each field on first access, caching it, so records of which only a few
+fields are read are cheap. hydrate() parses the rest.
+
+With the LITE_MODELS or LAZY_MODELS setting, the client's parsers build
+these variants; lazy takes precedence where both apply.
+"""
+import re
+from types import FunctionType
+from restclients_core.models import Model
+from restclients_core.models.fields import BaseField
+from uw_sws import DAO
+from uw_sws.models import (
+    Term, Section, SectionMeeting, Registration, Enrollment, Major, Minor)
+
+# Model instance attributes that are not model data
+MODEL_INTERNALS = frozenset(("initialized", "_field_values",
+                             "_dynamic_fields", "__rcm_timestamp"))
+# Model class attributes not copied onto the variants
+_NOT_COPIED = frozenset(("__init__", "__dict__", "__weakref__", "__module__",
+                         "__qualname__", "__doc__", "__getattribute__"))
+_DISPLAY = re.compile(r"^get_(.*)_display$")
+# Model class attributes delegated to the model, rather than copied
+_DELEGATED = (FunctionType, property, classmethod, staticmethod)
+
+# {model class: ({field key: name}, {name: (field key, field)})}
+_fields = {}
+
+
+class MirrorModel(object):
+    """
+    The base of the model variants. model is the Model mirrored, and
+    _defaults the (name, default) of each attribute.
+    """
+    __slots__ = ()
+    model = None
+    _defaults = ()
+
+    def __getattr__(self, name):
+        # get_<field>_display(), as on restclients_core models
+        match = _DISPLAY.match(name)
+        if match:
+            field = _model_field(self.model, match.group(1))
+            if getattr(field, "has_choices", False):
+                value = getattr(self, match.group(1))
+                display = dict(field.choices).get(value)
+                return lambda: display
+        raise AttributeError("'{}' object has no attribute '{}'".format(
+            type(self).__name__, name))
+
+    def __str__(self):
+        return ", ".join(["{}: {}".format(name, getattr(self, name))
+                          for name, default in sorted(self._defaults)])
+
+
+class ModelAttribute(object):
+    """
+    A method or other descriptor of a mirrored model, read from the
+    model each time it is accessed on a variant.
+    """
+    __slots__ = ("model", "name")
+
+    def __init__(self, model, name):
+        self.model = model
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        value = _model_field(self.model, self.name)
+        get = getattr(type(value), "__get__", None)
+        return value if get is None else get(value, instance, owner)
+
+
+class LiteModel(MirrorModel):
+    """
+    The base of the slotted lite models.
+    """
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        for name, default in self._defaults:
+            setattr(self, name, default)
+        if kwargs.get("data") is not None:
+            # The models' data parsing only sets attributes
+            self.model.__init__(self, *args, **kwargs)
+        else:
+            for key, value in kwargs.items():
+                setattr(self, key, value)
+
+
+class LazyField(object):
+    """
+    A lazy model attribute, parsed by parse(model) on first access and
+    then cached; default, or default() if callable, without source json.
+    """
+    def __init__(self, name, parse=None, default=None):
+        self.name = name
+        self.parse = parse
+        self.default = default
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        values = instance._values
+        try:
+            return values[self.name]
+        except KeyError:
+            pass
+        if self.parse is not None and instance._data is not None:
+            value = self.parse(instance)
+        elif callable(self.default):
+            value = self.default()
+        else:
+            value = self.default
+        values[self.name] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance._values[self.name] = value
+
+
+class LazyModel(MirrorModel):
+    """
+    The base of the lazy models. _data is the source json and _options
+    the other keyword arguments the model was built with.
+    """
+    __slots__ = ("_data", "_options", "_values")
+
+    def __init__(self, *args, **kwargs):
+        self._values = {}
+        self._data = kwargs.pop("data", None)
+        self._options = kwargs
+        if self._data is None:
+            for key, value in kwargs.items():
+                setattr(self, key, value)
+
+    def hydrate(self):
+        """
+        Parses every attribute not yet accessed. Returns the model.
+        """
+        for name, default in self._defaults:
+            getattr(self, name)
+        return self
+
+    def __getstate__(self):
+        return self.hydrate()._values
+
+    def __setstate__(self, values):
+        self._data = None
+        self._options = {}
+        self._values = values
+
+
+def model_fields(cls):
+    """
+    Returns ({field key: name}, {name: (field key, field)}) for the
+    fields of a Model class, whose instances hold their field values by
+    field key.
+    """
+    fields = _fields.get(cls)
+    if fields is None:
+        by_key = {}
+        by_name = {}
+        for base in reversed(cls.__mro__):
+            for name, field in vars(base).items():
+                if isinstance(field, BaseField):
+                    key = field._key_for_instance(field)
+                    by_key[key] = name
+                    by_name[name] = (key, field)
+        fields = _fields[cls] = (by_key, by_name)
+    return fields
+
+
+def model_attributes(model):
+    """
+    Returns a dict of the set fields and other attributes of a Model
+    instance, read without its field descriptors.
+    """
+    by_key = model_fields(type(model))[0]
+    state = vars(model)
+    attributes = {by_key[key]: value
+                  for key, value in state.get("_field_values", {}).items()
+                  if key in by_key}
+    for name, value in state.items():
+        if name not in MODEL_INTERNALS:
+            attributes[name] = value
+    return attributes
+
+
+def _model_field(model, name):
+    for cls in model.__mro__:
+        if name in vars(cls):
+            return vars(cls)[name]
+
+
+def _mirror(model, prefix, base, extra, namespace_for):
+    """
+    Returns a subclass of base mirroring model's attributes, and
+    delegating its methods to it. namespace_for(namespace, defaults)
+    adds the class's attributes.
+    """
+    defaults = {}
+    namespace = {}
+    for cls in reversed(model.__mro__):
+        if cls in (object, Model):
+            continue
+        for name, value in vars(cls).items():
+            if isinstance(value, BaseField):
+                defaults[name] = value.default
+            elif name in _NOT_COPIED:
+                continue
+            elif isinstance(value, _DELEGATED):
+                namespace[name] = ModelAttribute(model, name)
+            else:
+                namespace[name] = value
+    for name in extra:
+        defaults.setdefault(name, extra[name])
+    for name in defaults:
+        namespace.pop(name, None)
+
+    name = "{}{}".format(prefix, model.__name__)
+    namespace_for(namespace, defaults)
+    namespace.update({
+        "__module__": __name__,
+        "__qualname__": name,
+        "__doc__": "A {} {}.".format(prefix.lower(), model.__name__),
+        "model": model,
+        "_defaults": tuple(defaults.items()),
+    })
+    return type(name, (base,), namespace)
+
+
+def lite_model(model, extra=(), **attributes):
+    """
+    Returns a slotted LiteModel class mirroring model: a slot for each
+    of its fields, with the field's default, and for each extra
+    attribute, defaulting to None, and its other attributes and
+    methods, updated by attributes.
+    """
+    def namespace_for(namespace, defaults):
+        namespace.update(attributes)
+        namespace["__slots__"] = tuple(defaults)
+
+    return _mirror(model, "Lite", LiteModel,
+                   dict.fromkeys(extra), namespace_for)
+
+
+def lazy_model(model, extra=None, parsers=None, **attributes):
+    """
+    Returns a LazyModel class mirroring model: a LazyField for each of
+    its fields, parsed by its json_fields, and for each extra attribute,
+    with the default given, and its other attributes and methods,
+    updated by attributes. parsers maps attributes to a
+    parse(model) replacing their json_fields parser.
+    """
+    parsers = dict(parsers or {})
+    for name, parse in getattr(model, "json_fields", ()):
+        parsers.setdefault(name, _json_parser(parse))
+
+    def namespace_for(namespace, defaults):
+        namespace.update(attributes)
+        namespace["__slots__"] = ()
+        for name, default in defaults.items():
+            namespace[name] = LazyField(name, parsers.get(name), default)
+
+    return _mirror(model, "Lazy", LazyModel, extra or {}, namespace_for)
+
+
+def _json_parser(parse):
+    return lambda instance: parse(instance._data)
+
+
+def _enrollment_registrations(enrollment):
+    registrations, unf_pce_courses = enrollment._json_to_registrations(
+        enrollment._data,
+        enrollment._options.get("include_unfinished_pce_course_reg"))
+    enrollment._values["unf_pce_courses"] = unf_pce_courses
+    return registrations
+
+
+def _enrollment_unf_pce_courses(enrollment):
+    enrollment.registrations
+    return enrollment._values["unf_pce_courses"]
+
+
+LiteTerm = lite_model(Term, extra=(
+    "time_schedule_construction", "time_schedule_published",
+    "credits", "credits_complete", "section_count"))
+LiteSectionMeeting = lite_model(SectionMeeting, extra=("instructors",))
+LiteSection = lite_model(Section, extra=(
+    "meetings", "linked_section_urls", "joint_section_urls",
+    "grade_submission_delegates", "registration"))
+LiteRegistration = lite_model(Registration, extra=(
+    "section", "section_ref", "person", "majors", "class_code",
+    "class_level", "regid"))
+LiteEnrollment = lite_model(Enrollment, extra=(
+    "registrations", "majors", "minors", "unf_pce_courses", "term"),
+    registration_model=LiteRegistration)
+
+LazyRegistration = lazy_model(Registration, extra={
+    "section": None, "section_ref": None, "person": None, "majors": list,
+    "class_code": None, "class_level": None, "regid": None})
+LazyEnrollment = lazy_model(Enrollment, extra={
+    "registrations": list, "majors": list, "minors": list,
+    "unf_pce_courses": dict, "term": None}, parsers={
+    "term": lambda enrollment: enrollment._options.get("term"),
+    "registrations": _enrollment_registrations,
+    "unf_pce_courses": _enrollment_unf_pce_courses,
+    "majors": lambda enrollment: [
+        Major(data=major) for major in enrollment._data.get("Majors", [])],
+    "minors": lambda enrollment: [
+        Minor(data=minor) for minor in enrollment._data.get("Minors", [])],
+    }, registration_model=LazyRegistration)
+
+LITE_MODELS = {
+    Term: LiteTerm,
+    Section: LiteSection,
+    SectionMeeting: LiteSectionMeeting,
+    Registration: LiteRegistration,
+    Enrollment: LiteEnrollment,
+}
+LAZY_MODELS = {
+    Registration: LazyRegistration,
+    Enrollment: LazyEnrollment,
+}
+
+
+def lite_models_enabled():
+    return bool(DAO.get_service_setting("LITE_MODELS", False))
+
+
+def lazy_models_enabled():
+    return bool(DAO.get_service_setting("LAZY_MODELS", False))
+
+
+def _classes(lazy, lite):
+    classes = {model: model for model in LITE_MODELS}
+    if lite:
+        classes.update(LITE_MODELS)
+    if lazy:
+        classes.update(LAZY_MODELS)
+    return classes
+
+
+# {(lazy, lite): {model: class built}}
+_MODEL_CLASSES = {(lazy, lite): _classes(lazy, lite)
+                  for lazy in (False, True) for lite in (False, True)}
+
+
+def model_classes():
+    """
+    Returns a read-only dict of the class the parsers build for each
+    model with a variant, as chosen by the LAZY_MODELS and LITE_MODELS
+    settings. A parser building many models resolves it once, rather
+    than read the settings for each.
+    """
+    return _MODEL_CLASSES[(lazy_models_enabled(), lite_models_enabled())]
+
+
+def model_class(model):
+    """
+    Returns the class the parsers build for model: its lazy variant
+    when the LAZY_MODELS setting is on, or its lite variant when the
+    LITE_MODELS setting is, else model itself.
+    """
+    return model_classes().get(model, model)
+
+
+def lite_copy(model):
+    """
+    Returns a lite copy of model, whose attributes are quicker to read,
+    or model itself if it has no lite variant or attributes the variant
+    cannot hold.
+    """
+    lite = LITE_MODELS.get(type(model))
+    if lite is None:
+        return model
+    try:
+        return lite(**model_attributes(model))
+    except AttributeError:
+        return model
@@ -0,0 +1,239 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-endpoint request metrics. SWS requests are reported to the installed
+sink under a url template, e.g. /student/v5/person/{regid}.json, so that
+requests for different students aggregate together. No sink is installed
+by default, and requests then only pay for a None check.
+"""
+import logging
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from threading import Lock
+
+# Upper bounds, in milliseconds, of the latency histogram buckets
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000,
+                      float("inf"))
+
+# Gauge values of the circuit breaker states
+CIRCUIT_GAUGE = {"closed": 0, "half-open": 1, "open": 2}
+
+_TEMPLATE_RULES = [
+    (re.compile(r"/course/[^/?]+/[^/?]+?(?=(/status)?\.json)"),
+     "/course/{label}"),
+    (re.compile(r"/course/(?!{)[^/?]+?(?=\.json)"), "/course/{course}"),
+    (re.compile(r"/registration/[^/?]+?(?=\.json)"),
+     "/registration/{label}"),
+    (re.compile(r"\d{4},(winter|spring|summer|autumn)", re.I), "{term}"),
+    (re.compile(r"(?<![0-9A-F])[0-9A-F]{32}(?![0-9A-F])", re.I), "{regid}"),
+]
+
+_sink = None
+
+
+def set_metrics_sink(sink):
+    """
+    Installs the sink receiving request metrics; None disables metrics.
+    Returns the previously installed sink.
+    """
+    global _sink
+    previous = _sink
+    _sink = sink
+    return previous
+
+
+def get_metrics_sink():
+    return _sink
+
+
+@lru_cache(maxsize=4096)
+def url_template(url):
+    """
+    Returns url with its resource identifiers replaced by placeholders,
+    and its query reduced to the sorted parameter names.
+    """
+    path, sep, query = url.partition("?")
+    for pattern, replacement in _TEMPLATE_RULES:
+        path = pattern.sub(replacement, path)
+    if query:
+        names = sorted(set(
+            param.partition("=")[0] for param in query.split("&") if param))
+        path = "{}?{}".format(path, "&".join(names))
+    return path
+
+
+def response_size(response):
+    data = getattr(response, "data", None)
+    return len(data) if data else 0
+
+
+class MetricsSink(object):
+    """
+    The sink interface. request() is called once per SWS request,
+    decode() once per json response body decoded, retry() before each
+    retry of a request and circuit() on each circuit breaker change.
+    """
+    def request(self, method, template, status, seconds, size):
+        pass
+
+    def decode(self, method, template, seconds):
+        pass
+
+    def retry(self, method, template, status, attempt):
+        pass
+
+    def circuit(self, template, state):
+        pass
+
+
+class EndpointStats(object):
+    """
+    The aggregated metrics for one method and url template.
+    """
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes = 0
+        self.statuses = {}
+        self.histogram = [0] * len(LATENCY_BUCKETS_MS)
+        self.decode_count = 0
+        self.decode_seconds = 0.0
+        self.retries = 0
+
+    def json_data(self):
+        return {
+            "count": self.count,
+            "seconds": self.seconds,
+            "max_seconds": self.max_seconds,
+            "mean_seconds": self.seconds / self.count if self.count else 0,
+            "bytes": self.bytes,
+            "statuses": dict(self.statuses),
+            "histogram": {
+                str(bound): count
+                for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram)},
+            "decode_count": self.decode_count,
+            "decode_seconds": self.decode_seconds,
+            "retries": self.retries,
+        }
+
+
+class InMemoryMetrics(MetricsSink):
+    """
+    Aggregates request metrics per (method, url template) in memory.
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self.endpoints = {}
+        self.circuits = {}
+
+    def _stats(self, method, template):
+        key = (method, template)
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = EndpointStats()
+            self.endpoints[key] = stats
+        return stats
+
+    def request(self, method, template, status, seconds, size):
+        bucket = bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            stats = self._stats(method, template)
+            stats.count += 1
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.bytes += size
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.histogram[bucket] += 1
+
+    def decode(self, method, template, seconds):
+        with self._lock:
+            stats = self._stats(method, template)
+            stats.decode_count += 1
+            stats.decode_seconds += seconds
+
+    def retry(self, method, template, status, attempt):
+        with self._lock:
+            self._stats(method, template).retries += 1
+
+    def circuit(self, template, state):
+        with self._lock:
+            self.circuits[template] = state
+
+    def snapshot(self):
+        """
+        Returns a dict of "METHOD template" to the endpoint's metrics,
+        slowest total time first.
+        """
+        with self._lock:
+            items = sorted(self.endpoints.items(),
+                           key=lambda item: item[1].seconds, reverse=True)
+            return {"{} {}".format(method, template): stats.json_data()
+                    for (method, template), stats in items}
+
+    def reset(self):
+        with self._lock:
+            self.endpoints = {}
+            self.circuits = {}
+
+
+class LoggingMetrics(MetricsSink):
+    """
+    Logs a line per request and json decode.
+    """
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def request(self, method, template, status, seconds, size):
+        self.logger.log(
+            self.level, "sws request method:%s template:%s status:%s "
+            "time:%.6f bytes:%d", method, template, status, seconds, size)
+
+    def decode(self, method, template, seconds):
+        self.logger.log(
+            self.level, "sws decode method:%s template:%s time:%.6f",
+            method, template, seconds)
+
+    def retry(self, method, template, status, attempt):
+        self.logger.log(
+            self.level, "sws retry method:%s template:%s status:%s "
+            "attempt:%d", method, template, status, attempt)
+
+    def circuit(self, template, state):
+        self.logger.log(
+            self.level, "sws circuit template:%s state:%s", template, state)
+
+
+class CallbackMetrics(MetricsSink):
+    """
+    Reports statsd-style metrics to callback(name, value, kind, tags),
+    where kind is "timing" (milliseconds), "histogram", "counter" or
+    "gauge". The circuit gauge is 0 when closed, 1 half-open and 2 open.
+    """
+    def __init__(self, callback, prefix="sws"):
+        self.callback = callback
+        self.prefix = prefix
+
+    def request(self, method, template, status, seconds, size):
+        tags = {"method": method, "template": template, "status": status}
+        self.callback("{}.request".format(self.prefix), seconds * 1000,
+                      "timing", tags)
+        self.callback("{}.response_bytes".format(self.prefix), size,
+                      "histogram", tags)
+
+    def decode(self, method, template, seconds):
+        self.callback("{}.decode".format(self.prefix), seconds * 1000,
+                      "timing", {"method": method, "template": template})
+
+    def retry(self, method, template, status, attempt):
+        self.callback("{}.retry".format(self.prefix), 1, "counter",
+                      {"method": method, "template": template,
+                       "status": status})
+
+    def circuit(self, template, state):
+        self.callback("{}.circuit".format(self.prefix),
+                      CIRCUIT_GAUGE.get(state, 0), "gauge",
+                      {"template": template, "state": state})
@@ -12,6 +12,7 @@ from uw_sws.util import (
     abbr_week_month_day_str, convert_to_begin_of_day, convert_to_end_of_day,
     str_to_datetime, str_to_date, date_to_str)
 from uw_sws.dao import sws_now
+from uw_sws.intern import intern
 from restclients_core import models
 
 SWS_TERM_LABEL = "{year},{quarter}"
@@ -268,6 +269,13 @@ class DegreeStatus(models.Model):
         return json.dumps(self.json_data())
 
 
+def _model_type(obj):
+    """
+    Returns the type of obj, or the model a lite model mirrors.
+    """
+    return getattr(type(obj), "model", None) or type(obj)
+
+
 class Term(models.Model):
     SPRING = 'spring'
     SUMMER = 'summer'
@@ -312,7 +320,7 @@ class Term(models.Model):
             return super(Term, self).__init__(*args, **kwargs)
 
         self.year = data["Year"]
-        self.quarter = data["Quarter"]
+        self.quarter = intern(data["Quarter"])
         self.last_day_add = str_to_date(data["LastAddDay"])
         self.first_day_quarter = str_to_date(data["FirstDay"])
         self.last_day_instruction = str_to_date(data["LastDayOfClasses"])
@@ -369,21 +377,21 @@ class Term(models.Model):
 
     def __eq__(self, other):
         return (other is not None and
-                type(self) is type(other) and
+                _model_type(self) is _model_type(other) and
                 self.int_key() == other.int_key())
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __lt__(self, other):
-        return (type(self) is type(other) and
+        return (_model_type(self) is _model_type(other) and
                 self.int_key() < other.int_key())
 
     def __le__(self, other):
         return self.__lt__(other) or self.__eq__(other)
 
     def __gt__(self, other):
-        return (type(self) is type(other) and
+        return (_model_type(self) is _model_type(other) and
                 self.int_key() > other.int_key())
 
     def __ge__(self, other):
@@ -914,7 +922,18 @@ class Section(models.Model):
              self.section_type.lower() == "st")
 
     def json_data(self):
-        data = {
+        data = self._json_fields()
+        data["meetings"] = [meeting.json_data() for meeting in self.meetings]
+        if self.final_exam is not None:
+            data["final_exam"] = self.final_exam.json_data()
+        return data
+
+    def _json_fields(self):
+        """
+        Returns the json_data() of the section without its meetings and
+        final exam.
+        """
+        return {
             'curriculum_abbr': self.curriculum_abbr,
             'course_number': self.course_number,
             'section_id': self.section_id,
@@ -937,7 +956,6 @@ class Section(models.Model):
             'limit_estimate_enrollment_indicator':
                 self.limit_estimate_enrollment_indicator,
             'auditors': self.auditors,
-            'meetings': [],
             'for_credit': self.for_credit(),
             'credits': str(self.student_credits),
             'is_auditor':  self.is_auditor,
@@ -949,14 +967,6 @@ class Section(models.Model):
             'is_hybrid': self.is_hybrid
         }
 
-        if self.final_exam is not None:
-            data["final_exam"] = self.final_exam.json_data()
-
-        for meeting in self.meetings:
-            data["meetings"].append(meeting.json_data())
-
-        return data
-
     def __str__(self):
         return json.dumps(self.json_data())
 
@@ -972,7 +982,7 @@ class SectionReference(models.Model):
 
     def __eq__(self, other):
         return (other is not None and
-                type(self) is type(other) and
+                _model_type(self) is _model_type(other) and
                 self.section_label() == other.section_label())
 
     def section_label(self):
@@ -1055,6 +1065,29 @@ class Registration(models.Model):
     request_date = models.DateField(blank=True, null=True, default=None)
     request_status = models.CharField(max_length=50)
 
+    # (attribute, parser of the registration json) for each field; the
+    # lazy models in uw_sws.lite parse them on first access
+    json_fields = (
+        ("credits", lambda d: intern(d["Credits"].strip())),
+        ("duplicate_code", lambda d: intern(d.get("DuplicateCode"))),
+        ("feebase_type", lambda d: intern(d.get("FeeBaseType"))),
+        ("grade", lambda d: intern(d.get("Grade"))),
+        ("is_active", lambda d: d.get("IsActive")),
+        ("is_auditor", lambda d: d.get("Auditor")),
+        ("is_credit", lambda d: d.get("IsCredit")),
+        ("is_independent_start", lambda d: d.get("IsIndependentStart")),
+        ("meta_data", lambda d: d.get("Metadata")),
+        ("request_status", lambda d: intern(d.get("RequestStatus"))),
+        ("repeat_course", lambda d: d.get("RepeatCourse")),
+        ("grade_date", lambda d: intern(str_to_date(d.get("GradeDate")))),
+        ("start_date", lambda d: intern(str_to_date(d.get("StartDate")))),
+        ("end_date", lambda d: intern(str_to_date(d.get("EndDate")))),
+        ("request_date",
+         lambda d: intern(str_to_date(d.get("RequestDate")))),
+        ("repository_timestamp",
+         lambda d: str_to_datetime(d.get("RepositoryTimeStamp"))),
+    )
+
     def __init__(self, *args, **kwargs):
         self.section = None  # either Section or SectionReference
         self.person = None
@@ -1065,23 +1098,8 @@ class Registration(models.Model):
         if reg_json is None:
             return super(Registration, self).__init__(*args, **kwargs)
 
-        self.credits = reg_json["Credits"].strip()
-        self.duplicate_code = reg_json.get("DuplicateCode")
-        self.feebase_type = reg_json.get("FeeBaseType")
-        self.grade = reg_json.get("Grade")
-        self.is_active = reg_json.get("IsActive")
-        self.is_auditor = reg_json.get("Auditor")
-        self.is_credit = reg_json.get("IsCredit")
-        self.is_independent_start = reg_json.get("IsIndependentStart")
-        self.meta_data = reg_json.get("Metadata")
-        self.request_status = reg_json.get("RequestStatus")
-        self.repeat_course = reg_json.get("RepeatCourse")
-        self.grade_date = str_to_date(reg_json.get("GradeDate"))
-        self.start_date = str_to_date(reg_json.get("StartDate"))
-        self.end_date = str_to_date(reg_json.get("EndDate"))
-        self.request_date = str_to_date(reg_json.get("RequestDate"))
-        self.repository_timestamp = str_to_datetime(
-            reg_json.get("RepositoryTimeStamp"))
+        for name, parse in self.json_fields:
+            setattr(self, name, parse(reg_json))
 
     def eos_only(self):
         return (self.meta_data is not None and
@@ -1150,9 +1168,11 @@ class RegistrationBlock(models.Model):
     covid19_status_updated = models.DateTimeField()
 
     def __init__(self, *args, **kwargs):
+        self.etag = None  # ETag of the resource this block was read from
         data = kwargs.get("data")
         if data is None:
             return super(RegistrationBlock, self).__init__(*args, **kwargs)
+        self.etag = kwargs.get("etag")
         self.student_name = data.get("StudentName")
         self.uwregid = data.get("RegID")
         self.student_system_key = data.get("StudentSystemKey")
@@ -1209,7 +1229,16 @@ class SectionMeeting(models.Model):
                     self.meets_sunday)
 
     def json_data(self):
-        data = {
+        data = self._json_fields()
+        data["instructors"] = [
+            instructor.json_data() for instructor in self.instructors]
+        return data
+
+    def _json_fields(self):
+        """
+        Returns the json_data() of the meeting without its instructors.
+        """
+        return {
             'index': self.meeting_index,
             'type': self.meeting_type,
             'days_tbd': self.days_to_be_arranged,
@@ -1233,14 +1262,8 @@ class SectionMeeting(models.Model):
             'room_tbd': self.room_to_be_arranged,
             'room': self.room_number,
             'room_number': self.room_number,
-            'instructors': [],
         }
 
-        for instructor in self.instructors:
-            data["instructors"].append(instructor.json_data())
-
-        return data
-
     def __str__(self):
         return json.dumps(self.json_data())
 
@@ -1267,20 +1290,46 @@ class ClassSchedule(models.Model):
                              on_delete=models.PROTECT)
     registered_summer_terms = {}
 
+    def __init__(self, *args, **kwargs):
+        self.failed_sections = []
+        super(ClassSchedule, self).__init__(*args, **kwargs)
+
+    def is_partial(self):
+        return len(self.failed_sections) > 0
+
     def json_data(self):
         data = {
             'year': self.term.year,
             'quarter': self.term.quarter,
             'term': self.term.json_data(),
             'sections': [],
-            'registered_summer_terms': self.registered_summer_terms
+            'registered_summer_terms': self.registered_summer_terms,
         }
+        if self.failed_sections:
+            data['failed_sections'] = [
+                failure.json_data() for failure in self.failed_sections]
 
         for section in self.sections:
             data["sections"].append(section.json_data())
         return data
 
 
+class SectionFailure(models.Model):
+    """
+    A registered section that a partial ClassSchedule could not load.
+    """
+    url = models.CharField(max_length=255)
+    status = models.SmallIntegerField(null=True)
+    message = models.TextField()
+
+    def json_data(self):
+        return {
+            'url': self.url,
+            'status': self.status,
+            'message': self.message,
+        }
+
+
 class Campus(models.Model):
     label = models.SlugField(max_length=15, unique=True)
     name = models.CharField(max_length=20)
@@ -1388,8 +1437,13 @@ class Finance(models.Model):
         return json.dumps(self.json_data())
 
 
+def _is_src_location_pce(s, pattern):
+    return (re.search(pattern, s) is not None and 'EOS' in s)
+
+
 class Enrollment(models.Model):
     CLASS_LEVEL_NON_MATRIC = "non_matric"
+    registration_model = Registration
 
     is_honors = models.NullBooleanField()
     class_code = models.CharField(max_length=10)
@@ -1409,6 +1463,32 @@ class Enrollment(models.Model):
     pending_resident_code = models.CharField(max_length=2, null=True)
     pending_resident_desc = models.CharField(max_length=64, null=True)
 
+    # (attribute, parser of the enrollment json) for each field
+    json_fields = (
+        ("regid", lambda d: d.get('RegID')),
+        ("class_level", lambda d: intern(d.get('ClassLevel'))),
+        ("class_code", lambda d: intern(d.get('ClassCode'))),
+        ("class_description", lambda d: intern(d.get('ClassDescription'))),
+        ("enrollment_status", lambda d: intern(d.get('EnrollmentStatus'))),
+        ("enrollment_status_date",
+         lambda d: str_to_date(d.get('EnrollmentStatusDate'))),
+        ("qtr_grade_points", lambda d: d.get('QtrGradePoints')),
+        ("qtr_graded_attmp", lambda d: d.get('QtrGradedAttmp')),
+        ("qtr_non_grd_earned", lambda d: d.get('QtrNonGrdEarned')),
+        ("is_honors", lambda d: d.get('HonorsProgram', False)),
+        ("has_pending_major_change",
+         lambda d: d.get('PendingMajorChange', False)),
+        ("is_enroll_src_pce", lambda d: _is_src_location_pce(
+            d.get('Metadata', ''), ENROLLMENT_SOURCE_PCE)),
+        ("has_pending_resident_change",
+         lambda d: d.get('PendingResidentChange', False)),
+        ("pending_resident_code",
+         lambda d: intern(d.get('PendingResident'))),
+        ("pending_resident_desc",
+         lambda d: d.get('PendingResidencyDescription')),
+        ("is_registered", lambda d: len(d.get('Registrations', [])) > 0),
+    )
+
     def __init__(self, *args, **kwargs):
         self.registrations = []
         self.majors = []
@@ -1419,58 +1499,47 @@ class Enrollment(models.Model):
         if json_data is None:
             return super(Enrollment, self).__init__(*args, **kwargs)
 
-        self.regid = json_data.get('RegID')
-        self.class_level = json_data.get('ClassLevel')
-        self.class_code = json_data.get('ClassCode')
-        self.class_description = json_data.get('ClassDescription')
-        self.enrollment_status = json_data.get('EnrollmentStatus')
-        self.enrollment_status_date = str_to_date(
-            json_data.get('EnrollmentStatusDate'))
-        self.qtr_grade_points = json_data.get('QtrGradePoints')
-        self.qtr_graded_attmp = json_data.get('QtrGradedAttmp')
-        self.qtr_non_grd_earned = json_data.get('QtrNonGrdEarned')
-        self.is_honors = json_data.get('HonorsProgram', False)
-        self.has_pending_major_change = json_data.get(
-            'PendingMajorChange', False)
-        self.is_enroll_src_pce = self._is_src_location_pce(
-            json_data.get('Metadata', ''), ENROLLMENT_SOURCE_PCE)
-        self.has_pending_resident_change = json_data.get(
-            'PendingResidentChange', False)
-        self.pending_resident_code = json_data.get(
-            'PendingResident')
-        self.pending_resident_desc = json_data.get(
-            'PendingResidencyDescription')
+        for name, parse in self.json_fields:
+            setattr(self, name, parse(json_data))
 
         self.term = kwargs.get("term")
-
-        registrations = json_data.get('Registrations', [])
-        self.is_registered = len(registrations) > 0
-        for json_reg in registrations:
-            registration = Registration(data=json_reg)
+        self.registrations, self.unf_pce_courses = (
+            self._json_to_registrations(
+                json_data, kwargs.get('include_unfinished_pce_course_reg')))
+        self.majors = [Major(data=major)
+                       for major in json_data.get('Majors', [])]
+        self.minors = [Minor(data=minor)
+                       for minor in json_data.get('Minors', [])]
+
+    def _json_to_registrations(self, json_data, include_unfinished_pce):
+        """
+        Returns the term's registrations and, if include_unfinished_pce,
+        a dict of its unfinished PCE course registrations by section label.
+        """
+        registrations = []
+        unf_pce_courses = {}
+        for json_reg in json_data.get('Registrations', []):
+            registration = self.registration_model(data=json_reg)
             registration.section_ref = SectionReference(
                 term=self.term,
-                curriculum_abbr=json_reg['Section']['CurriculumAbbreviation'],
-                course_number=json_reg['Section']['CourseNumber'],
+                curriculum_abbr=intern(
+                    json_reg['Section']['CurriculumAbbreviation']),
+                course_number=intern(json_reg['Section']['CourseNumber']),
                 section_id=json_reg['Section']['SectionID'],
                 url=json_reg['Section']['Href'])
-            self.registrations.append(registration)
+            registrations.append(registration)
 
-            if kwargs.get('include_unfinished_pce_course_reg'):
+            if include_unfinished_pce:
                 metadata = json_reg.get('Metadata', '')
                 if (registration.start_date and registration.end_date and
-                        self._is_src_location_pce(
+                        _is_src_location_pce(
                             metadata, REGISTRATION_SOURCE_PCE)):
                     key = registration.section_ref.section_label()
-                    self.unf_pce_courses[key] = registration
-
-        for major in json_data.get('Majors', []):
-            self.majors.append(Major(data=major))
-
-        for minor in json_data.get('Minors', []):
-            self.minors.append(Minor(data=minor))
+                    unf_pce_courses[key] = registration
+        return registrations, unf_pce_courses
 
     def _is_src_location_pce(self, s, pattern):
-        return (re.search(pattern, s) is not None and 'EOS' in s)
+        return _is_src_location_pce(s, pattern)
 
     def is_non_matric(self):
         return self.class_level.lower() == Enrollment.CLASS_LEVEL_NON_MATRIC
@@ -1520,19 +1589,19 @@ class Major(models.Model):
         if json_data is None:
             return super(Major, self).__init__(*args, **kwargs)
 
-        self.degree_abbr = json_data.get('Abbreviation')
-        self.college_abbr = json_data.get('CollegeAbbreviation')
-        self.college_full_name = json_data.get('CollegeFullName')
-        self.degree_name = json_data.get('DegreeName')
+        self.degree_abbr = intern(json_data.get('Abbreviation'))
+        self.college_abbr = intern(json_data.get('CollegeAbbreviation'))
+        self.college_full_name = intern(json_data.get('CollegeFullName'))
+        self.degree_name = intern(json_data.get('DegreeName'))
         self.degree_level = int(json_data.get('DegreeLevel', 0))
-        self.full_name = json_data.get('FullName')
-        self.major_name = json_data.get('MajorName')
-        self.short_name = json_data.get('ShortName')
-        self.campus = json_data.get('Campus')
+        self.full_name = intern(json_data.get('FullName'))
+        self.major_name = intern(json_data.get('MajorName'))
+        self.short_name = intern(json_data.get('ShortName'))
+        self.campus = intern(json_data.get('Campus'))
 
     def __eq__(self, other):
         return (other is not None and
-                type(self) is type(other) and
+                _model_type(self) is _model_type(other) and
                 self.__key() == other.__key())
 
     def __key(self):
@@ -1569,15 +1638,15 @@ class Minor(models.Model):
         if json_data is None:
             return super(Minor, self).__init__(*args, **kwargs)
 
-        self.abbr = json_data.get('Abbreviation')
-        self.campus = json_data.get('CampusName')
-        self.name = json_data.get('Name')
-        self.full_name = json_data.get('FullName')
-        self.short_name = json_data.get('ShortName')
+        self.abbr = intern(json_data.get('Abbreviation'))
+        self.campus = intern(json_data.get('CampusName'))
+        self.name = intern(json_data.get('Name'))
+        self.full_name = intern(json_data.get('FullName'))
+        self.short_name = intern(json_data.get('ShortName'))
 
     def __eq__(self, other):
         return (other is not None and
-                type(self) is type(other) and
+                _model_type(self) is _model_type(other) and
                 self.__key() == other.__key())
 
     def __key(self):
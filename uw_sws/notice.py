@@ -6,16 +6,23 @@ Interfaceing with the Student Web Service,
  for notice resource
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from dateutil import parser
+from functools import lru_cache
 import logging
 from uw_sws.models import Notice, NoticeAttribute
 from uw_sws import get_resource, SWS_TIMEZONE
+from uw_sws.worker import Worker
+from uw_sws.tracing import traced
 
 notice_res_url_prefix = "/student/v5/notice/"
 logger = logging.getLogger(__name__)
+NOTICE_ACTIVE = "active"
+NOTICE_UPCOMING = "upcoming"
+NOTICE_EXPIRED = "expired"
 
 
+@traced()
 def get_notices_by_regid(regid):
     """
     Returns a list of uw_sws.models.Notice objects
@@ -25,6 +32,52 @@ def get_notices_by_regid(regid):
     return _notices_from_json(get_resource(url))
 
 
+@traced()
+def get_notices_by_regids(regids, cmp_dt=None):
+    """
+    Concurrently fetches the notices for each of the passed regids.
+    Returns a dictionary of {regid: bucketed notices}, see bucket_notices.
+    Regids whose notices could not be fetched are omitted.
+    """
+    return {
+        regid: bucket_notices(notices, cmp_dt)
+        for regid, notices in NoticeGetter(regids).run_tasks().items()
+    }
+
+
+def bucket_notices(notices, cmp_dt=None):
+    """
+    Returns a dictionary with the passed uw_sws.models.Notice objects
+    grouped under "by_category" ({notice_category: [Notice]}) and
+    "by_window" ({"active"|"upcoming"|"expired": [Notice]}).
+    A notice is active from its Begin date through the end of its
+    End date; a notice without those attributes is always active.
+    """
+    if cmp_dt is None:
+        cmp_dt = datetime.now(timezone.utc)
+
+    by_category = {}
+    by_window = {NOTICE_ACTIVE: [], NOTICE_UPCOMING: [], NOTICE_EXPIRED: []}
+    for notice in notices:
+        by_category.setdefault(notice.notice_category, []).append(notice)
+        by_window[_notice_window(notice, cmp_dt)].append(notice)
+
+    return {"by_category": by_category, "by_window": by_window}
+
+
+def _notice_window(notice, cmp_dt):
+    for attribute in notice.attributes:
+        if attribute.data_type != "date":
+            continue
+        if attribute.name == "Begin" and cmp_dt < attribute._date_value:
+            return NOTICE_UPCOMING
+        if (attribute.name == "End" and
+                cmp_dt >= attribute._date_value + timedelta(days=1)):
+            return NOTICE_EXPIRED
+    return NOTICE_ACTIVE
+
+
+@lru_cache(maxsize=1024)
 def _str_to_utc(date_str):
     date = parser.parse(date_str)
     return datetime.combine(
@@ -79,17 +132,29 @@ def _associate_short_long(notices):
     If a notice is type ${1}Short, associate with its Long notice
     in an attribute called long_notice.
     """
+    notices_by_type = {}
+    for notice in notices:
+        notices_by_type.setdefault(notice.notice_type, notice)
+
     for notice in notices:
         if notice.notice_type is not None and\
                 notice.notice_category == "StudentFinAid" and\
                 notice.notice_type.endswith("Short"):
-            notice.long_notice = _find_notice_by_type(notices,
-                                                      notice.notice_type[:-5])
+            notice.long_notice = notices_by_type.get(
+                notice.notice_type[:-5])
     return notices
 
 
-def _find_notice_by_type(notices, type):
-    for notice in notices:
-        if notice.notice_type == type:
-            return notice
-    return None
+class NoticeGetter(Worker):
+    """
+    Get the notices for each regid in regid_set
+    """
+
+    def __init__(self, regid_set):
+        self.regid_list = list(regid_set or [])
+
+    def get_task_ids(self):
+        return self.regid_list
+
+    def task(self, tid):
+        return get_notices_by_regid(tid)
@@ -0,0 +1,155 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Detects N+1 request patterns: one logical operation issuing the same
+url template GET over and over from the same call site, where a batch
+or a cached lookup would do.
+
+Enable for a block of code with the nplusone_scope context manager, or
+for every operation with the NPLUSONE_DETECT setting ("warn" or "raise").
+Without an explicit scope, an operation is one call into this package
+from outside it, and a profile function on its thread ends the scope
+when that call returns, or for a generator, yields. NPLUSONE_THRESHOLD
+(default 5) is the number of same-site requests allowed per operation.
+"""
+import logging
+import os
+import sys
+import threading
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+from uw_sws.exceptions import NPlusOneError
+from uw_sws.metrics import url_template
+
+logger = logging.getLogger(__name__)
+
+NPLUSONE_WARN = "warn"
+NPLUSONE_RAISE = "raise"
+DEFAULT_THRESHOLD = 5
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_TEST_PATHS = (os.path.join(_PACKAGE_DIR, "tests"),
+               os.path.join(_PACKAGE_DIR, "test.py"))
+
+_scope = ContextVar("uw_sws_nplusone_scope", default=None)
+
+
+class Scope(object):
+    """
+    The request counts of one logical operation, by (url template,
+    call site). Only requests from the thread that opened the scope are
+    sequential; those from threads it fans out to are not counted.
+    """
+    def __init__(self, action, threshold, root=None):
+        self.action = action
+        self.threshold = threshold
+        self.root = root
+        self.thread_id = threading.get_ident()
+        self.counts = {}
+        self.reported = set()
+
+    def add(self, template, site):
+        key = (template, site)
+        count = self.counts.get(key, 0) + 1
+        self.counts[key] = count
+        return count
+
+
+@contextmanager
+def nplusone_scope(action=NPLUSONE_RAISE, threshold=DEFAULT_THRESHOLD):
+    """
+    Treats the block as one logical operation, and warns or raises
+    NPlusOneError when it repeats a GET more than threshold times.
+    """
+    token = _scope.set(Scope(action, threshold))
+    try:
+        yield _scope.get()
+    finally:
+        _scope.reset(token)
+
+
+def check_request(dao, url):
+    """
+    Counts a GET of url in the current operation.
+    """
+    scope = _scope.get()
+    if scope is None or scope.root is not None:
+        action = dao.get_service_setting("NPLUSONE_DETECT")
+        if not action:
+            return
+        root = _operation_root(sys._getframe(1))
+        if root is None:
+            return
+        if scope is None or scope.root is not root:
+            scope = Scope(action, int(dao.get_service_setting(
+                "NPLUSONE_THRESHOLD", DEFAULT_THRESHOLD)), root=root)
+            _end_on_return(root, _scope.set(scope))
+
+    if scope.thread_id != threading.get_ident():
+        return
+
+    frames = _package_frames(sys._getframe(1))
+    template = url_template(url)
+    site = tuple((f.f_code.co_filename, f.f_lineno) for f in frames)
+    count = scope.add(template, site)
+    if count <= scope.threshold or (template, site) in scope.reported:
+        return
+
+    scope.reported.add((template, site))
+    stack = "".join(traceback.format_stack(sys._getframe(1)))
+    message = ("{} GETs of {} from the same call site in one "
+               "operation".format(count, template))
+    if scope.action == NPLUSONE_RAISE:
+        raise NPlusOneError(message, template, count, stack)
+    logger.warning("%s\n%s", message, stack)
+
+
+def _end_on_return(root, token):
+    """
+    Resets the scope set with token when the root frame returns, so that
+    it does not keep the operation's stack alive. Without a free profile
+    hook on the thread, the scope lasts until the next operation.
+    """
+    previous = sys.getprofile()
+    if previous is not None and not getattr(previous, "nplusone", False):
+        return
+
+    def profile(frame, event, arg):
+        if event == "return" and frame is root:
+            sys.setprofile(None)
+            try:
+                _scope.reset(token)
+            except ValueError:  # returned in another context
+                pass
+    profile.nplusone = True
+    sys.setprofile(profile)
+
+
+def _in_package(frame):
+    filename = frame.f_code.co_filename
+    return (filename.startswith(_PACKAGE_DIR + os.sep) and
+            not filename.startswith(_TEST_PATHS))
+
+
+def _package_frames(frame):
+    frames = []
+    while frame is not None:
+        if _in_package(frame):
+            frames.append(frame)
+        frame = frame.f_back
+    return frames
+
+
+def _operation_root(frame):
+    """
+    Returns the outermost package frame of the call stack, which lives
+    for the duration of the operation.
+    """
+    root = None
+    while frame is not None:
+        if _in_package(frame):
+            root = frame
+        frame = frame.f_back
+    return root
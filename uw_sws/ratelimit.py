@@ -0,0 +1,214 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+A token-bucket limit on the aggregate rate of SWS requests.
+
+Requests are interactive by default; wrap batch work in
+request_priority(PRIORITY_BULK). Bulk requests leave a reserve of the
+bucket to interactive ones, so a batch job cannot starve them.
+
+Settings:
+    RATE_LIMIT: requests per second; 0 (the default) disables the limit
+    RATE_LIMIT_BURST: bucket size, defaults to one second of requests
+    RATE_LIMIT_BULK_RESERVE: fraction of the bucket bulk requests leave,
+        at most all but one token
+    RATE_LIMIT_FILE: a file whose memory-mapped bucket is shared by all
+        processes using it
+"""
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from uw_sws.deadline import current_deadline
+from uw_sws.exceptions import DeadlineExceeded
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+DEFAULT_BULK_RESERVE = 0.5
+
+_priority = ContextVar("uw_sws_request_priority",
+                       default=PRIORITY_INTERACTIVE)
+
+# {(rate, burst, reserve, path): TokenBucket}
+_limiters = {}
+_limiters_lock = Lock()
+
+
+@contextmanager
+def request_priority(priority):
+    """
+    Sends the SWS requests made in the block, including those from the
+    threads it fans out to, with the given priority.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority():
+    return _priority.get()
+
+
+class MemoryBucketState(object):
+    """
+    Bucket state held by this process.
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self._state = (0.0, 0.0)
+
+    @contextmanager
+    def locked(self):
+        with self._lock:
+            yield
+
+    def read(self):
+        return self._state
+
+    def write(self, tokens, updated):
+        self._state = (tokens, updated)
+
+
+class FileBucketState(object):
+    """
+    Bucket state memory-mapped from a file, and guarded by an exclusive
+    lock on it, so that processes sharing the file share one bucket.
+    """
+    FORMAT = "dd"
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise ImportError("RATE_LIMIT_FILE requires fcntl")
+        self.path = path
+        self._lock = Lock()
+        self._fd = None
+        self._map = None
+        self._pid = None
+
+    def _open(self):
+        """
+        Maps the file, once per process, as a lock on the file is held
+        by the open file, which forked processes would share.
+        """
+        if self._map is not None and self._pid == os.getpid():
+            return
+        size = struct.calcsize(self.FORMAT)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(fd).st_size < size:
+            os.ftruncate(fd, size)
+        self._map = mmap.mmap(fd, size)
+        self._fd = fd
+        self._pid = os.getpid()
+
+    @contextmanager
+    def locked(self):
+        with self._lock:
+            self._open()
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def read(self):
+        return struct.unpack_from(self.FORMAT, self._map, 0)
+
+    def write(self, tokens, updated):
+        struct.pack_into(self.FORMAT, self._map, 0, tokens, updated)
+
+
+class TokenBucket(object):
+    """
+    Refills at rate tokens per second up to burst. Each request takes a
+    token; bulk requests only take one while more than the reserve
+    remains.
+    """
+    def __init__(self, rate, burst=None, bulk_reserve=DEFAULT_BULK_RESERVE,
+                 state=None):
+        self.rate = float(rate)
+        self.burst = float(burst or max(1.0, self.rate))
+        # leaves bulk requests at least one token of the bucket
+        self.bulk_reserve = min(self.burst * float(bulk_reserve),
+                                max(0.0, self.burst - 1.0))
+        self.state = state or MemoryBucketState()
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    def take(self, priority=PRIORITY_INTERACTIVE, now=None):
+        """
+        Takes a token if one is available to the priority, returning 0,
+        or else returns the seconds until one will be.
+        """
+        now = time.time() if now is None else now
+        reserve = self.bulk_reserve if priority == PRIORITY_BULK else 0.0
+        with self.state.locked():
+            tokens, updated = self.state.read()
+            if updated <= 0:
+                tokens = self.burst
+            else:
+                tokens = min(self.burst,
+                             tokens + max(0.0, now - updated) * self.rate)
+            # allow for rounding in the refill arithmetic
+            if tokens - 1.0 >= reserve - 1e-9:
+                self.state.write(tokens - 1.0, now)
+                return 0.0
+            self.state.write(tokens, now)
+            return (reserve + 1.0 - tokens) / self.rate
+
+    def acquire(self, priority=None):
+        """
+        Blocks until a token is taken for the priority, by default the
+        current request priority. Raises DeadlineExceeded rather than
+        wait past the current deadline.
+        """
+        priority = priority or _priority.get()
+        deadline = current_deadline()
+        while True:
+            wait = self.take(priority)
+            if wait <= 0:
+                return
+            if deadline is not None:
+                remaining = deadline.remaining()
+                if remaining is not None and wait >= remaining:
+                    raise DeadlineExceeded(None, "rate limited past deadline")
+            self.waits += 1
+            self.wait_seconds += wait
+            time.sleep(wait)
+
+
+def get_limiter(dao):
+    """
+    Returns the TokenBucket configured for the dao, or None if requests
+    are not rate limited.
+    """
+    rate = float(dao.get_service_setting("RATE_LIMIT", 0) or 0)
+    if rate <= 0:
+        return None
+
+    key = (rate,
+           dao.get_service_setting("RATE_LIMIT_BURST"),
+           dao.get_service_setting("RATE_LIMIT_BULK_RESERVE",
+                                   DEFAULT_BULK_RESERVE),
+           dao.get_service_setting("RATE_LIMIT_FILE"))
+    limiter = _limiters.get(key)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(key)
+            if limiter is None:
+                path = key[3]
+                limiter = TokenBucket(
+                    rate, burst=key[1], bulk_reserve=key[2],
+                    state=FileBucketState(path) if path else None)
+                _limiters[key] = limiter
+    return limiter
@@ -0,0 +1,234 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Records SWS traffic into a gzipped json-lines archive, and replays
+an archive offline for load tests.
+
+Each exchange is appended to the archive as a gzip member of its own,
+in a single write under a lock on the file, so that the threads and
+processes recording to one archive do not interleave, and a process
+that is killed loses no more than the exchange it was recording.
+"""
+import atexit
+import gzip
+import json
+import os
+import time
+from base64 import b64decode, b64encode
+from threading import Lock
+from restclients_core.dao import DAOImplementation
+from restclients_core.models import MockHTTP
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+ARCHIVE_VERSION = 1
+
+# {archive path: Recorder}
+_recorders = {}
+_recorders_lock = Lock()
+
+
+def get_recorder(path):
+    """
+    Returns the shared Recorder appending to the archive at path.
+    """
+    with _recorders_lock:
+        recorder = _recorders.get(path)
+        if recorder is None:
+            recorder = Recorder(path)
+            _recorders[path] = recorder
+        return recorder
+
+
+@atexit.register
+def close_recorders():
+    """
+    Closes all open archives.
+    """
+    with _recorders_lock:
+        for recorder in _recorders.values():
+            recorder.close()
+        _recorders.clear()
+
+
+def read_archive(path):
+    """
+    Yields the recorded exchanges in the archive at path, in order.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as archive:
+        for line in archive:
+            if line.strip():
+                yield json.loads(line)
+
+
+class Recorder(object):
+    """
+    Appends one json line per exchange: method, url, status, response
+    headers, body and the backend duration in seconds.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = Lock()
+        self._fd = None
+        self._pid = None
+        self._closed = False
+
+    def _open(self):
+        """
+        Opens the archive, once per process, as a lock on the file is
+        held by the open file, which forked processes would share.
+        """
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path,
+                               os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def record(self, method, url, response, duration):
+        entry = {
+            "version": ARCHIVE_VERSION,
+            "method": method,
+            "url": url,
+            "status": response.status,
+            "headers": _response_headers(response),
+            "duration": round(duration, 6),
+        }
+        entry.update(_encode_body(response.data))
+        line = json.dumps(entry, separators=(",", ":"))
+        member = gzip.compress((line + "\n").encode("utf-8"))
+        with self._lock:
+            if self._closed:
+                return
+            fd = self._open()
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                view = memoryview(member)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = self._pid = None
+            self._closed = True
+
+
+class RecordingImplementation(DAOImplementation):
+    """
+    Wraps a DAO implementation, recording each exchange it loads.
+    Enable with the RECORD_PATH setting.
+    """
+    def __init__(self, backend, recorder):
+        super(RecordingImplementation, self).__init__(
+            backend._service_name, backend.dao)
+        self.backend = backend
+        self.recorder = recorder
+
+    def is_live(self):
+        return self.backend.is_live()
+
+    def is_mock(self):
+        return self.backend.is_mock()
+
+    def load(self, method, url, headers, body):
+        start = time.time()
+        response = self.backend.load(method, url, headers, body)
+        self.recorder.record(method, url, response, time.time() - start)
+        return response
+
+
+class ReplayDAO(DAOImplementation):
+    """
+    Serves the responses recorded in the REPLAY_FILE archive. Exchanges
+    recorded more than once for a url are served in rotation, and urls
+    missing from the archive get a 404. With REPLAY_TIMING, each
+    response is delayed by its recorded duration.
+    Enable with RESTCLIENTS_SWS_DAO_CLASS='uw_sws.recording.ReplayDAO'.
+    """
+    # {archive path: Replay}
+    _replays = {}
+    _lock = Lock()
+
+    def load(self, method, url, headers, body):
+        path = self.dao.get_service_setting("REPLAY_FILE")
+        with ReplayDAO._lock:
+            replay = ReplayDAO._replays.get(path)
+            if replay is None:
+                replay = Replay(path)
+                ReplayDAO._replays[path] = replay
+
+        entry = replay.next(method, url)
+        response = MockHTTP()
+        if entry is None:
+            response.status = 404
+            response.reason = "Not recorded"
+            response.data = ""
+            return response
+
+        if self.dao.get_service_setting("REPLAY_TIMING", False):
+            time.sleep(entry["duration"])
+
+        response.status = entry["status"]
+        response.headers = dict(entry["headers"])
+        response.data = _decode_body(entry)
+        return response
+
+
+class Replay(object):
+    """
+    The exchanges of an archive, indexed by (method, url).
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = Lock()
+        self._entries = {}
+        self._positions = {}
+        for entry in read_archive(path):
+            key = (entry["method"], entry["url"])
+            self._entries.setdefault(key, []).append(entry)
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    def next(self, method, url):
+        key = (method, url)
+        entries = self._entries.get(key)
+        if not entries:
+            return None
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        return entries[position % len(entries)]
+
+
+def _response_headers(response):
+    try:
+        return dict(response.headers or {})
+    except (TypeError, ValueError):
+        return {}
+
+
+def _encode_body(data):
+    if data is None:
+        return {"body": ""}
+    if isinstance(data, str):
+        return {"body": data}
+    try:
+        return {"body": data.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": b64encode(data).decode("ascii")}
+
+
+def _decode_body(entry):
+    if "body_b64" in entry:
+        return b64decode(entry["body_b64"])
+    return entry["body"]
@@ -7,19 +7,31 @@ Interfacing with the Student Web Service, Registration_Search query.
 import logging
 import json
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from queue import Empty, Queue
 from urllib.parse import urlencode
 from decimal import Decimal, InvalidOperation
-from uw_sws.models import Registration, RegistrationBlock, ClassSchedule
+from uw_sws.models import (
+    Registration, RegistrationBlock, ClassSchedule, SectionFailure)
 from restclients_core.exceptions import DataFailureException
 from restclients_core.thread import GenericPrefetchThread, generic_prefetch
-from uw_sws import get_resource, put_resource
-from uw_sws.exceptions import ThreadedDataError
+from uw_sws import (
+    get_resource, get_resource_items, get_resource_with_etag, put_resource)
+from uw_sws.deadline import current_deadline, deadline_scope
+from uw_sws.exceptions import DeadlineExceeded, ThreadedDataError
+from uw_sws.intern import unshared_term
 from uw_sws.compat import deprecation
-from uw_sws.enrollment import StudentMajorGetter
+from uw_sws.enrollment import (
+    StudentMajorGetter, get_majors_by_regid_and_term)
 from uw_sws.person import SWSPersonGetter
 from uw_sws.pws_person import PWSPersonGetter
-from uw_sws.thread import SWSCourseThread
+from uw_sws.thread import SWSCourseThread, join_thread
+from uw_sws.worker import Worker
+from uw_sws.lite import model_class, model_classes
 from uw_sws.section import _json_to_section, get_prefetch_for_section_data
+from uw_sws.tracing import span, traced
+from uw_sws.util import propagate_context
 
 registration_res_url_prefix = "/student/v5/registration.json"
 registration_block_url = "/student/v5/person/{}/registrationblock.json"
@@ -27,56 +39,138 @@ reg_credits_url_prefix = "/student/v5/registration/"
 logger = logging.getLogger(__name__)
 
 
+@traced()
 def get_active_registrations_by_section(section,
                                         transcriptable_course="",
                                         include_major_class_info=False,
-                                        use_pws_person=False):
+                                        use_pws_person=False,
+                                        timeout=None):
     """
     Returns a list of restclients.Registration objects, representing
     active registrations for the passed section. For independent study
     sections, section.independent_study_instructor_regid limits
-    registrations to that instructor.
+    registrations to that instructor. Raises DeadlineExceeded if not
+    done within timeout seconds.
     """
     return _registrations_for_section_with_active_flag(
         section,
         True,
         include_major_class_info,
         transcriptable_course,
-        use_pws_person
+        use_pws_person,
+        timeout
     )
 
 
+@traced()
 def get_all_registrations_by_section(section,
                                      transcriptable_course="",
                                      include_major_class_info=False,
-                                     use_pws_person=False):
+                                     use_pws_person=False,
+                                     timeout=None):
     """
     Returns a list of uw_sws.models.Registration objects,
     representing all (active and inactive) registrations for the passed
     section. For independent study sections,
     section.independent_study_instructor_regid limits registrations to
-    that instructor.
+    that instructor. Raises DeadlineExceeded if not done within timeout
+    seconds.
     """
     return _registrations_for_section_with_active_flag(
         section,
         False,
         include_major_class_info,
         transcriptable_course,
-        use_pws_person
+        use_pws_person,
+        timeout
     )
 
 
+@traced()
+def iter_active_registrations_by_section(section,
+                                         transcriptable_course="",
+                                         include_major_class_info=False,
+                                         use_pws_person=False,
+                                         timeout=None):
+    """
+    Incremental variant of get_active_registrations_by_section.
+    Yields uw_sws.models.Registration objects as they are decoded from
+    the response, with person (and major) lookups running concurrently.
+    Raises DeadlineExceeded if not done within timeout seconds of the
+    call.
+    """
+    return _iter_registrations_for_section_with_active_flag(
+        section,
+        True,
+        include_major_class_info,
+        transcriptable_course,
+        use_pws_person,
+        timeout
+    )
+
+
+@traced()
+def iter_all_registrations_by_section(section,
+                                      transcriptable_course="",
+                                      include_major_class_info=False,
+                                      use_pws_person=False,
+                                      timeout=None):
+    """
+    Incremental variant of get_all_registrations_by_section.
+    Yields uw_sws.models.Registration objects as they are decoded from
+    the response, with person (and major) lookups running concurrently.
+    Raises DeadlineExceeded if not done within timeout seconds of the
+    call.
+    """
+    return _iter_registrations_for_section_with_active_flag(
+        section,
+        False,
+        include_major_class_info,
+        transcriptable_course,
+        use_pws_person,
+        timeout
+    )
+
+
+def _iter_registrations_for_section_with_active_flag(section,
+                                                     is_active,
+                                                     include_major_class_info,
+                                                     transcriptable_course,
+                                                     use_pws_person,
+                                                     timeout=None):
+    """
+    Returns an iterator over the uw_sws.models.Registration objects of
+    a section, whose lookups run under a deadline of timeout seconds.
+    """
+    url = _registration_search_url(section, is_active, transcriptable_course)
+    logger.debug(f"Iterate registration: {url}")
+    with deadline_scope(timeout) as deadline:
+        return _iter_json_to_registrations(
+            get_resource_items(url, "Registrations"), section,
+            include_major_class_info, use_pws_person, deadline)
+
+
 def _registrations_for_section_with_active_flag(section,
                                                 is_active,
                                                 include_major_class_info,
                                                 transcriptable_course,
-                                                use_pws_person):
+                                                use_pws_person,
+                                                timeout=None):
     """
     Returns a list of all uw_sws.models.Registration objects
     for a section. There can be duplicates for a person.
     If is_active is True, the objects will have is_active set to True.
     Otherwise, is_active is undefined, and out of scope for this method.
     """
+    url = _registration_search_url(section, is_active, transcriptable_course)
+    logger.debug(f"Get registration: {url}")
+    with deadline_scope(timeout):
+        return _json_to_registrations(get_resource(url), section,
+                                      include_major_class_info,
+                                      use_pws_person)
+
+
+def _registration_search_url(section, is_active, transcriptable_course):
     instructor_reg_id = ""
     if (section.is_independent_study and
             section.independent_study_instructor_regid is not None):
@@ -96,12 +190,10 @@ def _registrations_for_section_with_active_flag(section,
     if transcriptable_course != "":
         params.append(("transcriptable_course", transcriptable_course,))
 
-    url = "{}?{}".format(registration_res_url_prefix, urlencode(params))
-    logger.debug(f"Get registration: {url}")
-    return _json_to_registrations(
-        get_resource(url), section, include_major_class_info, use_pws_person)
+    return "{}?{}".format(registration_res_url_prefix, urlencode(params))
 
 
+@traced()
 def _json_to_registrations(data,
                            section,
                            include_major_class_info,
@@ -111,8 +203,9 @@ def _json_to_registrations(data,
     """
     registrations = []
     regid_set = set()
+    registration_class = model_class(Registration)
     for reg_json in data.get("Registrations", []):
-        registration = Registration(data=reg_json)
+        registration = registration_class(data=reg_json)
         person_json = reg_json.get("Person", {})
         registration.regid = person_json.get("RegID")
         if not registration.regid:
@@ -144,12 +237,102 @@ def _json_to_registrations(data,
     return registrations
 
 
+def _iter_json_to_registrations(reg_items,
+                                section,
+                                include_major_class_info,
+                                use_pws_person,
+                                deadline=None):
+    """
+    Returns an iterator over uw_sws.models.Registration objects in
+    response order, whose person and major lookups run in the caller's
+    context, and wait no longer than deadline.
+    """
+    person_getter = (PWSPersonGetter(None) if use_pws_person
+                     else SWSPersonGetter(None))
+    get_majors = (propagate_context(get_majors_by_regid_and_term)
+                  if include_major_class_info else None)
+    return _iter_registrations(
+        reg_items, section, person_getter.concurrency,
+        propagate_context(person_getter.task), get_majors, deadline)
+
+
+def _iter_registrations(reg_items, section, max_workers, get_person,
+                        get_majors, deadline):
+    """
+    Yields uw_sws.models.Registration objects in response order. Person
+    and major lookups are submitted as each registration is decoded, and
+    at most a bounded window of unresolved registrations is held.
+    """
+    person_futures = {}
+    major_futures = {}
+    pending = deque()
+    registration_class = model_class(Registration)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for reg_json in reg_items:
+            registration = registration_class(data=reg_json)
+            person_json = reg_json.get("Person", {})
+            registration.regid = person_json.get("RegID")
+            if not registration.regid:
+                logger.error(f"Missing RegID in {person_json}")
+                continue
+            registration.section = section
+
+            regid = registration.regid
+            if regid not in person_futures:
+                person_futures[regid] = executor.submit(get_person, regid)
+                if get_majors is not None:
+                    major_futures[regid] = executor.submit(
+                        get_majors, regid, section.term)
+
+            pending.append(registration)
+            if len(pending) > max_workers * 4:
+                yield _resolve_registration(
+                    pending.popleft(), person_futures, major_futures,
+                    deadline)
+
+        while len(pending):
+            yield _resolve_registration(
+                pending.popleft(), person_futures, major_futures, deadline)
+
+
+def _resolve_registration(registration, person_futures, major_futures,
+                          deadline=None):
+    registration.person = _future_result(
+        person_futures[registration.regid], registration.regid, deadline)
+
+    major_future = major_futures.get(registration.regid)
+    if major_future is not None:
+        major_class = _future_result(
+            major_future, registration.regid, deadline)
+        if major_class:
+            registration.majors = major_class.get("majors")
+            registration.class_code = major_class.get("class_code")
+            registration.class_level = major_class.get("class_level")
+    return registration
+
+
+def _future_result(future, tid, deadline=None):
+    deadline = deadline or current_deadline()
+    try:
+        return future.result(
+            timeout=None if deadline is None else deadline.remaining())
+    except TimeoutError:
+        raise DeadlineExceeded(None, "lookup for {} not done".format(tid))
+    except DeadlineExceeded:
+        raise
+    except Exception as ex:
+        logger.error(f"Task failed for {tid}: {ex}")
+
+
+@traced()
 def get_registration_block_by_regid(regid):
     """
     Returns a uw_sws.models.RegistrationBlock object
     """
     url = registration_block_url.format(regid)
-    return RegistrationBlock(data=get_resource(url))
+    data, etag = get_resource_with_etag(url)
+    return RegistrationBlock(data=data, etag=etag)
 
 
 def update_registration_block(registration_block, actas_netid=None):
@@ -166,7 +349,72 @@ def update_registration_block(registration_block, actas_netid=None):
     return RegistrationBlock(data=data)
 
 
+@traced()
+def update_registration_blocks(registration_blocks,
+                               actas_netid=None,
+                               concurrency=None):
+    """
+    Concurrently updates the passed uw_sws.models.RegistrationBlock
+    objects, reusing the ETag each block was read with. An update that
+    fails with 412 Precondition Failed is retried once with a fresh ETag.
+    Returns a dictionary of {regid: RegistrationBlock} for the updated
+    blocks, or {regid: exception} for the failed ones.
+    """
+    return RegistrationBlockUpdater(
+        registration_blocks, actas_netid, concurrency).run_tasks()
+
+
+class RegistrationBlockUpdater(Worker):
+    """
+    PUT each registration block, using its cached ETag as If-Match
+    """
+
+    def __init__(self, registration_blocks, actas_netid=None,
+                 concurrency=None):
+        self.blocks = {}
+        for block in registration_blocks or []:
+            self.blocks[block.uwregid] = block
+        self.actas_netid = actas_netid
+        self._concurrency = concurrency
+
+    @property
+    def concurrency(self):
+        if self._concurrency:
+            return self._concurrency
+        return super(RegistrationBlockUpdater, self).concurrency
+
+    def get_task_ids(self):
+        return list(self.blocks.keys())
+
+    def task(self, tid):
+        block = self.blocks[tid]
+        try:
+            try:
+                return self._put(block, block.etag)
+            except DataFailureException as ex:
+                if ex.status != 412:
+                    raise
+            logger.info(f"Stale ETag for {tid}, retrying")
+            url = registration_block_url.format(tid)
+            etag = get_resource_with_etag(url)[1]
+            return self._put(block, etag or "*")
+        except Exception as ex:
+            logger.error(f"Update failed for {tid}: {ex}")
+            return ex
+
+    def _put(self, block, etag):
+        url = registration_block_url.format(block.uwregid)
+        headers = {}
+
+        if self.actas_netid:
+            headers["X-UW-Act-as"] = self.actas_netid
+
+        data = put_resource(url, headers, block.put_data(), etag=etag)
+        return RegistrationBlock(data=data)
+
+
 # This function won't work when the dup_code is not empty
+@traced()
 def get_credits_by_section_and_regid(section, regid):
     """
     Returns a uw_sws.models.Registration object
@@ -204,19 +452,27 @@ def get_credits_by_reg_url(url):
         pass
 
 
+@traced()
 def get_schedule_by_regid_and_term(regid, term,
                                    non_time_schedule_instructors=True,
                                    per_section_prefetch_callback=None,
                                    transcriptable_course="",
+                                   timeout=None,
+                                   partial=False,
                                    **kwargs):
     """
     Returns a uw_sws.models.ClassSchedule object
     for the regid and term passed in.
     transcriptable_course values: "{|yes|no|all}".
+    timeout: seconds to finish within, or else raise DeadlineExceeded;
+      the first section that fails to load stops the others.
+    partial: return the sections that loaded, with the rest in
+      schedule.failed_sections and term.credits_complete False, rather
+      than raise for a failed section (see retry_failed_sections).
     kwargs:
       instructor_reg_id="{instructor regid}"
       (to search the registration with an independent study instructor).
-    Exceptions: DataFailureException, ThreadedDataError
+    Exceptions: DataFailureException, ThreadedDataError, DeadlineExceeded
     """
 
     if "include_instructor_not_on_time_schedule" in kwargs:
@@ -238,49 +494,77 @@ def get_schedule_by_regid_and_term(regid, term,
 
     url = "{}?{}".format(registration_res_url_prefix, urlencode(params))
 
-    return _json_to_stud_reg_schedule(get_resource(url), term, regid,
-                                      non_time_schedule_instructors,
-                                      per_section_prefetch_callback)
+    with deadline_scope(timeout):
+        return _json_to_stud_reg_schedule(get_resource(url), term, regid,
+                                          non_time_schedule_instructors,
+                                          per_section_prefetch_callback,
+                                          partial)
 
 
+@traced()
 def _json_to_stud_reg_schedule(json_data, term, regid,
                                include_instructor_not_on_time_schedule=True,
-                               per_section_prefetch_callback=None):
+                               per_section_prefetch_callback=None,
+                               partial=False):
     sections = []
     sws_threads = []
-    term_credit_hours = Decimal("0.0")
+    failures = [] if partial else None
     registered_summer_terms = {}
     if len(json_data["Registrations"]) == 0:
         schedule = ClassSchedule()
         schedule.sections = sections
         schedule.term = term
+        schedule.failed_sections = []
         return schedule
 
-    try:
+    with deadline_scope() as deadline:
+        finished = set()
+        done = Queue()
         for registration in json_data["Registrations"]:
             thread = SWSCourseThread()
             thread.reg_json = registration
             thread.url = registration["Section"]["Href"]
             thread.headers = {"Accept": "application/json"}
+            thread.done = done
             thread.start()
             sws_threads.append(thread)
+            # Threads run inline have already finished: a failure among
+            # them stops the rest from being started
+            while not done.empty():
+                thread = done.get()
+                finished.add(thread)
+                _check_section_thread(thread, deadline, failures)
 
         # Get the course section resource
-        for thread in sws_threads:
-            thread.join()
-
+        with span("wait SWSCourseThread", count=len(sws_threads)):
+            while len(finished) < len(sws_threads):
+                try:
+                    thread = done.get(timeout=deadline.remaining())
+                except Empty:
+                    deadline.cancel()
+                    if failures is None:
+                        raise DeadlineExceeded(None, "sections not fetched")
+                    for thread in sws_threads:
+                        if thread not in finished:
+                            failures.append(_section_failure(
+                                thread.reg_json, DeadlineExceeded(
+                                    thread.url, "section not fetched")))
+                    break
+                finished.add(thread)
+                _check_section_thread(thread, deadline, failures)
+
+        loaded = [thread for thread in sws_threads
+                  if thread in finished and _section_loaded(thread)]
         try:
             section_prefetch = []
             seen_keys = {}
-            for thread in sws_threads:
-                response = thread.response
-                if response and response.status == 200:
-                    data = json.loads(response.data)
-                    sd_prefetch = get_prefetch_for_section_data(data)
-                    section_prefetch.extend(sd_prefetch)
-                    if per_section_prefetch_callback:
-                        client_callbacks = per_section_prefetch_callback(data)
-                        section_prefetch.extend(client_callbacks)
+            for thread in loaded:
+                data = json.loads(thread.response.data)
+                sd_prefetch = get_prefetch_for_section_data(data)
+                section_prefetch.extend(sd_prefetch)
+                if per_section_prefetch_callback:
+                    client_callbacks = per_section_prefetch_callback(data)
+                    section_prefetch.extend(client_callbacks)
 
                 if thread.reg_url is not None:
                     url = thread.reg_url
@@ -295,39 +579,39 @@ def _json_to_stud_reg_schedule(json_data, term, regid,
                     seen_keys[key] = True
                     thread = GenericPrefetchThread()
                     prefetch_method = entry[1]
-                    thread.method = prefetch_method
+                    thread.method = propagate_context(prefetch_method)
                     prefetch_threads.append(thread)
                     thread.start()
 
-            for thread in prefetch_threads:
-                thread.join()
+            with span("wait GenericPrefetchThread",
+                      count=len(prefetch_threads)):
+                for thread in prefetch_threads:
+                    join_thread(thread, deadline)
 
         except Exception as ex:
             # If there's a real problem, it'll come up in the data fetching
             # step - no need to raise an exception here
             pass
 
-        for thread in sws_threads:
-            response = thread.response
-            if not response:
-                raise DataFailureException(thread.url,
-                                           500,
-                                           thread.exception)
-            if response.status != 200:
-                raise ThreadedDataError(thread.url,
-                                        response.status,
-                                        response.data)
-
-            section = _json_to_section(json.loads(response.data), term,
-                                       include_instructor_not_on_time_schedule)
+        classes = model_classes()
+        for thread in loaded:
+            try:
+                if failures is None:
+                    deadline.check(thread.url)
+                section = _json_to_section(
+                    json.loads(thread.response.data), term,
+                    include_instructor_not_on_time_schedule, classes)
+            except DataFailureException as ex:
+                if failures is None:
+                    raise
+                failures.append(_section_failure(thread.reg_json, ex))
+                continue
 
             if len(section.summer_term):
                 registered_summer_terms[section.summer_term.lower()] = True
 
-            _add_registration_to_section(thread.reg_json, section)
-
-            if section.student_credits is not None:
-                term_credit_hours += section.student_credits
+            _add_registration_to_section(
+                thread.reg_json, section, classes[Registration])
 
             # For independent study courses, only include the one relevant
             # instructor
@@ -336,22 +620,100 @@ def _json_to_stud_reg_schedule(json_data, term, regid,
 
             sections.append(section)
 
-        term.credits = term_credit_hours
-        term.section_count = len(sections)
-        schedule = ClassSchedule()
-        schedule.sections = sections
-        schedule.term = term
-        schedule.registered_summer_terms = registered_summer_terms
-    except Exception as ex:
-        raise ex
+    schedule = ClassSchedule()
+    schedule.sections = sections
+    schedule.term = term
+    schedule.registered_summer_terms = registered_summer_terms
+    schedule.failed_sections = failures or []
+    _set_term_credits(schedule)
     return schedule
 
 
-def _add_registration_to_section(reg_json, section):
+def retry_failed_sections(schedule,
+                          include_instructor_not_on_time_schedule=True,
+                          timeout=None):
+    """
+    Loads the failed sections of a partial ClassSchedule into it,
+    leaving those that fail again in schedule.failed_sections.
+    Returns the schedule.
+    """
+    if not schedule.failed_sections:
+        return schedule
+
+    with deadline_scope(timeout):
+        retried = _json_to_stud_reg_schedule(
+            {"Registrations": [failure.reg_json
+                               for failure in schedule.failed_sections]},
+            schedule.term, None, include_instructor_not_on_time_schedule,
+            partial=True)
+
+    schedule.sections = schedule.sections + retried.sections
+    schedule.registered_summer_terms = dict(
+        schedule.registered_summer_terms, **retried.registered_summer_terms)
+    schedule.failed_sections = retried.failed_sections
+    _set_term_credits(schedule)
+    return schedule
+
+
+def _set_term_credits(schedule):
+    """
+    Totals the credits of the schedule's sections on its term, which
+    are incomplete while any section failed to load. A shared term is
+    copied first.
+    """
+    schedule.term = unshared_term(schedule.term)
+    term_credit_hours = Decimal("0.0")
+    for section in schedule.sections:
+        if section.student_credits is not None:
+            term_credit_hours += section.student_credits
+    schedule.term.credits = term_credit_hours
+    schedule.term.credits_complete = not schedule.failed_sections
+    schedule.term.section_count = len(schedule.sections)
+
+
+def _section_loaded(thread):
+    response = thread.response
+    return response is not None and response.status == 200
+
+
+def _check_section_thread(thread, deadline, failures=None):
+    """
+    Raises the error of a failed SWSCourseThread, first cancelling the
+    deadline so that section requests not yet sent are dropped. With a
+    failures list, the failure is added to it instead.
+    """
+    if _section_loaded(thread):
+        return
+
+    response = thread.response
+    if isinstance(thread.exception, DeadlineExceeded):
+        ex = thread.exception
+    elif not response:
+        ex = DataFailureException(thread.url, 500, thread.exception)
+    else:
+        ex = ThreadedDataError(thread.url, response.status, response.data)
+
+    if failures is not None:
+        failures.append(_section_failure(thread.reg_json, ex))
+        return
+    deadline.cancel()
+    raise ex
+
+
+def _section_failure(reg_json, ex):
+    failure = SectionFailure(url=reg_json["Section"]["Href"],
+                             status=getattr(ex, "status", None),
+                             message=str(getattr(ex, "msg", ex)))
+    failure.exception = ex
+    failure.reg_json = reg_json
+    return failure
+
+
+def _add_registration_to_section(reg_json, section, registration_class):
     """
-    Add the Registration object to section.
+    Add the Registration object, of registration_class, to section.
     """
-    registration = Registration(data=reg_json)
+    registration = registration_class(data=reg_json)
     section.registration = registration
     section.grade_date = registration.grade_date
     section.student_grade = registration.grade
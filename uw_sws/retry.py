@@ -0,0 +1,222 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Retries of failed SWS GET requests, with exponential jittered backoff,
+and a per url template circuit breaker that fails fast while an
+endpoint keeps failing.
+
+Settings (both off by default):
+    RETRY_ATTEMPTS: retries of a GET with a transient failure
+    RETRY_BACKOFF, RETRY_MAX_BACKOFF: backoff base and cap in seconds
+    RETRY_STATUSES: the statuses retried; 0 is a timeout or connection error
+    CIRCUIT_BREAKER_THRESHOLD: consecutive failures that open a circuit
+    CIRCUIT_BREAKER_RESET: seconds an open circuit waits before a probe
+"""
+import random
+import time
+from threading import Lock
+from restclients_core.exceptions import DataFailureException
+from uw_sws import metrics
+from uw_sws.deadline import current_deadline
+from uw_sws.exceptions import CircuitOpenError, DeadlineExceeded
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half-open"
+
+DEFAULT_RETRY_STATUSES = (0, 429, 502, 503, 504)
+# Statuses counting as an endpoint failure for the circuit breaker
+FAILURE_STATUSES = frozenset((0, 500, 502, 503, 504))
+
+
+class Circuit(object):
+    def __init__(self):
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+
+class CircuitBreaker(object):
+    """
+    The circuit state of each url template. An open circuit rejects
+    requests until reset seconds have passed, then lets a single probe
+    through: its success closes the circuit, its failure reopens it.
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self._circuits = {}
+
+    def before(self, template, reset):
+        """
+        Raises CircuitOpenError if a request to template must fail fast,
+        and returns True if the request is the probe of an open circuit.
+        """
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is None or circuit.state == CIRCUIT_CLOSED:
+                return False
+            if (circuit.state == CIRCUIT_OPEN and
+                    time.monotonic() - circuit.opened_at >= reset):
+                self._set_state(template, circuit, CIRCUIT_HALF_OPEN)
+                return True
+        raise CircuitOpenError(template)
+
+    def release(self, template):
+        """
+        Returns a half-open circuit to open, for a probe that ended with
+        neither a success nor a failure, so that the next request probes.
+        """
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is not None and circuit.state == CIRCUIT_HALF_OPEN:
+                self._set_state(template, circuit, CIRCUIT_OPEN)
+
+    def success(self, template):
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is None:
+                return
+            circuit.failures = 0
+            if circuit.state != CIRCUIT_CLOSED:
+                self._set_state(template, circuit, CIRCUIT_CLOSED)
+
+    def failure(self, template, threshold):
+        with self._lock:
+            circuit = self._circuits.get(template)
+            if circuit is None:
+                circuit = Circuit()
+                self._circuits[template] = circuit
+            circuit.failures += 1
+            if (circuit.state == CIRCUIT_HALF_OPEN or (
+                    circuit.state == CIRCUIT_CLOSED and
+                    circuit.failures >= threshold)):
+                circuit.opened_at = time.monotonic()
+                self._set_state(template, circuit, CIRCUIT_OPEN)
+
+    def state(self, template):
+        with self._lock:
+            circuit = self._circuits.get(template)
+            return CIRCUIT_CLOSED if circuit is None else circuit.state
+
+    def states(self):
+        """
+        Returns a dict of url template to circuit state, for the
+        templates that have failed.
+        """
+        with self._lock:
+            return {template: circuit.state
+                    for template, circuit in self._circuits.items()}
+
+    def reset(self):
+        with self._lock:
+            self._circuits = {}
+
+    def _set_state(self, template, circuit, state):
+        circuit.state = state
+        sink = metrics._sink
+        if sink is not None:
+            sink.circuit(template, state)
+
+
+BREAKER = CircuitBreaker()
+
+
+def backoff_delay(attempt, base, cap, response=None):
+    """
+    Returns the full-jitter backoff before retry number attempt (from 0),
+    or the response's Retry-After seconds when it is shorter than cap.
+    """
+    retry_after = _retry_after(response)
+    if retry_after is not None:
+        return min(retry_after, cap)
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def _retry_after(response):
+    if response is None or not response.headers:
+        return None
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
+def _statuses(value):
+    if isinstance(value, str):
+        return tuple(int(status) for status in value.split(",") if status)
+    return tuple(int(status) for status in value)
+
+
+def _record_status(template, threshold, status):
+    if status in FAILURE_STATUSES:
+        BREAKER.failure(template, threshold)
+    else:
+        BREAKER.success(template)
+
+
+def load_with_retries(dao, method, url, load):
+    """
+    Returns load(), retried for transient GET failures and guarded by
+    the circuit breaker, as configured.
+    """
+    attempts = (int(dao.get_service_setting("RETRY_ATTEMPTS", 0))
+                if method == "GET" else 0)
+    threshold = int(dao.get_service_setting("CIRCUIT_BREAKER_THRESHOLD", 0))
+    if not attempts and not threshold:
+        return load()
+
+    template = metrics.url_template(url)
+    retry_statuses = _statuses(dao.get_service_setting(
+        "RETRY_STATUSES", DEFAULT_RETRY_STATUSES))
+    base = float(dao.get_service_setting("RETRY_BACKOFF", 0.1))
+    cap = float(dao.get_service_setting("RETRY_MAX_BACKOFF", 2.0))
+    reset = float(dao.get_service_setting("CIRCUIT_BREAKER_RESET", 30))
+
+    attempt = 0
+    while True:
+        probe = BREAKER.before(template, reset) if threshold else False
+
+        response = None
+        recorded = False
+        try:
+            try:
+                response = load()
+                status = response.status
+            except DeadlineExceeded:
+                raise
+            except DataFailureException as ex:
+                status = ex.status
+                if threshold:
+                    _record_status(template, threshold, status)
+                    recorded = True
+                if attempt >= attempts or status not in retry_statuses:
+                    raise
+            except Exception:
+                if threshold:
+                    BREAKER.failure(template, threshold)
+                    recorded = True
+                raise
+            else:
+                if threshold:
+                    _record_status(template, threshold, status)
+                    recorded = True
+                if attempt >= attempts or status not in retry_statuses:
+                    return response
+        finally:
+            # a probe that recorded neither a success nor a failure
+            if probe and not recorded:
+                BREAKER.release(template)
+
+        sink = metrics._sink
+        if sink is not None:
+            sink.retry(method, template, status, attempt + 1)
+        delay = backoff_delay(attempt, base, cap, response)
+        deadline = current_deadline()
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if remaining is not None and delay >= remaining:
+                raise DeadlineExceeded(url, "no time left to retry")
+            deadline.check(url)
+        time.sleep(delay)
+        attempt += 1
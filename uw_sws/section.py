@@ -17,6 +17,10 @@ from uw_sws.term import get_term_by_year_and_quarter
 from uw_sws.models import (
     Section, SectionReference, FinalExam,
     SectionMeeting, GradeSubmissionDelegate, Person)
+from uw_sws.deadline import check_deadline, deadline_scope
+from uw_sws.intern import intern
+from uw_sws.lite import model_classes
+from uw_sws.tracing import traced
 
 
 course_url_pattern = re.compile(r'^\/student\/v5\/course\/')
@@ -43,6 +47,7 @@ def is_valid_sln(sln_str):
     return not (sln_str is None or sln_pattern.match(sln_str) is None)
 
 
+@traced()
 def get_sections_by_instructor_and_term(person,
                                         term,
                                         future_terms=0,
@@ -66,6 +71,7 @@ def get_sections_by_instructor_and_term(person,
     return _json_to_sectionref(data)
 
 
+@traced()
 def get_sections_by_delegate_and_term(person,
                                       term,
                                       future_terms=0,
@@ -89,6 +95,7 @@ def get_sections_by_delegate_and_term(person,
     return _json_to_sectionref(data)
 
 
+@traced()
 def get_sections_by_curriculum_and_term(curriculum, term):
     """
     Returns a list of uw_sws.models.SectionReference objects
@@ -102,6 +109,7 @@ def get_sections_by_curriculum_and_term(curriculum, term):
     return _json_to_sectionref(get_resource(url))
 
 
+@traced()
 def get_sections_by_building_and_term(building, term):
     """
     Returns a list of uw_sws.models.SectionReference objects
@@ -115,6 +123,7 @@ def get_sections_by_building_and_term(building, term):
     return _json_to_sectionref(get_resource(url))
 
 
+@traced()
 def get_changed_sections_by_term(changed_since_date, term, **kwargs):
     params = []
     for key in sorted(kwargs):
@@ -154,8 +163,8 @@ def _json_to_sectionref(data):
                 section_data["Year"], section_data["Quarter"])
         section = SectionReference(
             term=section_term,
-            curriculum_abbr=section_data["CurriculumAbbreviation"],
-            course_number=section_data["CourseNumber"],
+            curriculum_abbr=intern(section_data["CurriculumAbbreviation"]),
+            course_number=intern(section_data["CourseNumber"]),
             section_id=section_data["SectionID"],
             url=section_data["Href"])
         sections.append(section)
@@ -195,6 +204,7 @@ def _get_sections_by_person_and_term(person,
     return get_resource(url)
 
 
+@traced()
 def get_last_section_by_instructor_and_terms(person,
                                              term,
                                              future_terms,
@@ -222,6 +232,7 @@ def get_last_section_by_instructor_and_terms(person,
     return None
 
 
+@traced()
 def get_section_by_url(url,
                        include_instructor_not_on_time_schedule=True):
     """
@@ -237,6 +248,7 @@ def get_section_by_url(url,
             include_instructor_not_on_time_schedule))
 
 
+@traced()
 def get_section_by_label(label,
                          include_instructor_not_on_time_schedule=True):
     """
@@ -252,34 +264,44 @@ def get_section_by_label(label,
                               include_instructor_not_on_time_schedule)
 
 
+@traced()
 def get_linked_sections(section,
-                        include_instructor_not_on_time_schedule=True):
+                        include_instructor_not_on_time_schedule=True,
+                        timeout=None):
     """
     Returns a list of uw_sws.models.Section objects,
-    representing linked sections for the passed section.
+    representing linked sections for the passed section. Raises
+    DeadlineExceeded if not done within timeout seconds.
     """
     linked_sections = []
 
-    for url in section.linked_section_urls:
-        section = get_section_by_url(url,
-                                     include_instructor_not_on_time_schedule)
-        linked_sections.append(section)
+    with deadline_scope(timeout):
+        for url in section.linked_section_urls:
+            check_deadline(url)
+            section = get_section_by_url(
+                url, include_instructor_not_on_time_schedule)
+            linked_sections.append(section)
 
     return linked_sections
 
 
+@traced()
 def get_joint_sections(section,
-                       include_instructor_not_on_time_schedule=True):
+                       include_instructor_not_on_time_schedule=True,
+                       timeout=None):
     """
     Returns a list of uw_sws.models.Section objects,
-    representing joint sections for the passed section.
+    representing joint sections for the passed section. Raises
+    DeadlineExceeded if not done within timeout seconds.
     """
     joint_sections = []
 
-    for url in section.joint_section_urls:
-        section = get_section_by_url(url,
-                                     include_instructor_not_on_time_schedule)
-        joint_sections.append(section)
+    with deadline_scope(timeout):
+        for url in section.joint_section_urls:
+            check_deadline(url)
+            section = get_section_by_url(
+                url, include_instructor_not_on_time_schedule)
+            joint_sections.append(section)
 
     return joint_sections
 
@@ -307,13 +329,17 @@ def get_prefetch_for_section_data(section_data):
     return prefetch
 
 
+@traced()
 def _json_to_section(section_data,
                      term=None,
-                     include_instructor_not_on_time_schedule=True):
+                     include_instructor_not_on_time_schedule=True,
+                     classes=None):
     """
-    Returns a section model created from the passed json.
+    Returns a section model created from the passed json, of the
+    classes of model_classes(), if not passed.
     """
-    section = Section()
+    classes = classes or model_classes()
+    section = classes[Section]()
     if term is not None and (
             term.year == int(section_data["Course"]["Year"]) and
             term.quarter == section_data["Course"]["Quarter"]):
@@ -323,12 +349,12 @@ def _json_to_section(section_data,
             section_data["Course"]["Year"],
             section_data["Course"]["Quarter"])
 
-    section.curriculum_abbr = section_data["Course"][
-        "CurriculumAbbreviation"]
-    section.course_number = section_data["Course"]["CourseNumber"]
-    section.course_title = section_data["CourseTitle"]
+    section.curriculum_abbr = intern(section_data["Course"][
+        "CurriculumAbbreviation"])
+    section.course_number = intern(section_data["Course"]["CourseNumber"])
+    section.course_title = intern(section_data["CourseTitle"])
     section.course_title_long = section_data["CourseTitleLong"]
-    section.course_campus = section_data["CourseCampus"]
+    section.course_campus = intern(section_data["CourseCampus"])
     section.course_description = section_data["CourseDescription"]
     section.section_id = section_data["SectionID"]
     section.eos_cid = section_data.get("EOS_CID", None)
@@ -338,7 +364,7 @@ def _json_to_section(section_data,
     section.lms_ownership = section_data.get("LMSOwnership", None)
     section.is_independent_start = section_data.get("IsIndependentStart",
                                                     False)
-    section.section_type = section_data["SectionType"]
+    section.section_type = intern(section_data["SectionType"])
     if "independent study" == section.section_type or\
        "IS" == section.section_type:
         is_independent_study = True
@@ -348,9 +374,9 @@ def _json_to_section(section_data,
     section.is_independent_study = section_data.get(
         "IndependentStudy", is_independent_study)
 
-    section.credit_control = section_data.get("CreditControl", "")
-    section.end_date = str_to_date(section_data.get("EndDate"))
-    section.start_date = str_to_date(section_data.get("StartDate"))
+    section.credit_control = intern(section_data.get("CreditControl", ""))
+    section.end_date = intern(str_to_date(section_data.get("EndDate")))
+    section.start_date = intern(str_to_date(section_data.get("StartDate")))
     section.class_website_url = section_data.get("ClassWebsiteUrl")
 
     if is_valid_sln(section_data.get("SLN")):
@@ -390,7 +416,7 @@ def _json_to_section(section_data,
         url = joint_section_data["Href"]
         section.joint_section_urls.append(url)
 
-    section.grading_system = section_data['GradingSystem']
+    section.grading_system = intern(section_data['GradingSystem'])
     section.grade_submission_delegates = []
     for del_data in section_data["GradeSubmissionDelegates"]:
         try:
@@ -405,20 +431,21 @@ def _json_to_section(section_data,
         section.grade_submission_delegates.append(delegate)
 
     section.meetings = []
+    meeting_class = classes[SectionMeeting]
     for meeting_data in section_data["Meetings"]:
-        meeting = SectionMeeting()
+        meeting = meeting_class()
         meeting.section = section
         meeting.term = section.term
         meeting.meeting_index = meeting_data["MeetingIndex"]
-        meeting.meeting_type = meeting_data["MeetingType"]
+        meeting.meeting_type = intern(meeting_data["MeetingType"])
 
-        meeting.building = meeting_data["Building"]
+        meeting.building = intern(meeting_data["Building"])
         if meeting_data["BuildingToBeArranged"]:
             meeting.building_to_be_arranged = True
         else:
             meeting.building_to_be_arranged = False
 
-        meeting.room_number = meeting_data["RoomNumber"]
+        meeting.room_number = intern(meeting_data["RoomNumber"])
         if meeting_data["RoomToBeArranged"]:
             meeting.room_to_be_arranged = True
         else:
@@ -435,19 +462,17 @@ def _json_to_section(section_data,
 
         if (len(meeting_data["StartTime"]) and
                 meeting_data["StartTime"] != "00:00:00"):
-            meeting.start_time = meeting_data["StartTime"]
             # in case of "18:00:00", only keep hh:mm
-            if len(meeting.start_time) > 5:
-                meeting.start_time = meeting.start_time[:5]
+            meeting.start_time = intern(meeting_data["StartTime"][:5])
 
         if (len(meeting_data["EndTime"]) and
                 meeting_data["EndTime"] != "00:00:00"):
-            meeting.end_time = meeting_data["EndTime"]
-            if len(meeting.end_time) > 5:
-                meeting.end_time = meeting.end_time[:5]
+            meeting.end_time = intern(meeting_data["EndTime"][:5])
 
-        meeting.eos_start_date = str_to_date(meeting_data.get("EOS_StartDate"))
-        meeting.eos_end_date = str_to_date(meeting_data.get("EOS_EndDate"))
+        meeting.eos_start_date = intern(
+            str_to_date(meeting_data.get("EOS_StartDate")))
+        meeting.eos_end_date = intern(
+            str_to_date(meeting_data.get("EOS_EndDate")))
 
         meeting.instructors = []
         for instructor_data in meeting_data["Instructors"]:
@@ -575,7 +600,7 @@ def is_valid_section_label(label):
 
 
 def _set_summer_term(section_data, section):
-    section.summer_term = section_data.get("SummerTerm", "")
+    section.summer_term = intern(section_data.get("SummerTerm", ""))
     if (section.term.is_summer_quarter() and len(section.summer_term) == 0 and
             section.is_campus_pce() and not section.for_credit()):
         section.summer_term = "Full-term"
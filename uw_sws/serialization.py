@@ -0,0 +1,228 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+A compact, versioned binary format for the models, for caches shared by
+processes: dumps() a Term, Section, ClassSchedule or any other model,
+with the models, lists and dicts it refers to (meetings, instructors,
+registrations, ...), and loads() it back without re-parsing SWS json or
+repeating PWS lookups.
+
+Each model is written once, with its set fields by name, so that models
+shared within the graph stay shared, and cycles such as a meeting's
+section are kept. Lite and lazy models (see uw_sws.lite) keep their
+classes. The payload is marshalled, so data must only be loaded from a
+trusted store, by the same Python version that wrote it, which the
+header records; other data raises SerializationError.
+"""
+import datetime
+import marshal
+import struct
+import sys
+import weakref
+from decimal import Decimal
+from importlib import import_module
+from restclients_core.models import Model
+from uw_sws.exceptions import SerializationError
+from uw_sws.lite import (
+    LazyModel, LiteModel, model_attributes, model_fields)
+
+FORMAT_VERSION = 2
+# magic, format version, marshal version, Python major and minor version
+HEADER = struct.Struct(">4sBBBB")
+MAGIC = b"SWSM"
+PYTHON_VERSION = sys.version_info[:2]
+
+# Modules whose models can be serialized
+MODEL_MODULES = ("uw_sws.models", "uw_sws.lite", "uw_pws.models")
+
+# Tags of the values marshal cannot write; other tuples are TUPLE
+REF, TUPLE, DATE, DATETIME, TIME, DECIMAL, SET, FROZENSET = range(8)
+
+_PRIMITIVES = frozenset((type(None), bool, int, float, str, bytes))
+
+
+def dumps(obj):
+    """
+    Returns the bytes of obj and the models it refers to.
+    """
+    classes = []
+    class_ids = {}
+    shapes = []
+    shape_ids = {}
+    objects = []
+    refs = {}
+
+    def encode(value):
+        kind = type(value)
+        if kind in _PRIMITIVES:
+            return value
+        if kind is list:
+            return [encode(item) for item in value]
+        if kind is dict:
+            return {key: encode(item) for key, item in value.items()}
+        if kind is datetime.date:
+            return (DATE, value.toordinal())
+        if kind is datetime.datetime:
+            return (DATETIME, value.isoformat())
+        if kind is Decimal:
+            return (DECIMAL, str(value))
+        if kind is tuple:
+            return (TUPLE, [encode(item) for item in value])
+        if kind is datetime.time:
+            return (TIME, value.isoformat())
+        if kind is set or kind is frozenset:
+            return (SET if kind is set else FROZENSET,
+                    [encode(item) for item in value])
+        if isinstance(value, (Model, LiteModel, LazyModel)):
+            return (REF, encode_model(value))
+        raise SerializationError(
+            "Cannot serialize a {}".format(kind.__name__))
+
+    def encode_model(model):
+        index = refs.get(id(model))
+        if index is not None:
+            return index
+        index = refs[id(model)] = len(objects)
+        objects.append(None)
+
+        cls = type(model)
+        if cls not in class_ids:
+            if cls.__module__ not in MODEL_MODULES:
+                raise SerializationError(
+                    "Cannot serialize a {}".format(cls.__name__))
+            class_ids[cls] = len(classes)
+            classes.append("{}:{}".format(cls.__module__, cls.__qualname__))
+        names, values = _model_state(model)
+        shape = (class_ids[cls], names)
+        if shape not in shape_ids:
+            shape_ids[shape] = len(shapes)
+            shapes.append(shape)
+        objects[index] = [shape_ids[shape]] + [encode(value)
+                                               for value in values]
+        return index
+
+    root = encode(obj)
+    try:
+        payload = marshal.dumps((classes, shapes, objects, root))
+    except ValueError as ex:
+        raise SerializationError(str(ex))
+    return HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version,
+                       *PYTHON_VERSION) + payload
+
+
+def loads(data):
+    """
+    Returns the object serialized by dumps() in data.
+    """
+    try:
+        (magic, version, marshal_version,
+         *python_version) = HEADER.unpack_from(data)
+    except struct.error:
+        raise SerializationError("Not a serialized model")
+    if magic != MAGIC:
+        raise SerializationError("Not a serialized model")
+    if version != FORMAT_VERSION or marshal_version != marshal.version:
+        raise SerializationError(
+            "Unsupported format version {}.{}".format(
+                version, marshal_version))
+    if tuple(python_version) != PYTHON_VERSION:
+        raise SerializationError(
+            "Serialized by Python {}.{}".format(*python_version))
+    try:
+        return _decode(*marshal.loads(data[HEADER.size:]))
+    except SerializationError:
+        raise
+    except (EOFError, ValueError, TypeError, IndexError, KeyError):
+        raise SerializationError("Invalid serialized model")
+
+
+def _decode(classes, shapes, objects, root):
+    classes = [_model_class(name) for name in classes]
+    shapes = [(classes[class_id], names) for class_id, names in shapes]
+    models = [shapes[values[0]][0].__new__(shapes[values[0]][0])
+              for values in objects]
+
+    def decode(value):
+        kind = type(value)
+        if kind is list:
+            return [decode(item) for item in value]
+        if kind is dict:
+            return {key: decode(item) for key, item in value.items()}
+        if kind is not tuple:
+            return value
+        tag, item = value
+        if tag == REF:
+            return models[item]
+        if tag == DATE:
+            return datetime.date.fromordinal(item)
+        if tag == DATETIME:
+            return datetime.datetime.fromisoformat(item)
+        if tag == DECIMAL:
+            return Decimal(item)
+        if tag == TUPLE:
+            return tuple(decode(i) for i in item)
+        if tag == TIME:
+            return datetime.time.fromisoformat(item)
+        if tag == SET:
+            return set(decode(i) for i in item)
+        if tag == FROZENSET:
+            return frozenset(decode(i) for i in item)
+        raise SerializationError("Invalid serialized model")
+
+    for model, values in zip(models, objects):
+        _set_model_state(model, shapes[values[0]][1],
+                         [decode(value) for value in values[1:]])
+    return decode(root)
+
+
+def _model_class(name):
+    module, qualname = name.split(":")
+    if module not in MODEL_MODULES:
+        raise SerializationError("Cannot load a {}".format(name))
+    cls = getattr(import_module(module), qualname, None)
+    if not (isinstance(cls, type) and
+            issubclass(cls, (Model, LiteModel, LazyModel))):
+        raise SerializationError("Cannot load a {}".format(name))
+    return cls
+
+
+def _model_state(model):
+    """
+    Returns a tuple of the names of the model's attributes and a list
+    of their values.
+    """
+    if isinstance(model, LazyModel):
+        values = model.hydrate()._values
+        return tuple(values), list(values.values())
+    if isinstance(model, LiteModel):
+        names = tuple(name for name, default in model._defaults)
+        return names, [getattr(model, name) for name in names]
+
+    attributes = model_attributes(model)
+    return tuple(attributes), list(attributes.values())
+
+
+def _set_model_state(model, names, values):
+    if isinstance(model, LazyModel):
+        return model.__setstate__(dict(zip(names, values)))
+    if isinstance(model, LiteModel):
+        for name, value in model._defaults:
+            setattr(model, name, value)
+        for name, value in zip(names, values):
+            setattr(model, name, value)
+        return
+
+    by_name = model_fields(type(model))[1]
+    field_values = {}
+    dynamic_fields = set()
+    state = vars(model)
+    state.update(initialized=True, _field_values=field_values,
+                 _dynamic_fields=dynamic_fields)
+    for name, value in zip(names, values):
+        field = by_name.get(name)
+        if field is None:
+            state[name] = value
+        else:
+            field_values[field[0]] = value
+            dynamic_fields.add(weakref.ref(field[1]))
@@ -0,0 +1,314 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+A store of cached responses in a memory-mapped file, for the processes
+of one host to share: a response fetched by one worker is read by the
+others from shared memory, and held once per host.
+
+The file holds a header, an index of fixed-size slots, and a circular
+log of records (url, etag and data). A url is indexed by a 64-bit hash
+in one of PROBE consecutive slots. Writers append the record, then
+publish its slot, under an exclusive lock on the file; before a record
+is overwritten on a later lap of the log, the slots pointing into it
+are retracted. Readers take no lock: each slot has a sequence number,
+odd while it is being written, which a reader checks before and after
+copying the record, retrying or missing if it changed.
+"""
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from hashlib import blake2b
+from threading import Lock
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+FORMAT_VERSION = 1
+MAGIC = b"SWSC"
+DEFAULT_SIZE = 64 * 1024 * 1024
+DEFAULT_SLOTS = 8192
+PROBE = 8
+RETRIES = 3
+
+# magic, version, slots, log size, log head
+HEADER = struct.Struct("<4sIIQQ")
+HEADER_SIZE = 64
+HEAD = struct.Struct("<Q")
+HEAD_OFFSET = HEADER.size - HEAD.size
+# sequence, url hash, record offset, record length, expires, stored
+SLOT = struct.Struct("<IQQIdd")
+SEQUENCE = struct.Struct("<I")
+# url, etag and data lengths
+RECORD = struct.Struct("<HHI")
+NO_EXPIRY = float("inf")
+
+
+def url_hash(url):
+    value = int.from_bytes(
+        blake2b(url.encode("utf-8"), digest_size=8).digest(), "little")
+    return value or 1
+
+
+class SharedMemoryStore(object):
+    """
+    Entries in a memory-mapped file of size bytes, created with the
+    given number of slots unless it exists. A record larger than an
+    eighth of the log is not stored.
+    """
+    def __init__(self, path, size=DEFAULT_SIZE, slots=DEFAULT_SLOTS):
+        if fcntl is None:
+            raise ImportError("A shared memory cache requires fcntl")
+        self.path = path
+        self.size = size
+        self.slots = slots
+        self._lock = Lock()
+        self._fd = None
+        self._map = None
+        self._pid = None
+
+    def _open(self):
+        """
+        Maps the file, once per process, as a lock on the file is held
+        by the open file, which forked processes would share.
+        """
+        if self._map is not None and self._pid == os.getpid():
+            return self._map
+        with self._lock:
+            if self._map is None or self._pid != os.getpid():
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    self._init_file(fd)
+                    self._map = mmap.mmap(fd, os.fstat(fd).st_size)
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                self._fd = fd
+                self._pid = os.getpid()
+        return self._map
+
+    def _init_file(self, fd):
+        header = os.pread(fd, HEADER.size, 0)
+        if len(header) == HEADER.size:
+            magic, version, slots, log_size, head = HEADER.unpack(header)
+            if magic == MAGIC and version == FORMAT_VERSION:
+                self.slots = slots
+                self._set_layout(log_size)
+                return
+        log_size = self.size - HEADER_SIZE - self.slots * SLOT.size
+        if log_size < RECORD.size:
+            raise ValueError("A shared cache of {} bytes is too small for "
+                             "{} slots".format(self.size, self.slots))
+        os.ftruncate(fd, 0)
+        os.ftruncate(fd, self.size)
+        os.pwrite(fd, HEADER.pack(MAGIC, FORMAT_VERSION, self.slots,
+                                  log_size, 0), 0)
+        self._set_layout(log_size)
+
+    def _set_layout(self, log_size):
+        self.log_size = log_size
+        self._log = HEADER_SIZE + self.slots * SLOT.size
+
+    @contextmanager
+    def _locked(self):
+        shared = self._open()
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield shared
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _probe(self, hashed):
+        start = hashed % self.slots
+        for i in range(PROBE):
+            yield (start + i) % self.slots
+
+    def _read(self, shared, index, hashed):
+        """
+        Returns the (record, expires) in the slot, if it holds hashed.
+        """
+        position = HEADER_SIZE + index * SLOT.size
+        for attempt in range(RETRIES):
+            (sequence, slot_hash, offset, length, expires,
+             stored) = SLOT.unpack_from(shared, position)
+            if sequence & 1:
+                continue
+            if slot_hash != hashed:
+                return None
+            start = self._log + offset
+            record = shared[start:start + length]
+            if SEQUENCE.unpack_from(shared, position)[0] == sequence:
+                return record, expires
+        return None
+
+    def _find(self, shared, url):
+        """
+        Returns the slot and entry of url, or None.
+        """
+        hashed = url_hash(url)
+        for index in self._probe(hashed):
+            found = self._read(shared, index, hashed)
+            if found is not None:
+                entry = _entry(found[0], url, found[1])
+                if entry is not None:
+                    return index, entry
+        return None
+
+    def get(self, url):
+        found = self._find(self._open(), url)
+        return found[1] if found is not None else None
+
+    def set(self, url, entry):
+        data, etag, expires = entry
+        url_bytes = url.encode("utf-8")
+        etag_bytes = (etag or "").encode("utf-8")
+        record = b"".join([
+            RECORD.pack(len(url_bytes), len(etag_bytes), len(data)),
+            url_bytes, etag_bytes, data])
+        hashed = url_hash(url)
+
+        with self._locked() as shared:
+            if len(record) > self.log_size // 8:
+                return
+            head = HEAD.unpack_from(shared, HEAD_OFFSET)[0]
+            if head + len(record) > self.log_size:
+                head = 0
+            self._retract(shared, head, head + len(record))
+            start = self._log + head
+            shared[start:start + len(record)] = record
+            self._publish(shared, self._slot_for(shared, hashed),
+                          hashed, head, len(record),
+                          NO_EXPIRY if expires is None else expires,
+                          time.time())
+            HEAD.pack_into(shared, HEAD_OFFSET, head + len(record))
+
+    def _slot_for(self, shared, hashed):
+        """
+        Returns the slot to write url to: its own, else a free or expired
+        one, else the least recently stored.
+        """
+        now = time.time()
+        free = oldest = None
+        oldest_stored = NO_EXPIRY
+        for index in self._probe(hashed):
+            (sequence, slot_hash, offset, length, expires,
+             stored) = SLOT.unpack_from(shared, HEADER_SIZE +
+                                        index * SLOT.size)
+            if slot_hash == hashed:
+                return index
+            if free is None and (slot_hash == 0 or expires <= now):
+                free = index
+            if stored < oldest_stored:
+                oldest, oldest_stored = index, stored
+        return free if free is not None else oldest
+
+    def _publish(self, shared, index, hashed, offset, length, expires,
+                 stored):
+        position = HEADER_SIZE + index * SLOT.size
+        sequence = SEQUENCE.unpack_from(shared, position)[0]
+        # odd while the slot is written
+        SEQUENCE.pack_into(shared, position, (sequence + 1) & 0xffffffff)
+        SLOT.pack_into(shared, position, (sequence + 1) & 0xffffffff,
+                       hashed, offset, length, expires, stored)
+        SEQUENCE.pack_into(shared, position, (sequence + 2) & 0xffffffff)
+
+    def _retract(self, shared, start, end):
+        """
+        Frees the slots of the records overlapping the log from start to
+        end.
+        """
+        for index, slot in self._slots(shared):
+            offset, length = slot[2], slot[3]
+            if slot[1] and offset < end and offset + length > start:
+                self._free(shared, index)
+
+    def _free(self, shared, index):
+        self._publish(shared, index, 0, 0, 0, 0.0, 0.0)
+
+    def _slots(self, shared):
+        return enumerate(struct.iter_unpack(
+            SLOT.format, shared[HEADER_SIZE:self._log]))
+
+    def delete(self, url):
+        with self._locked() as shared:
+            found = self._find(shared, url)
+            if found is not None:
+                self._free(shared, found[0])
+
+    def items(self, limit, now=None):
+        """
+        Returns up to limit (url, entry) pairs of unexpired entries, the
+        most recently stored first.
+        """
+        now = time.time() if now is None else now
+        shared = self._open()
+        found = []
+        for index, slot in self._slots(shared):
+            if slot[1] and slot[4] > now:
+                found.append((slot[5], index, slot[1]))
+        items = []
+        for stored, index, hashed in sorted(found, reverse=True):
+            read = self._read(shared, index, hashed)
+            if read is None:
+                continue
+            url = _record_url(read[0])
+            entry = _entry(read[0], url, read[1])
+            if entry is not None and url_hash(url) == hashed:
+                items.append((url, entry))
+                if len(items) >= limit:
+                    break
+        return items
+
+    def purge(self, now=None):
+        """
+        Frees the slots of expired entries.
+        """
+        now = time.time() if now is None else now
+        with self._locked() as shared:
+            for index, slot in self._slots(shared):
+                if slot[1] and slot[4] <= now:
+                    self._free(shared, index)
+
+    def clear(self):
+        with self._locked() as shared:
+            for index, slot in self._slots(shared):
+                if slot[1]:
+                    self._free(shared, index)
+            HEAD.pack_into(shared, HEAD_OFFSET, 0)
+
+    def close(self):
+        with self._lock:
+            if self._map is not None and self._pid == os.getpid():
+                self._map.close()
+                os.close(self._fd)
+            self._map = self._fd = self._pid = None
+
+
+def _record_url(record):
+    if len(record) < RECORD.size:
+        return ""
+    url_length = RECORD.unpack_from(record)[0]
+    return record[RECORD.size:RECORD.size + url_length].decode(
+        "utf-8", "replace")
+
+
+def _entry(record, url, expires):
+    """
+    Returns the (data, etag, expires) of the record, if it is url's.
+    """
+    if len(record) < RECORD.size:
+        return None
+    url_length, etag_length, data_length = RECORD.unpack_from(record)
+    etag_start = RECORD.size + url_length
+    data_start = etag_start + etag_length
+    if (data_start + data_length != len(record) or
+            record[RECORD.size:etag_start] != url.encode("utf-8")):
+        return None
+    etag = record[etag_start:data_start].decode("utf-8") or None
+    return (record[data_start:], etag,
+            None if expires == NO_EXPIRY else expires)
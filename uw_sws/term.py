@@ -7,6 +7,9 @@ This class interfaces with the Student Web Service, Term resource.
 import logging
 from uw_sws import get_resource, QUARTER_SEQ
 from uw_sws.models import Term
+from uw_sws.intern import REGISTRY, shared_terms_enabled
+from uw_sws.lite import model_class
+from uw_sws.tracing import traced
 from restclients_core.exceptions import DataFailureException
 
 
@@ -14,6 +17,7 @@ term_res_url_prefix = "/student/v5/term"
 logger = logging.getLogger(__name__)
 
 
+@traced()
 def get_term_by_year_and_quarter(year, quarter):
     """
     Returns a uw_sws.models.Term object,
@@ -21,16 +25,17 @@ def get_term_by_year_and_quarter(year, quarter):
     """
     url = "{}/{},{}.json".format(
         term_res_url_prefix, year, quarter.lower())
-    return Term(data=get_resource(url))
+    return _json_to_term(get_resource(url))
 
 
+@traced()
 def get_current_term():
     """
     Returns a uw_sws.models.Term object,
     for the current term.
     """
     url = "{}/current.json".format(term_res_url_prefix)
-    term = Term(data=get_resource(url))
+    term = _json_to_term(get_resource(url))
 
     # A term doesn't become "current" until 2 days before the start of
     # classes.  That's too late to be useful, so if we're after the last
@@ -40,6 +45,7 @@ def get_current_term():
     return term
 
 
+@traced()
 def get_next_term():
     """
     Returns a uw_sws.models.Term object,
@@ -48,6 +54,7 @@ def get_next_term():
     return get_term_after(get_current_term())
 
 
+@traced()
 def get_previous_term():
     """
     Returns a uw_sws.models.Term object,
@@ -62,7 +69,7 @@ def get_next_term_sws():
     for the term in next.json.
     """
     url = "{}/next.json".format(term_res_url_prefix)
-    return Term(data=get_resource(url))
+    return _json_to_term(get_resource(url))
 
 
 def get_previous_term_sws():
@@ -71,7 +78,7 @@ def get_previous_term_sws():
     for the term in previous.json.
     """
     url = "{}/previous.json".format(term_res_url_prefix)
-    return Term(data=get_resource(url))
+    return _json_to_term(get_resource(url))
 
 
 def get_term_before(aterm):
@@ -105,6 +112,7 @@ def get_term_after(aterm):
     return get_term_by_year_and_quarter(next_year, next_quarter)
 
 
+@traced()
 def get_term_by_date(date):
     """
     Returns a term for the datetime.date object given.
@@ -159,3 +167,17 @@ def get_next_non_summer_term(term):
     if next_term.is_summer_quarter():
         return get_next_autumn_term(next_term)
     return next_term
+
+
+def _json_to_term(data):
+    """
+    Returns a Term for the term resource json, shared with the other
+    models referring to it when the SHARED_TERMS setting is on.
+    """
+    if shared_terms_enabled():
+        return REGISTRY.term(data, _build_term)
+    return _build_term(data)
+
+
+def _build_term(data):
+    return model_class(Term)(data=data)
@@ -0,0 +1,15 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from restclients_core.models import MockHTTP
+
+
+def mock_response(status=200, data="{}", headers=None):
+    """
+    Returns a MockHTTP response, as returned by the DAO.
+    """
+    response = MockHTTP()
+    response.status = status
+    response.data = data
+    response.headers = headers or {}
+    return response
@@ -0,0 +1,201 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from threading import Event, Thread
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+from commonconf import override_settings
+from uw_sws import DAO, get_resource
+from uw_sws.cache import (
+    MemoryCache, ResponseCache, SQLiteStore, get_cache)
+from uw_sws.term import get_term_by_year_and_quarter
+from uw_sws.tests.helpers import mock_response
+from uw_sws.ttl import DAY, CacheRule, TTLPolicy
+
+TERM_URL = "/student/v5/term/2013,spring.json"
+SECTION_URL = "/student/v5/course/2013,spring,MATH,125/H.json"
+REGISTRATION_URL = (
+    "/student/v5/registration.json?curriculum_abbreviation=MATH"
+    "&course_number=125&verbose=true&year=2013&quarter=spring"
+    "&is_active=true&section_id=H")
+
+
+class ResponseCacheTest(TestCase):
+    def test_memory(self):
+        cache = ResponseCache(MemoryCache(2))
+        self.assertIsNone(cache.get(TERM_URL))
+        cache.set(TERM_URL, mock_response(
+            data=b'{"Year": 2013}', headers={"ETag": "1"}), now=100)
+        cached = cache.get(TERM_URL, now=200)
+        self.assertEqual(cached.data, b'{"Year": 2013}')
+        self.assertEqual(cached.headers, {"ETag": "1"})
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+        # expired
+        self.assertIsNone(cache.get(TERM_URL, now=100 + DAY))
+
+        # not cached by any rule
+        cache.set("/student/v5/notice/1.json", mock_response(data=b"{}"))
+        self.assertIsNone(cache.get("/student/v5/notice/1.json"))
+
+        # least recently used
+        cache.set(TERM_URL, mock_response(data=b"{}"))
+        cache.set(SECTION_URL, mock_response(data=b"{}"))
+        cache.get(TERM_URL)
+        cache.set(REGISTRATION_URL, mock_response(data=b"{}"))
+        self.assertIsNotNone(cache.get(TERM_URL))
+        self.assertIsNone(cache.get(SECTION_URL))
+
+        cache.delete(TERM_URL)
+        self.assertIsNone(cache.get(TERM_URL))
+
+    def test_store(self):
+        with TemporaryDirectory() as path:
+            path = os.path.join(path, "sws.db")
+            policy = TTLPolicy((CacheRule(r"term", DAY, persist=True),
+                                CacheRule(r"course", None)))
+            cache = ResponseCache(MemoryCache(10), SQLiteStore(path), policy)
+            cache.set(TERM_URL, mock_response(
+                data=b'{"Year": 2013}', headers={"ETag": "1"}))
+            cache.set(SECTION_URL, mock_response(data=b"{}"))
+            self.assertEqual(len(cache.memory), 2)
+
+            # a restarted process
+            restarted = ResponseCache(
+                MemoryCache(10), SQLiteStore(path), cache.policy)
+            self.assertIsNone(restarted.get(SECTION_URL))
+            self.assertEqual(restarted.get(TERM_URL).data, b'{"Year": 2013}')
+            self.assertEqual(len(restarted.memory), 1)
+
+            restarted = ResponseCache(
+                MemoryCache(10), SQLiteStore(path), cache.policy)
+            self.assertEqual(restarted.warm(), 1)
+            self.assertEqual(restarted.memory.get(TERM_URL)[1], "1")
+
+            restarted.store.set(SECTION_URL, (b"{}", None, 1.0))
+            self.assertIsNone(restarted.get(SECTION_URL))
+            restarted.store.purge()
+            self.assertIsNone(restarted.store.get(SECTION_URL))
+
+            restarted.clear()
+            self.assertIsNone(cache.store.get(TERM_URL))
+
+
+class StaleWhileRevalidateTest(TestCase):
+    def test_stale(self):
+        cache = ResponseCache(MemoryCache(10), max_stale=60)
+        cache.set(TERM_URL, mock_response(data=b"1"), now=100)
+        loaded = Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            loaded.wait(5)
+            return mock_response(data=b"2")
+
+        # served stale, while one thread refreshes
+        for i in range(5):
+            self.assertEqual(
+                cache.fetch(TERM_URL, load, now=100 + DAY + 30).data, b"1")
+        self.assertIsNone(cache.get(TERM_URL, now=100 + DAY + 30))
+        loaded.set()
+        self._wait_refreshed(cache)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stale_hits, 5)
+        self.assertEqual(cache.refreshes, 1)
+        self.assertEqual(cache.fetch(TERM_URL, load).data, b"2")
+
+        # too stale
+        cache.set(TERM_URL, mock_response(data=b"1"), now=100)
+        self.assertEqual(
+            cache.fetch(TERM_URL, load, now=100 + DAY + 61).data, b"2")
+        self.assertEqual(len(calls), 2)
+
+    def test_failed_refresh(self):
+        cache = ResponseCache(MemoryCache(10), max_stale=60)
+        cache.set(TERM_URL, mock_response(data=b"1"), now=100)
+
+        def load():
+            raise Exception("unavailable")
+
+        with self.assertLogs("uw_sws.cache", "WARNING"):
+            self.assertEqual(
+                cache.fetch(TERM_URL, load, now=100 + DAY).data, b"1")
+            self._wait_refreshed(cache)
+        self.assertEqual(cache.refreshes, 0)
+        self.assertEqual(cache.fetch(TERM_URL, load, now=100 + DAY).data,
+                         b"1")
+        self._wait_refreshed(cache)
+
+    def test_dogpile_lock(self):
+        cache = ResponseCache(MemoryCache(10))
+        calls = []
+        started = Event()
+        loaded = Event()
+
+        def load():
+            calls.append(1)
+            started.set()
+            loaded.wait(5)
+            return mock_response(data=b"1")
+
+        results = []
+        threads = [Thread(target=lambda: results.append(
+            cache.fetch(TERM_URL, load).data)) for i in range(8)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        loaded.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(results, [b"1"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache._loads, {})
+
+        # not cached
+        self.assertEqual(cache.fetch("/student/v5/notice/1.json", load).data,
+                         b"1")
+        self.assertEqual(len(calls), 2)
+
+    def _wait_refreshed(self, cache):
+        for i in range(500):
+            if not cache._refreshing:
+                return
+            Event().wait(0.01)
+        self.fail("not refreshed")
+
+
+class CacheSettingsTest(TestCase):
+    def test_get_cache(self):
+        self.assertIsNone(get_cache(DAO))
+        with TemporaryDirectory() as path:
+            path = os.path.join(path, "sws.db")
+            with override_settings(
+                    RESTCLIENTS_SWS_CACHE_MEMORY_SIZE=100,
+                    RESTCLIENTS_SWS_CACHE_PATH=path,
+                    RESTCLIENTS_SWS_CACHE_RULES=[
+                        ["campus", 60, False]],
+                    RESTCLIENTS_SWS_CACHE_MAX_STALE=0):
+                cache = get_cache(DAO)
+                self.assertIs(get_cache(DAO), cache)
+                self.assertEqual(cache.max_stale, 0)
+                self.assertTrue(cache.lock)
+                self.assertEqual(cache.policy.rules[0].ttl, 60)
+
+                with mock.patch.object(DAO, "getURL",
+                                       wraps=DAO.getURL) as mock_get:
+                    term = get_term_by_year_and_quarter(2013, "spring")
+                    self.assertEqual(
+                        get_term_by_year_and_quarter(2013, "spring"), term)
+                    get_resource("/student/v5/campus.json")
+                    get_resource("/student/v5/campus.json")
+                    self.assertEqual(mock_get.call_count, 2)
+                self.assertIsNotNone(cache.policy.calendar((2013, "spring")))
+                self.assertEqual(cache.hits, 2)
+                self.assertIsNone(cache.store.get("/student/v5/campus.json"))
+                self.assertIsNotNone(cache.store.get(TERM_URL))
+                cache.clear()
@@ -1,8 +1,11 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+from datetime import timedelta
 from unittest import TestCase
-from uw_sws.dao import SWS_DAO
+from restclients_core.dao import MockDAO
+from uw_sws.dao import SWS_DAO, IndexedMockDAO, sws_now
 from commonconf import override_settings
 
 
@@ -15,3 +18,52 @@ class SWSTestDao(TestCase):
                 SWS_DAO()._custom_headers('GET', '/', {}, None),
                 {'Authorization': 'Bearer token'}
             )
+
+
+class SWSTestIndexedMockDao(TestCase):
+    URLS = [
+        "/student/v5/campus.json",
+        "/student/v5/term/2013,spring.json",
+        "/student/v5/term/current.json",
+        "/student/v5/course/2013,winter,C%20LIT,396/A.json",
+        "/student/v5/person/00000000000000000000000000000001/advisers.json",
+        "/student/v5/notice/9136CCB8F66711D5BE060004AC494FFE.json",
+        "/student/v5/registration.json?reg_id=" +
+        "9136CCB8F66711D5BE060004AC494FFE&quarter=autumn&" +
+        "is_active=true&year=2013",
+        "/student/v5/registration.json?year=2013&quarter=autumn&" +
+        "is_active=true&reg_id=9136CCB8F66711D5BE060004AC494FFE",
+        "/student/v5/registration.json?reg_id=none",
+        "/student/",
+        "/student/v5/none.json",
+    ]
+
+    def test_load(self):
+        dao = SWS_DAO()
+        file_mock = MockDAO(dao.service_name(), dao)
+        indexed_mock = IndexedMockDAO(dao.service_name(), dao)
+        for url in self.URLS:
+            expected = file_mock.load("GET", url, {}, None)
+            response = indexed_mock.load("GET", url, {}, None)
+            self.assertEqual(response.status, expected.status, url)
+            self.assertEqual(response.data, expected.data, url)
+            self.assertEqual(response.headers, expected.headers, url)
+
+    def test_dao_class(self):
+        with override_settings(
+                RESTCLIENTS_SWS_DAO_CLASS="uw_sws.dao.IndexedMockDAO"):
+            dao = SWS_DAO()
+            self.assertIsInstance(dao.get_implementation(), IndexedMockDAO)
+            response = dao.getURL("/student/v5/term/current.json", {})
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.headers["ETag"],
+                             '"1/01234567890123456789="')
+            data = json.loads(response.data)
+            self.assertEqual(data["GradingPeriodOpen"],
+                             (sws_now() - timedelta(days=1)).strftime(
+                                 "%Y-%m-%dT17:00:00"))
+
+            again = dao.getURL("/student/v5/term/current.json", {})
+            self.assertIs(again.data, response.data)
+            self.assertEqual(
+                dao.getURL("/student/v5/none.json", {}).status, 404)
@@ -0,0 +1,136 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+from unittest import TestCase
+from commonconf import override_settings
+from restclients_core.exceptions import DataFailureException
+from uw_sws import get_resource
+from uw_sws.deadline import (
+    Deadline, check_deadline, current_deadline, deadline_scope)
+from uw_sws.exceptions import DeadlineExceeded
+from uw_sws.faults import FaultProfile, FaultRule, fixed, inject_faults
+from uw_sws.registration import (
+    get_schedule_by_regid_and_term, iter_all_registrations_by_section)
+from uw_sws.section import (
+    get_linked_sections, get_section_by_label, get_section_by_url)
+from uw_sws.term import get_current_term
+from uw_sws.util import fdao_sws_override
+from uw_sws.worker import Worker
+
+REGID = "9136CCB8F66711D5BE060004AC494FFE"
+SECTION_URLS = r"^/student/v5/course/"
+
+
+class SlowGetter(Worker):
+    def get_task_ids(self):
+        return [str(i) for i in range(4)]
+
+    @property
+    def concurrency(self):
+        return 2
+
+    def task(self, tid):
+        time.sleep(0.2)
+        return get_resource("/student/v5/campus.json")
+
+
+class DeadlineTest(TestCase):
+    def test_scope(self):
+        self.assertIsNone(current_deadline())
+        check_deadline()
+        with deadline_scope(10) as outer:
+            self.assertIs(current_deadline(), outer)
+            self.assertTrue(9 < outer.remaining() <= 10)
+            with deadline_scope(60) as inner:
+                # never later than the enclosing deadline
+                self.assertEqual(inner.expires_at, outer.expires_at)
+                inner.cancel()
+                self.assertRaises(DeadlineExceeded, check_deadline)
+            self.assertFalse(outer.expired())
+            check_deadline()
+        self.assertIsNone(current_deadline())
+
+        with deadline_scope() as deadline:
+            self.assertIsNone(deadline.remaining())
+            self.assertFalse(deadline.expired())
+
+    def test_expiry(self):
+        deadline = Deadline(0)
+        self.assertTrue(deadline.expired())
+        self.assertEqual(deadline.remaining(), 0)
+        with self.assertRaises(DeadlineExceeded) as cm:
+            deadline.check("/student/v5/campus.json")
+        self.assertEqual(cm.exception.status, 504)
+        self.assertTrue(Deadline(None, deadline).expired())
+
+
+@fdao_sws_override
+class DeadlineRequestTest(TestCase):
+    def test_request(self):
+        with deadline_scope(0):
+            self.assertRaises(DeadlineExceeded, get_resource,
+                              "/student/v5/campus.json")
+
+    def test_worker_timeout(self):
+        start = time.monotonic()
+        self.assertRaises(DeadlineExceeded, SlowGetter().run_tasks, 0.05)
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertEqual(len(SlowGetter().run_tasks(5)), 4)
+
+    def test_schedule_fails_fast(self):
+        term = get_current_term()
+        profile = FaultProfile([FaultRule(SECTION_URLS, error_rate=1.0)])
+        with inject_faults(profile):
+            self.assertRaises(DataFailureException,
+                              get_schedule_by_regid_and_term, REGID, term)
+        # the first failed section stops the others being requested
+        self.assertEqual(profile.stats[500], 1)
+
+    def test_schedule_timeout(self):
+        term = get_current_term()
+        profile = FaultProfile([FaultRule(SECTION_URLS,
+                                          latency=fixed(0.1))])
+        with inject_faults(profile):
+            self.assertRaises(DeadlineExceeded,
+                              get_schedule_by_regid_and_term, REGID, term,
+                              timeout=0.05)
+            schedule = get_schedule_by_regid_and_term(REGID, term,
+                                                      timeout=10)
+            self.assertTrue(len(schedule.sections) > 1)
+
+    def test_threaded_schedule_timeout(self):
+        term = get_current_term()
+        profile = FaultProfile([FaultRule(SECTION_URLS,
+                                          latency=fixed(0.5))])
+        with inject_faults(profile), override_settings(
+                RESTCLIENTS_SWS_DAO_CLASS="uw_sws.faults.FaultInjectingDAO",
+                RESTCLIENTS_USE_THREADING=True):
+            start = time.monotonic()
+            self.assertRaises(DeadlineExceeded,
+                              get_schedule_by_regid_and_term, REGID, term,
+                              timeout=0.05)
+            self.assertLess(time.monotonic() - start, 0.4)
+
+    def test_linked_sections_timeout(self):
+        url = "/student/v5/course/2013,summer,TRAIN,100/A.json"
+        section = get_section_by_url(url)
+        section.linked_section_urls = [url, url]
+        profile = FaultProfile([FaultRule(SECTION_URLS,
+                                          latency=fixed(0.1))])
+        with inject_faults(profile):
+            self.assertRaises(DeadlineExceeded, get_linked_sections,
+                              section, timeout=0.05)
+
+    def test_iter_registrations_timeout(self):
+        section = get_section_by_label("2013,winter,DROP_T,100/B")
+        profile = FaultProfile([FaultRule(r"^/student/v5/person/",
+                                          latency=fixed(0.2))])
+        with inject_faults(profile):
+            registrations = iter_all_registrations_by_section(
+                section, timeout=0.05)
+            # the lookups run under the deadline of the call
+            self.assertIsNone(current_deadline())
+            self.assertRaises(DeadlineExceeded, list, registrations)
+            self.assertEqual(len(list(iter_all_registrations_by_section(
+                section, timeout=10))), 3)
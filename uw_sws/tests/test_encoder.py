@@ -0,0 +1,73 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from datetime import date
+from unittest import TestCase
+from commonconf import override_settings
+from uw_pws.util import fdao_pws_override
+from uw_sws.encoder import ModelEncoder, encode_json
+from uw_sws.lite import LiteSection, lite_copy
+from uw_sws.registration import get_schedule_by_regid_and_term
+from uw_sws.section import get_section_by_label
+from uw_sws.term import get_term_by_year_and_quarter
+from uw_sws.util import fdao_sws_override
+
+REGID = "9136CCB8F66711D5BE060004AC494FFE"
+
+
+def dumps(obj):
+    return json.dumps(obj.json_data()).encode()
+
+
+@fdao_pws_override
+@fdao_sws_override
+class ModelEncoderTest(TestCase):
+    def test_schedule(self):
+        term = get_term_by_year_and_quarter(2013, "spring")
+        schedule = get_schedule_by_regid_and_term(REGID, term)
+        self.assertEqual(encode_json(schedule), dumps(schedule))
+
+        with override_settings(RESTCLIENTS_SWS_LITE_MODELS=True):
+            schedule = get_schedule_by_regid_and_term(REGID, term)
+        self.assertEqual(encode_json(schedule), dumps(schedule))
+
+    def test_sections(self):
+        sections = [get_section_by_label("2013,spring,MATH,125/H"),
+                    get_section_by_label("2013,summer,TRAIN,101/A"),
+                    get_section_by_label("2013,spring,MATH,125/H")]
+        self.assertEqual(
+            encode_json(sections),
+            json.dumps([section.json_data() for section in sections]).encode())
+
+        encoder = ModelEncoder()
+        chunks = list(encoder.iter_encode(sections))
+        self.assertEqual(len(chunks), 7)
+        # the instructors of the repeated section are encoded once
+        instructors = [i for section in sections
+                       for meeting in section.meetings
+                       for i in meeting.instructors]
+        self.assertEqual(len(encoder._instructors),
+                         len(set(i.uwregid for i in instructors)))
+        self.assertLess(len(encoder._instructors), len(instructors))
+        self.assertEqual(encode_json(sections[1].term),
+                         dumps(sections[1].term))
+
+        # dates in meetings are written as in the json_data() of other
+        # models
+        sections[0].meetings[0].eos_start_date = date(2013, 4, 1)
+        data = json.loads(encode_json(sections[0]))
+        self.assertEqual(data["meetings"][0]["eos_start_date"], "2013-04-01")
+
+    def test_lite_copy(self):
+        section = get_section_by_label("2013,spring,MATH,125/H")
+        copy = lite_copy(section)
+        self.assertIsInstance(copy, LiteSection)
+        self.assertEqual(copy.json_data(), section.json_data())
+        self.assertIs(copy.meetings, section.meetings)
+
+        # an attribute the lite variant cannot hold
+        section.extra = True
+        self.assertIs(lite_copy(section), section)
+        self.assertIs(lite_copy(copy), copy)
+        self.assertIs(lite_copy(section.term).model, type(section.term))
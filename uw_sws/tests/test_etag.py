@@ -0,0 +1,146 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+import mock
+from commonconf import override_settings
+from restclients_core.exceptions import DataFailureException
+from uw_sws import DAO, ETAGS, get_resource, put_resource
+from uw_sws.cache import get_cache
+from uw_sws.etag import ETagCache
+from uw_sws.tests.helpers import mock_response
+from uw_sws.util import fdao_sws_override
+
+URL = "/student/v5/person/9136CCB8F66711D5BE060004AC494FFE/" +\
+    "registrationblock.json"
+ETAG = '"1/01234567890123456789="'
+
+
+class ETagCacheTest(TestCase):
+    def test_cache(self):
+        cache = ETagCache(max_size=2)
+        self.assertIsNone(cache.get("/a"))
+        cache.set("/a", "1")
+        cache.set("/b", "2")
+        self.assertEqual(cache.get("/a"), "1")
+        cache.set("/c", "3")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("/b"))
+        self.assertEqual(cache.get("/a"), "1")
+        cache.set("/a", None)
+        self.assertIsNone(cache.get("/a"))
+        cache.discard("/c")
+        self.assertEqual(len(cache), 0)
+
+        cache.record_preflight_avoided()
+        cache.record_precondition_failure()
+        self.assertEqual(cache.preflights_avoided, 1)
+        self.assertEqual(cache.precondition_failures, 1)
+        cache.clear()
+        self.assertEqual(cache.preflights_avoided, 0)
+
+
+@fdao_sws_override
+class PutResourceTest(TestCase):
+    def setUp(self):
+        ETAGS.clear()
+
+    def test_get_populates_cache(self):
+        get_resource(URL)
+        self.assertEqual(ETAGS.get(URL), ETAG)
+        self.assertRaises(DataFailureException, get_resource,
+                          "/student/v5/person/none/registrationblock.json")
+
+    def test_put_headers_not_shared(self):
+        headers = {"X-UW-Act-as": "bill"}
+        put_resource(URL, headers, {"Covid19StatusCode": 3})
+        self.assertEqual(headers, {"X-UW-Act-as": "bill"})
+
+        with mock.patch.object(DAO, "putURL") as mock_put:
+            mock_put.return_value = mock_response(200)
+            put_resource(URL)
+            put_resource(URL)
+            for call in mock_put.call_args_list:
+                self.assertNotIn("X-UW-Act-as", call.args[1])
+                self.assertEqual(call.args[2], "{}")
+
+    def test_pessimistic_put(self):
+        get_resource(URL)
+        with mock.patch.object(DAO, "getURL", wraps=DAO.getURL) as mock_get:
+            put_resource(URL, {}, {"Covid19StatusCode": 3})
+            self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(ETAGS.preflights_avoided, 0)
+
+    @override_settings(RESTCLIENTS_SWS_OPTIMISTIC_PUT=True)
+    def test_optimistic_put(self):
+        # Nothing cached yet, so the preflight GET is needed
+        with mock.patch.object(DAO, "getURL", wraps=DAO.getURL) as mock_get:
+            data = put_resource(URL, {}, {"Covid19StatusCode": 3})
+            self.assertEqual(data, {"Covid19StatusCode": 3})
+            self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(ETAGS.preflights_avoided, 0)
+
+        get_resource(URL)
+        with mock.patch.object(DAO, "getURL", wraps=DAO.getURL) as mock_get:
+            data = put_resource(URL, {}, {"Covid19StatusCode": 3})
+            self.assertEqual(data, {"Covid19StatusCode": 3})
+            self.assertEqual(mock_get.call_count, 0)
+        self.assertEqual(ETAGS.preflights_avoided, 1)
+
+    @override_settings(RESTCLIENTS_SWS_OPTIMISTIC_PUT=True)
+    def test_optimistic_put_precondition_failed(self):
+        ETAGS.set(URL, '"stale"')
+        with mock.patch.object(DAO, "putURL") as mock_put:
+            mock_put.side_effect = [
+                mock_response(412),
+                mock_response(200, '{"a": 1}', {"ETag": '"new"'})]
+            self.assertEqual(put_resource(URL, body={"a": 1}), {"a": 1})
+            self.assertEqual(mock_put.call_count, 2)
+            self.assertEqual(
+                mock_put.call_args_list[0].args[1]["If-Match"], '"stale"')
+            self.assertEqual(
+                mock_put.call_args_list[1].args[1]["If-Match"], ETAG)
+        self.assertEqual(ETAGS.precondition_failures, 1)
+        self.assertEqual(ETAGS.preflights_avoided, 0)
+        self.assertEqual(ETAGS.get(URL), '"new"')
+
+        with mock.patch.object(DAO, "putURL") as mock_put:
+            mock_put.return_value = mock_response(500)
+            self.assertRaises(DataFailureException, put_resource, URL)
+        self.assertIsNone(ETAGS.get(URL))
+
+    def test_precondition_failed_cached(self):
+        with TemporaryDirectory() as path:
+            with override_settings(
+                    RESTCLIENTS_SWS_OPTIMISTIC_PUT=True,
+                    RESTCLIENTS_SWS_CACHE_MEMORY_SIZE=10,
+                    RESTCLIENTS_SWS_CACHE_PATH=os.path.join(path, "sws.db"),
+                    RESTCLIENTS_SWS_CACHE_RULES=[
+                        ["registrationblock", 60, False]]):
+                with mock.patch.object(DAO, "getURL") as mock_get, \
+                        mock.patch.object(DAO, "putURL") as mock_put:
+                    mock_get.side_effect = [
+                        mock_response(200, "{}", {"ETag": '"v1"'}),
+                        mock_response(200, "{}", {"ETag": '"v2"'})]
+                    mock_put.side_effect = [
+                        mock_response(412),
+                        mock_response(200, "{}", {"ETag": '"v3"'})]
+                    get_resource(URL)
+                    put_resource(URL, body={})
+                    # the cached response is not used for the refetch
+                    self.assertEqual(mock_get.call_count, 2)
+                    self.assertEqual(
+                        [call.args[1]["If-Match"]
+                         for call in mock_put.call_args_list],
+                        ['"v1"', '"v2"'])
+                get_cache(DAO).clear()
+
+    def test_put_with_etag(self):
+        with mock.patch.object(DAO, "putURL") as mock_put:
+            mock_put.return_value = mock_response(412)
+            self.assertRaises(DataFailureException, put_resource, URL,
+                              etag='"old"', optimistic=True)
+            self.assertEqual(mock_put.call_count, 1)
+        self.assertEqual(ETAGS.precondition_failures, 1)
@@ -0,0 +1,77 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase
+from restclients_core.exceptions import DataFailureException
+from uw_sws import get_resource
+from uw_sws.faults import (
+    FaultProfile, FaultRule, inject_faults, fixed, uniform, lognormal)
+from uw_sws.term import get_current_term
+from uw_sws.util import fdao_sws_override
+
+TERM_URL = "/student/v5/term/2013,spring.json"
+
+
+@fdao_sws_override
+class FaultInjectingDAOTest(TestCase):
+    def test_no_faults(self):
+        with inject_faults(FaultProfile()) as profile:
+            self.assertEqual(get_current_term().year, 2013)
+            self.assertEqual(profile.stats, {"requests": 1})
+
+    def test_latency(self):
+        profile = FaultProfile([FaultRule(r"/term/", latency=fixed(0.01))])
+        self.assertEqual(profile.outcome("GET", TERM_URL), (0.01, None))
+        self.assertEqual(profile.outcome("GET", "/student/v5/campus.json"),
+                         (0.0, None))
+
+        profile = FaultProfile([FaultRule(r"/term/",
+                                          latency=uniform(0.1, 0.2))])
+        delay, fault = profile.outcome("GET", TERM_URL)
+        self.assertTrue(0.1 <= delay <= 0.2)
+
+        profile = FaultProfile([FaultRule(r"/term/",
+                                          latency=lognormal(0.05))])
+        delay, fault = profile.outcome("GET", TERM_URL)
+        self.assertTrue(delay > 0)
+
+    def test_faults(self):
+        for rule, status in (
+                (FaultRule(r"/term/", error_rate=1.0), 500),
+                (FaultRule(r"/term/", error_rate=1.0, error_status=404), 404),
+                (FaultRule(r"/term/", throttle_rate=1.0), 429),
+                (FaultRule(r"/term/", unavailable_rate=1.0), 503)):
+            with inject_faults(FaultProfile([rule])) as profile:
+                with self.assertRaises(DataFailureException) as cm:
+                    get_resource(TERM_URL)
+                self.assertEqual(cm.exception.status, status)
+                self.assertEqual(profile.stats[status], 1)
+                self.assertIsNotNone(get_resource("/student/v5/campus.json"))
+
+        rule = FaultRule(r"/term/", timeout_rate=1.0, timeout=0.0)
+        with inject_faults(FaultProfile([rule])) as profile:
+            with self.assertRaises(DataFailureException) as cm:
+                get_resource(TERM_URL)
+            self.assertEqual(cm.exception.status, 0)
+            self.assertEqual(profile.stats["timeout"], 1)
+
+    def test_seeded(self):
+        def outcomes(seed):
+            profile = FaultProfile([FaultRule(
+                r".", latency=uniform(0, 1), error_rate=0.3,
+                unavailable_rate=0.2)], seed=seed)
+            return [profile.outcome("GET", "/student/v5/{}.json".format(i))
+                    for i in range(50) for repeat in range(2)]
+
+        self.assertEqual(outcomes(1), outcomes(1))
+        self.assertNotEqual(outcomes(1), outcomes(2))
+        faults = [fault for delay, fault in outcomes(1)]
+        self.assertTrue(500 in faults)
+        self.assertTrue(503 in faults)
+        self.assertTrue(None in faults)
+
+        profile = FaultProfile([FaultRule(r".", error_rate=0.5)])
+        first = [profile.outcome("GET", TERM_URL) for i in range(10)]
+        profile.reset()
+        self.assertEqual(first,
+                         [profile.outcome("GET", TERM_URL) for i in range(10)])
@@ -0,0 +1,109 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import date, datetime
+from unittest import TestCase
+from commonconf import override_settings
+from uw_pws.util import fdao_pws_override
+from uw_sws.intern import REGISTRY, InternRegistry, unshared_term
+from uw_sws.registration import get_schedule_by_regid_and_term
+from uw_sws.section import get_section_by_label
+from uw_sws.term import get_term_by_year_and_quarter
+from uw_sws.util import fdao_sws_override
+
+shared_terms = override_settings(RESTCLIENTS_SWS_SHARED_TERMS=True)
+
+
+class InternRegistryTest(TestCase):
+    def test_intern(self):
+        registry = InternRegistry()
+        value = "".join(["MA", "TH"])
+        self.assertIs(registry.intern(value), value)
+        self.assertIs(registry.intern("".join(["MAT", "H"])), value)
+
+        day = date(2013, 4, 1)
+        self.assertIs(registry.intern(day), day)
+        self.assertIs(registry.intern(date(2013, 4, 1)), day)
+        self.assertEqual(len(registry), 2)
+
+        # other types are returned as is
+        for value in (None, 1, True, datetime(2013, 4, 1), ["MATH"]):
+            self.assertIs(registry.intern(value), value)
+        self.assertEqual(len(registry), 2)
+
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+
+    def test_max_values(self):
+        registry = InternRegistry(max_values=2)
+        math = registry.intern("".join(["MA", "TH"]))
+        chem = registry.intern("".join(["CH", "EM"]))
+        self.assertIs(registry.intern("MATH"), math)
+        # the least recently used value is evicted
+        value = "".join(["BI", "OL"])
+        self.assertIs(registry.intern(value), value)
+        self.assertEqual(len(registry), 2)
+        self.assertIs(registry.intern("MATH"), math)
+        self.assertIs(registry.intern("BIOL"), value)
+        self.assertIsNot(registry.intern("".join(["CH", "EM"])), chem)
+
+    def test_term(self):
+        registry = InternRegistry()
+        built = []
+
+        def build(data):
+            built.append(data)
+            return object()
+
+        data = {"Year": 2013, "Quarter": "spring", "FirstDay": "2013-04-01"}
+        term = registry.term(data, build)
+        self.assertIs(registry.term(dict(data), build), term)
+        self.assertEqual(len(built), 1)
+
+        changed = dict(data, FirstDay="2013-04-02")
+        self.assertIsNot(registry.term(changed, build), term)
+        self.assertEqual(len(built), 2)
+
+
+@fdao_pws_override
+@fdao_sws_override
+class InternedModelsTest(TestCase):
+    def setUp(self):
+        REGISTRY.clear()
+
+    def test_sections(self):
+        section1 = get_section_by_label("2013,spring,MATH,125/H")
+        section2 = get_section_by_label("2013,spring,MATH,125/H")
+        self.assertIs(section1.curriculum_abbr, section2.curriculum_abbr)
+        self.assertIs(section1.meetings[0].building,
+                      section2.meetings[0].building)
+        self.assertIs(section1.start_date, section2.start_date)
+        # free text is not interned
+        self.assertIsNot(section1.course_description,
+                         section2.course_description)
+        self.assertIsNot(section1.term, section2.term)
+        self.assertEqual(section1.term, section2.term)
+
+    def test_shared_terms(self):
+        with shared_terms:
+            term = get_term_by_year_and_quarter(2013, "spring")
+            self.assertIs(get_term_by_year_and_quarter(2013, "spring"), term)
+            self.assertIsNot(get_term_by_year_and_quarter(2013, "autumn"),
+                             term)
+
+            section = get_section_by_label("2013,spring,MATH,125/H")
+            self.assertIs(section.term, term)
+            self.assertIs(section.meetings[0].term, term)
+
+    def test_schedule_term(self):
+        with shared_terms:
+            term = get_term_by_year_and_quarter(2013, "spring")
+            schedule = get_schedule_by_regid_and_term(
+                "9136CCB8F66711D5BE060004AC494FFE", term)
+
+        # the schedule's credits are not set on the shared term
+        self.assertIsNot(schedule.term, term)
+        self.assertEqual(schedule.term, term)
+        self.assertTrue(schedule.term.credits_complete)
+        self.assertFalse(hasattr(term, "credits_complete"))
+        self.assertIs(unshared_term(schedule.term), schedule.term)
@@ -0,0 +1,172 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import pickle
+from unittest import TestCase, mock
+from commonconf import override_settings
+from uw_pws.util import fdao_pws_override
+from uw_sws.enrollment import (
+    get_enrollment_by_regid_and_term, get_enrollment_history_by_regid)
+from uw_sws.lite import (
+    LazyEnrollment, LazyRegistration, LiteEnrollment, LiteRegistration,
+    LiteSection, LiteSectionMeeting, LiteTerm, model_class, model_classes)
+from uw_sws.models import (
+    Person, Registration, Section, SectionMeeting, Term)
+from uw_sws.registration import (
+    get_active_registrations_by_section, get_schedule_by_regid_and_term)
+from uw_sws.section import get_section_by_label
+from uw_sws.term import get_current_term, get_term_by_year_and_quarter
+from uw_sws.util import fdao_sws_override
+
+REGID = "9136CCB8F66711D5BE060004AC494FFE"
+SECTION_LABEL = "2013,spring,MATH,125/H"
+lite_models = override_settings(RESTCLIENTS_SWS_LITE_MODELS=True)
+lazy_models = override_settings(RESTCLIENTS_SWS_LAZY_MODELS=True)
+
+
+@fdao_pws_override
+@fdao_sws_override
+class LiteModelTest(TestCase):
+    def test_model_class(self):
+        self.assertIs(model_class(Term), Term)
+        with lite_models:
+            self.assertIs(model_class(Term), LiteTerm)
+            self.assertIs(model_class(Section), LiteSection)
+            self.assertIs(model_classes()[SectionMeeting],
+                          LiteSectionMeeting)
+        self.assertIs(model_class(Person), Person)
+        self.assertIs(model_classes()[Section], Section)
+
+    def test_term(self):
+        term = get_term_by_year_and_quarter(2013, "spring")
+        with lite_models:
+            lite = get_term_by_year_and_quarter(2013, "spring")
+        self.assertIsInstance(lite, LiteTerm)
+        self.assertFalse(hasattr(lite, "__dict__"))
+        self.assertEqual(lite, term)
+        self.assertEqual(hash(lite), hash(term))
+        self.assertTrue(lite < get_term_by_year_and_quarter(2013, "summer"))
+        self.assertEqual(lite.get_quarter_display(), "Spring")
+        self.assertEqual(lite.json_data(), term.json_data())
+        self.assertEqual(lite.canvas_sis_id(), "2013-spring")
+        self.assertEqual(pickle.loads(pickle.dumps(lite)), term)
+        self.assertRaises(AttributeError, setattr, lite, "unknown", 1)
+
+        # methods are read from the model when called
+        with mock.patch.object(Term, "canvas_sis_id", lambda term: "x"):
+            self.assertEqual(lite.canvas_sis_id(), "x")
+        with mock.patch.object(Term, "is_summer_quarter") as patched:
+            patched.return_value = True
+            self.assertTrue(lite.is_summer_quarter())
+        self.assertFalse(lite.is_summer_quarter())
+
+        term = LiteTerm(year=2013, quarter="autumn")
+        self.assertEqual(term.last_day_add, None)
+        self.assertEqual(term, Term(year=2013, quarter="autumn"))
+
+    def test_section(self):
+        section = get_section_by_label(SECTION_LABEL)
+        with lite_models:
+            lite = get_section_by_label(SECTION_LABEL)
+        self.assertIsInstance(lite, LiteSection)
+        self.assertIsInstance(lite.term, LiteTerm)
+        self.assertIsInstance(lite.meetings[0], LiteSectionMeeting)
+        self.assertEqual(lite.section_label(), section.section_label())
+        self.assertEqual(lite.canvas_course_sis_id(),
+                         section.canvas_course_sis_id())
+        self.assertEqual(lite.is_campus_seattle(),
+                         section.is_campus_seattle())
+        self.assertEqual(lite.json_data(), section.json_data())
+
+    def test_schedule(self):
+        term = get_current_term()
+        schedule = get_schedule_by_regid_and_term(REGID, term)
+        with lite_models:
+            lite_term = get_current_term()
+            lite = get_schedule_by_regid_and_term(REGID, lite_term)
+        self.assertIsInstance(lite.sections[0], LiteSection)
+        self.assertIsInstance(lite.sections[0].registration,
+                              LiteRegistration)
+        self.assertEqual(lite_term.credits, term.credits)
+        self.assertEqual(lite.json_data(), schedule.json_data())
+
+    def test_registrations(self):
+        section = get_section_by_label("2017,autumn,EDC&I,552/A")
+        registrations = get_active_registrations_by_section(
+            section, transcriptable_course="all")
+        with lite_models:
+            lite = get_active_registrations_by_section(
+                section, transcriptable_course="all")
+        self.assertIsInstance(lite[0], LiteRegistration)
+        self.assertEqual([r.json_data() for r in lite],
+                         [r.json_data() for r in registrations])
+        self.assertEqual(lite[1].person.uwnetid, "javerage")
+
+    def test_enrollment(self):
+        term = get_current_term()
+        enrollment = get_enrollment_by_regid_and_term(REGID, term)
+        with lite_models:
+            lite = get_enrollment_by_regid_and_term(REGID, term)
+        self.assertIsInstance(lite, LiteEnrollment)
+        self.assertIsInstance(lite.registrations[0], LiteRegistration)
+        self.assertEqual(lite.json_data(), enrollment.json_data())
+        self.assertFalse(lite.is_non_matric())
+
+
+@fdao_pws_override
+@fdao_sws_override
+class LazyModelTest(TestCase):
+    def test_model_class(self):
+        with lazy_models:
+            self.assertIs(model_class(Registration), LazyRegistration)
+            self.assertIs(model_class(Term), Term)
+        with override_settings(RESTCLIENTS_SWS_LITE_MODELS=True,
+                               RESTCLIENTS_SWS_LAZY_MODELS=True):
+            self.assertIs(model_class(Registration), LazyRegistration)
+            self.assertIs(model_class(Term), LiteTerm)
+
+    def test_registration(self):
+        data = {"Credits": " 5.0", "Grade": "W3", "RequestStatus": "",
+                "GradeDate": "2013-06-11", "Section": {}}
+        registration = LazyRegistration(data=data)
+        self.assertEqual(registration._values, {})
+        self.assertEqual(registration.credits, "5.0")
+        self.assertEqual(list(registration._values), ["credits"])
+        self.assertTrue(registration.is_withdrew())
+        with mock.patch.object(Registration, "is_withdrew",
+                               lambda registration: False):
+            self.assertFalse(registration.is_withdrew())
+        self.assertEqual(registration.majors, [])
+
+        registration.grade = "A"
+        self.assertFalse(registration.is_withdrew())
+        self.assertEqual(registration.json_data(),
+                         dict(Registration(data=data).json_data(),
+                              grade="A", is_withdrew=False))
+
+        copy = pickle.loads(pickle.dumps(registration))
+        self.assertIsNone(copy._data)
+        self.assertEqual(copy.grade_date, registration.grade_date)
+
+        registration = LazyRegistration(grade="B")
+        self.assertEqual(registration.grade, "B")
+        self.assertEqual(registration.credits, Registration().credits)
+
+    def test_enrollment_history(self):
+        history = get_enrollment_history_by_regid(REGID)
+        with lazy_models:
+            lazy = get_enrollment_history_by_regid(REGID)
+        self.assertIsInstance(lazy[0], LazyEnrollment)
+        self.assertEqual([e.class_level for e in lazy],
+                         [e.class_level for e in history])
+        # only the fields read are parsed
+        self.assertNotIn("registrations", lazy[0]._values)
+        self.assertNotIn("majors", lazy[0]._values)
+
+        registrations = [r for e in lazy for r in e.registrations]
+        self.assertTrue(registrations)
+        for registration in registrations:
+            self.assertIsInstance(registration, LazyRegistration)
+        self.assertEqual([e.json_data() for e in lazy],
+                         [e.json_data() for e in history])
+        self.assertEqual(str(lazy[-1].hydrate()), str(lazy[-1]))
@@ -0,0 +1,118 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from unittest import TestCase, mock
+from restclients_core.exceptions import DataFailureException
+from uw_sws import DAO, get_resource, put_resource
+from uw_sws.metrics import (
+    CallbackMetrics, InMemoryMetrics, LoggingMetrics, set_metrics_sink,
+    url_template, get_metrics_sink)
+from uw_sws.registration import get_schedule_by_regid_and_term
+from uw_sws.term import get_current_term
+from uw_pws.util import fdao_pws_override
+from uw_sws.util import fdao_sws_override
+
+REGID = "9136CCB8F66711D5BE060004AC494FFE"
+
+
+class URLTemplateTest(TestCase):
+    def test_url_template(self):
+        for url, template in (
+                ("/student/v5/person/{}.json".format(REGID),
+                 "/student/v5/person/{regid}.json"),
+                ("/student/v5/person/{}/advisers.json".format(REGID.lower()),
+                 "/student/v5/person/{regid}/advisers.json"),
+                ("/student/v5/course/2013,spring,CSE,142/A.json",
+                 "/student/v5/course/{label}.json"),
+                ("/student/v5/course/2013,spring,B%20BIO,180/AA/status.json",
+                 "/student/v5/course/{label}/status.json"),
+                ("/student/v5/course/2013,spring,CSE,142.json",
+                 "/student/v5/course/{course}.json"),
+                ("/student/v5/term/2013,spring.json",
+                 "/student/v5/term/{term}.json"),
+                ("/student/v5/term/current.json",
+                 "/student/v5/term/current.json"),
+                ("/student/v5/enrollment/2013,spring,{}.json".format(REGID),
+                 "/student/v5/enrollment/{term},{regid}.json"),
+                ("/student/v5/registration/2013,spring,CSE,142,A,{},.json"
+                 .format(REGID), "/student/v5/registration/{label}.json"),
+                ("/student/v5/registration.json?year=2013&quarter=spring"
+                 "&reg_id={}&is_active=true".format(REGID),
+                 "/student/v5/registration.json?"
+                 "is_active&quarter&reg_id&year"),
+                ("/student/v5/campus.json", "/student/v5/campus.json")):
+            self.assertEqual(url_template(url), template)
+
+
+@fdao_pws_override
+@fdao_sws_override
+class MetricsSinkTest(TestCase):
+    def setUp(self):
+        self.metrics = InMemoryMetrics()
+        self.previous = set_metrics_sink(self.metrics)
+
+    def tearDown(self):
+        set_metrics_sink(self.previous)
+
+    def test_in_memory(self):
+        self.assertIs(get_metrics_sink(), self.metrics)
+        get_resource("/student/v5/term/2013,spring.json")
+        get_resource("/student/v5/term/2013,spring.json")
+        self.assertRaises(DataFailureException, get_resource,
+                          "/student/v5/term/1901,spring.json")
+
+        snapshot = self.metrics.snapshot()
+        stats = snapshot["GET /student/v5/term/{term}.json"]
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["statuses"], {200: 2, 404: 1})
+        self.assertEqual(stats["decode_count"], 2)
+        self.assertEqual(sum(stats["histogram"].values()), 3)
+        self.assertTrue(stats["bytes"] > 0)
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.snapshot(), {})
+
+    def test_put(self):
+        url = "/student/v5/person/{}/registrationblock.json".format(REGID)
+        response = mock.Mock(status=200, data='{"Blocked": false}',
+                             headers={})
+        with mock.patch.object(DAO, "putURL", return_value=response):
+            put_resource(url, etag="abc")
+        stats = self.metrics.snapshot()[
+            "PUT /student/v5/person/{regid}/registrationblock.json"]
+        self.assertEqual(stats["count"], 1)
+        self.assertEqual(stats["decode_count"], 1)
+
+    def test_course_threads(self):
+        get_schedule_by_regid_and_term(REGID, get_current_term())
+        self.assertTrue(
+            self.metrics.snapshot()["GET /student/v5/course/{label}.json"][
+                "count"] > 0)
+
+    def test_dao_exception(self):
+        with mock.patch.object(DAO, "getURL",
+                               side_effect=DataFailureException("", 0, "")):
+            self.assertRaises(DataFailureException, get_resource,
+                              "/student/v5/campus.json")
+        self.assertEqual(self.metrics.snapshot()[
+            "GET /student/v5/campus.json"]["statuses"], {0: 1})
+
+    def test_callback(self):
+        calls = []
+        set_metrics_sink(CallbackMetrics(
+            lambda *args: calls.append(args), prefix="uw.sws"))
+        get_resource("/student/v5/campus.json")
+        self.assertEqual([(name, kind) for name, value, kind, tags in calls],
+                         [("uw.sws.request", "timing"),
+                          ("uw.sws.response_bytes", "histogram"),
+                          ("uw.sws.decode", "timing")])
+        self.assertEqual(calls[0][3], {"method": "GET", "status": 200,
+                                       "template": "/student/v5/campus.json"})
+
+    def test_logging(self):
+        set_metrics_sink(LoggingMetrics())
+        with self.assertLogs("uw_sws.metrics", level=logging.INFO) as cm:
+            get_resource("/student/v5/campus.json")
+        self.assertEqual(len(cm.output), 2)
+        self.assertIn("template:/student/v5/campus.json", cm.output[0])
@@ -6,7 +6,8 @@ from datetime import datetime, timedelta, timezone
 from restclients_core.exceptions import DataFailureException
 from uw_sws.util import fdao_sws_override
 from uw_pws.util import fdao_pws_override
-from uw_sws.notice import get_notices_by_regid, _str_to_utc
+from uw_sws.notice import (
+    get_notices_by_regid, get_notices_by_regids, bucket_notices, _str_to_utc)
 from uw_sws.dao import sws_now, SWS_TIMEZONE
 
 
@@ -155,3 +156,43 @@ class SWSNotice(TestCase):
         self.assertEqual(notice.notice_category, "StudentFinAid")
         self.assertEqual(notice.notice_type, "AidPriorityDateShort")
         self.assertEqual(notice.long_notice.notice_type, "AidPriorityDate")
+
+    def test_notices_by_regids(self):
+        regid = "9136CCB8F66711D5BE060004AC494FFE"
+        results = get_notices_by_regids(
+            [regid, "99999999999999999999999999999999"])
+        self.assertEqual(list(results.keys()), [regid])
+
+        by_category = results[regid]["by_category"]
+        self.assertEqual(len(by_category["StudentFinAid"]), 4)
+        self.assertEqual(len(by_category["StudentALR"]), 5)
+        self.assertEqual(
+            sum([len(n) for n in by_category.values()]), 17)
+
+        by_window = results[regid]["by_window"]
+        self.assertEqual(len(by_window["active"]), 14)
+        self.assertEqual(
+            [n.notice_type for n in by_window["upcoming"]],
+            ["QtrBegin", "QtrEnd", "AidPriorityDate"])
+        self.assertEqual(len(by_window["expired"]), 0)
+
+    def test_bucket_notices_window(self):
+        notices = get_notices_by_regid("9136CCB8F66711D5BE060004AC494FFE")
+        today = datetime.now(timezone.utc)
+
+        by_window = bucket_notices(
+            notices, today + timedelta(weeks=4))["by_window"]
+        self.assertEqual(
+            [n.notice_type for n in by_window["upcoming"]], [])
+        self.assertEqual(
+            [n.notice_type for n in by_window["expired"]],
+            ["PreRegNow", "AidPriorityDate"])
+
+        by_window = bucket_notices(
+            notices, today + timedelta(weeks=6))["by_window"]
+        self.assertEqual(
+            [n.notice_type for n in by_window["expired"]],
+            ["QtrBegin", "PreRegNow", "QtrEnd", "AidPriorityDate"])
+        self.assertEqual(bucket_notices([]), {
+            "by_category": {},
+            "by_window": {"active": [], "upcoming": [], "expired": []}})
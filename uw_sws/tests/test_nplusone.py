@@ -0,0 +1,62 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+from unittest import TestCase
+from commonconf import override_settings
+from uw_pws.util import fdao_pws_override
+from uw_sws.enrollment import get_grades_by_regid_and_term
+from uw_sws.exceptions import NPlusOneError
+from uw_sws.nplusone import _scope, nplusone_scope, NPLUSONE_WARN
+from uw_sws.term import get_term_by_year_and_quarter
+from uw_sws.util import fdao_sws_override
+
+REGID = "9136CCB8F66711D5BE060004AC494FFE"
+
+
+@fdao_pws_override
+@fdao_sws_override
+class NPlusOneTest(TestCase):
+    def setUp(self):
+        self.term = get_term_by_year_and_quarter(2013, "spring")
+
+    def test_scope(self):
+        with nplusone_scope(threshold=10):
+            grades = get_grades_by_regid_and_term(REGID, self.term)
+        self.assertEqual(len(grades.grades), 5)
+
+        with self.assertRaises(NPlusOneError) as cm:
+            with nplusone_scope(threshold=2):
+                get_grades_by_regid_and_term(REGID, self.term)
+        self.assertEqual(cm.exception.template,
+                         "/student/v5/course/{label}.json")
+        self.assertEqual(cm.exception.count, 3)
+        self.assertIn("_json_to_grades", cm.exception.stack)
+        self.assertIn("_json_to_grades", str(cm.exception))
+
+    def test_scope_warn(self):
+        with self.assertLogs("uw_sws.nplusone") as cm:
+            with nplusone_scope(action=NPLUSONE_WARN, threshold=2):
+                get_grades_by_regid_and_term(REGID, self.term)
+        self.assertEqual(len(cm.output), 2)
+        self.assertIn("GETs of /student/v5/course/{label}.json",
+                      cm.output[0])
+        self.assertIn("GETs of /student/v5/term/{term}.json", cm.output[1])
+
+    def test_setting(self):
+        with override_settings(RESTCLIENTS_SWS_NPLUSONE_DETECT="raise",
+                               RESTCLIENTS_SWS_NPLUSONE_THRESHOLD=1):
+            # separate operations are counted separately
+            for i in range(3):
+                get_term_by_year_and_quarter(2013, "spring")
+                # the scope ends as the operation returns
+                self.assertIsNone(_scope.get())
+                self.assertIsNone(sys.getprofile())
+
+            self.assertRaises(NPlusOneError, get_grades_by_regid_and_term,
+                              REGID, self.term)
+            self.assertIsNone(_scope.get())
+
+        with override_settings(RESTCLIENTS_SWS_NPLUSONE_DETECT="raise",
+                               RESTCLIENTS_SWS_NPLUSONE_THRESHOLD=5):
+            get_grades_by_regid_and_term(REGID, self.term)
@@ -0,0 +1,114 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+from commonconf import override_settings
+from uw_sws import DAO, get_resource
+from uw_sws.ratelimit import (
+    PRIORITY_BULK, PRIORITY_INTERACTIVE, FileBucketState, TokenBucket,
+    current_priority, get_limiter, request_priority)
+from uw_sws.util import fdao_sws_override
+from uw_sws.worker import Worker
+
+
+class PriorityGetter(Worker):
+    def get_task_ids(self):
+        return ["1", "2"]
+
+    def task(self, tid):
+        return current_priority()
+
+
+class TokenBucketTest(TestCase):
+    def test_take(self):
+        bucket = TokenBucket(10, burst=2)
+        self.assertEqual(bucket.take(now=100.0), 0)
+        self.assertEqual(bucket.take(now=100.0), 0)
+        self.assertAlmostEqual(bucket.take(now=100.0), 0.1)
+        self.assertEqual(bucket.take(now=100.1), 0)
+        self.assertAlmostEqual(bucket.take(now=100.1), 0.1)
+        # refills up to the burst
+        self.assertEqual(bucket.take(now=200.0), 0)
+        self.assertEqual(bucket.take(now=200.0), 0)
+        self.assertTrue(bucket.take(now=200.0) > 0)
+
+    def test_bulk_reserve(self):
+        bucket = TokenBucket(10, burst=4, bulk_reserve=0.5)
+        self.assertEqual(bucket.take(PRIORITY_BULK, now=100.0), 0)
+        self.assertEqual(bucket.take(PRIORITY_BULK, now=100.0), 0)
+        self.assertAlmostEqual(bucket.take(PRIORITY_BULK, now=100.0), 0.1)
+        self.assertEqual(bucket.take(PRIORITY_INTERACTIVE, now=100.0), 0)
+        self.assertEqual(bucket.take(PRIORITY_INTERACTIVE, now=100.0), 0)
+        self.assertAlmostEqual(
+            bucket.take(PRIORITY_INTERACTIVE, now=100.0), 0.1)
+        self.assertAlmostEqual(bucket.take(PRIORITY_BULK, now=100.0), 0.3)
+
+    def test_small_burst(self):
+        for burst in (None, 1):
+            bucket = TokenBucket(1, burst=burst)
+            self.assertEqual(bucket.bulk_reserve, 0)
+            self.assertEqual(bucket.take(PRIORITY_BULK, now=100.0), 0)
+            self.assertAlmostEqual(bucket.take(PRIORITY_BULK, now=100.0), 1)
+            self.assertEqual(bucket.take(PRIORITY_BULK, now=101.0), 0)
+
+        bucket = TokenBucket(1, burst=1.5)
+        self.assertEqual(bucket.bulk_reserve, 0.5)
+        self.assertEqual(bucket.take(PRIORITY_BULK, now=100.0), 0)
+
+    def test_acquire(self):
+        bucket = TokenBucket(1, burst=1)
+        with mock.patch("uw_sws.ratelimit.time.sleep") as mock_sleep:
+            bucket.acquire()
+            self.assertEqual(mock_sleep.call_count, 0)
+            mock_sleep.side_effect = lambda seconds: bucket.state.write(
+                1.0, bucket.state.read()[1])
+            bucket.acquire()
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertTrue(0 < mock_sleep.call_args[0][0] <= 1)
+        self.assertEqual(bucket.waits, 1)
+
+    def test_file_state(self):
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sws.bucket")
+            first = TokenBucket(10, burst=2, state=FileBucketState(path))
+            second = TokenBucket(10, burst=2, state=FileBucketState(path))
+            self.assertEqual(first.take(now=100.0), 0)
+            self.assertEqual(second.take(now=100.0), 0)
+            self.assertTrue(first.take(now=100.0) > 0)
+            self.assertTrue(second.take(now=100.0) > 0)
+
+            # a forked process opens the file again
+            state = first.state
+            fd = state._fd
+            with mock.patch("uw_sws.ratelimit.os.getpid",
+                            return_value=os.getpid() + 1):
+                self.assertTrue(first.take(now=100.0) > 0)
+                self.assertNotEqual(state._fd, fd)
+            os.close(fd)
+
+    def test_priority(self):
+        self.assertEqual(current_priority(), PRIORITY_INTERACTIVE)
+        with request_priority(PRIORITY_BULK):
+            self.assertEqual(current_priority(), PRIORITY_BULK)
+            self.assertEqual(PriorityGetter().run_tasks(),
+                             {"1": PRIORITY_BULK, "2": PRIORITY_BULK})
+        self.assertEqual(current_priority(), PRIORITY_INTERACTIVE)
+
+
+@fdao_sws_override
+class RateLimitSettingsTest(TestCase):
+    def test_get_limiter(self):
+        self.assertIsNone(get_limiter(DAO))
+        with override_settings(RESTCLIENTS_SWS_RATE_LIMIT=20,
+                               RESTCLIENTS_SWS_RATE_LIMIT_BURST=5):
+            limiter = get_limiter(DAO)
+            self.assertEqual(limiter.rate, 20)
+            self.assertEqual(limiter.burst, 5)
+            self.assertEqual(limiter.bulk_reserve, 2.5)
+            self.assertIs(get_limiter(DAO), limiter)
+
+            with mock.patch.object(limiter, "acquire") as mock_acquire:
+                get_resource("/student/v5/campus.json")
+            self.assertEqual(mock_acquire.call_count, 1)
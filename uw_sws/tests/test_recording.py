@@ -0,0 +1,122 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import multiprocessing
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from commonconf import override_settings
+from restclients_core.exceptions import DataFailureException
+from uw_sws import get_resource
+from uw_sws.dao import SWS_DAO
+from uw_sws.recording import (
+    RecordingImplementation, Recorder, Replay, ReplayDAO, close_recorders,
+    get_recorder, read_archive)
+from uw_sws.tests.helpers import mock_response
+from uw_sws.term import get_current_term
+from uw_sws.util import fdao_sws_override
+
+CAMPUS_URL = "/student/v5/campus.json"
+TERM_URL = "/student/v5/term/current.json"
+
+
+def _record_in_child(path, count):
+    recorder = get_recorder(path)
+    for i in range(count):
+        recorder.record("GET", "/child/{}.json".format(i),
+                        mock_response(data="{}"), 0.0)
+
+
+@fdao_sws_override
+class RecordingTest(TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sws.jsonl.gz")
+
+    def tearDown(self):
+        close_recorders()
+        ReplayDAO._replays.clear()
+        self.tmp.cleanup()
+
+    def test_record(self):
+        with override_settings(RESTCLIENTS_SWS_RECORD_PATH=self.path):
+            self.assertIsInstance(SWS_DAO().get_implementation(),
+                                  RecordingImplementation)
+            campuses = get_resource(CAMPUS_URL)
+            self.assertEqual(get_current_term().quarter, "spring")
+            self.assertRaises(DataFailureException, get_resource,
+                              "/student/v5/none.json")
+        close_recorders()
+
+        entries = list(read_archive(self.path))
+        self.assertEqual([(e["method"], e["url"], e["status"])
+                          for e in entries],
+                         [("GET", CAMPUS_URL, 200),
+                          ("GET", TERM_URL, 200),
+                          ("GET", "/student/v5/none.json", 404)])
+        self.assertTrue(entries[0]["duration"] >= 0)
+
+        with override_settings(
+                RESTCLIENTS_SWS_DAO_CLASS="uw_sws.recording.ReplayDAO",
+                RESTCLIENTS_SWS_REPLAY_FILE=self.path,
+                RESTCLIENTS_SWS_REPLAY_TIMING=True):
+            self.assertIsInstance(SWS_DAO().get_implementation(),
+                                  ReplayDAO)
+            self.assertEqual(get_resource(CAMPUS_URL), campuses)
+            self.assertEqual(get_resource(TERM_URL)["Quarter"], "spring")
+            with self.assertRaises(DataFailureException) as cm:
+                get_resource("/student/v5/none.json")
+            self.assertEqual(cm.exception.status, 404)
+            with self.assertRaises(DataFailureException) as cm:
+                get_resource("/student/v5/term/next.json")
+            self.assertEqual(cm.exception.status, 404)
+
+    def test_record_processes(self):
+        recorder = get_recorder(self.path)
+        recorder.record("GET", CAMPUS_URL, mock_response(data="{}"), 0.0)
+        context = multiprocessing.get_context("fork")
+        children = [context.Process(target=_record_in_child,
+                                    args=(self.path, 50))
+                    for i in range(2)]
+        for child in children:
+            child.start()
+        for i in range(50):
+            recorder.record("GET", TERM_URL, mock_response(data="{}"), 0.0)
+        for child in children:
+            child.join(10)
+            self.assertEqual(child.exitcode, 0)
+
+        # readable without closing the recorder
+        urls = [entry["url"] for entry in read_archive(self.path)]
+        self.assertEqual(len(urls), 151)
+        self.assertEqual(urls[0], CAMPUS_URL)
+        self.assertEqual(urls.count(TERM_URL), 50)
+        self.assertEqual(urls.count("/child/49.json"), 2)
+
+    def test_replay_rotation(self):
+        class Response(object):
+            def __init__(self, status, data, headers=None):
+                self.status = status
+                self.data = data
+                self.headers = headers
+
+        recorder = Recorder(self.path)
+        recorder.record("GET", TERM_URL, Response(200, "a", {"ETag": "1"}),
+                        0.01)
+        recorder.record("GET", TERM_URL, Response(200, b"b"), 0.02)
+        recorder.record("GET", CAMPUS_URL, Response(200, b"\xff"), 0.0)
+        recorder.close()
+
+        replay = Replay(self.path)
+        self.assertEqual(len(replay), 3)
+        self.assertEqual(
+            [replay.next("GET", TERM_URL)["body"] for i in range(3)],
+            ["a", "b", "a"])
+        self.assertEqual(replay.next("GET", TERM_URL)["headers"], {})
+        self.assertIsNone(replay.next("PUT", TERM_URL))
+
+        dao = SWS_DAO()
+        with override_settings(RESTCLIENTS_SWS_REPLAY_FILE=self.path):
+            response = ReplayDAO("sws", dao).load(
+                "GET", CAMPUS_URL, {}, None)
+        self.assertEqual(response.data, b"\xff")
@@ -4,13 +4,16 @@
 from unittest import TestCase
 from restclients_core.exceptions import DataFailureException
 from uw_sws.exceptions import ThreadedDataError
-from uw_sws.models import Term
+from uw_sws.models import ClassSchedule, Term, RegistrationBlock
 from uw_sws.section import get_section_by_label
 from uw_sws.term import get_term_by_year_and_quarter
 from uw_sws.registration import (
     get_active_registrations_by_section, get_all_registrations_by_section,
     get_schedule_by_regid_and_term, get_registration_block_by_regid,
-    update_registration_block)
+    update_registration_block, iter_active_registrations_by_section,
+    iter_all_registrations_by_section, update_registration_blocks,
+    retry_failed_sections)
+from uw_sws.faults import FaultProfile, FaultRule, inject_faults
 from uw_sws.util import fdao_sws_override, date_to_str
 from uw_pws.util import fdao_pws_override
 from decimal import Decimal
@@ -53,6 +56,37 @@ class SWSTestRegistrations(TestCase):
         self.assertEqual(javerage_reg.class_level, "SENIOR")
         self.assertEqual(len(javerage_reg.majors), 1)
 
+    def test_iter_active_registrations_for_section(self):
+        section = get_section_by_label('2013,winter,C LIT,396/A')
+        self.assertRaises(DataFailureException,
+                          iter_active_registrations_by_section,
+                          section)
+
+        section = get_section_by_label('2017,autumn,EDC&I,552/A')
+        registrations = list(iter_active_registrations_by_section(
+            section, transcriptable_course="all",
+            include_major_class_info=True))
+        expected = get_active_registrations_by_section(
+            section, transcriptable_course="all",
+            include_major_class_info=True)
+        self.assertEqual(len(registrations), len(expected))
+        for reg, exp in zip(registrations, expected):
+            self.assertEqual(reg.regid, exp.regid)
+            self.assertEqual(reg.person.uwnetid, exp.person.uwnetid)
+            self.assertEqual(reg.class_level, exp.class_level)
+            self.assertEqual(reg.majors, exp.majors)
+            self.assertEqual(reg.json_data(), exp.json_data())
+            self.assertEqual(reg.section, section)
+
+    def test_iter_all_registrations_by_section(self):
+        section = get_section_by_label('2013,winter,DROP_T,100/B')
+        registrations = list(iter_all_registrations_by_section(
+            section, use_pws_person=True))
+        self.assertEqual(len(registrations), 3)
+        self.assertEqual(registrations[2].person.uwnetid, 'javerage')
+        self.assertEqual(registrations[2].person.surname, "STUDENT")
+        self.assertEqual(registrations[2].is_auditor, True)
+
     def test_all_registrations_by_section(self):
         # Valid section, missing file resources
         section = get_section_by_label('2013,winter,C LIT,396/A')
@@ -326,6 +360,50 @@ class SWSTestRegistrations(TestCase):
             ThreadedDataError, get_schedule_by_regid_and_term,
             '9136CCB8F66711D5BE060004AC494FFE', term)
 
+    def test_get_partial_schedule(self):
+        term = Term(quarter="spring", year=2012)
+        schedule = get_schedule_by_regid_and_term(
+            '9136CCB8F66711D5BE060004AC494FFE', term, partial=True)
+        self.assertTrue(schedule.is_partial())
+        self.assertFalse(term.credits_complete)
+        self.assertEqual(term.section_count, len(schedule.sections))
+        failure = schedule.failed_sections[0]
+        self.assertEqual(failure.status, 404)
+        self.assertIsInstance(failure.exception, ThreadedDataError)
+        self.assertEqual(failure.json_data(),
+                         {"url": failure.url, "status": 404, "message": ""})
+
+        # not shared with other schedules
+        self.assertEqual(ClassSchedule().failed_sections, [])
+        complete = get_schedule_by_regid_and_term(
+            '9136CCB8F66711D5BE060004AC494FFE',
+            get_term_by_year_and_quarter(2013, "spring"))
+        self.assertNotIn("failed_sections", complete.json_data())
+        complete.failed_sections.append(failure)
+        self.assertEqual(complete.json_data()["failed_sections"],
+                         [failure.json_data()])
+
+    def test_retry_failed_sections(self):
+        term = get_term_by_year_and_quarter(2013, "summer")
+        profile = FaultProfile([FaultRule(r"TRAIN,101/A", error_rate=1.0)])
+        with inject_faults(profile):
+            schedule = get_schedule_by_regid_and_term(
+                '12345678901234567890123456789012', term,
+                transcriptable_course="all", partial=True)
+        self.assertEqual(len(schedule.sections), 2)
+        self.assertEqual(len(schedule.failed_sections), 1)
+        self.assertEqual(schedule.failed_sections[0].status, 500)
+        self.assertFalse(term.credits_complete)
+        credits = term.credits
+
+        retry_failed_sections(schedule)
+        self.assertFalse(schedule.is_partial())
+        self.assertEqual(len(schedule.sections), 3)
+        self.assertTrue(term.credits_complete)
+        self.assertTrue(term.credits > credits)
+        self.assertEqual(schedule.registered_summer_terms,
+                         {'a-term': True, 'b-term': True, 'full-term': True})
+
 
 @fdao_pws_override
 @fdao_sws_override
@@ -372,3 +450,65 @@ class SWSTestRegistrationBlock(TestCase):
             'registrationblock.json'),
             {'X-UW-Act-as': 'bill'},
             {'Covid19StatusCode': 3, 'Covid19StatusDate': '20211003'})
+
+    def test_registration_block_etag(self):
+        block = get_registration_block_by_regid(
+            '9136CCB8F66711D5BE060004AC494FFE')
+        self.assertEqual(block.etag, '"1/01234567890123456789="')
+
+    def test_update_registration_blocks(self):
+        block = get_registration_block_by_regid(
+            '9136CCB8F66711D5BE060004AC494FFE')
+        block.covid19_status_code = 4
+
+        results = update_registration_blocks([block], actas_netid='bill')
+        self.assertEqual(len(results), 1)
+        new_block = results['9136CCB8F66711D5BE060004AC494FFE']
+        self.assertEqual(new_block.covid19_status_code, 4)
+        self.assertEqual(update_registration_blocks([]), {})
+
+    @mock.patch('uw_sws.registration.get_resource_with_etag')
+    @mock.patch('uw_sws.registration.put_resource')
+    def test_update_registration_blocks_request(self, mock_put, mock_get):
+        url = ('/student/v5/person/9136CCB8F66711D5BE060004AC494FFE/'
+               'registrationblock.json')
+        block = RegistrationBlock(data={
+            'RegID': '9136CCB8F66711D5BE060004AC494FFE',
+            'Covid19StatusCode': 3,
+            'Covid19StatusDate': '2021-10-03'},
+            etag='"1/01234567890123456789="')
+        mock_put.return_value = {'Covid19StatusCode': 3}
+
+        results = update_registration_blocks([block], concurrency=2)
+        mock_put.assert_called_once_with(
+            url, {}, {'Covid19StatusCode': 3, 'Covid19StatusDate': '20211003'},
+            etag='"1/01234567890123456789="')
+        mock_get.assert_not_called()
+        self.assertEqual(
+            results[block.uwregid].covid19_status_code, 3)
+
+        # Stale ETag, refetched and retried once
+        mock_put.reset_mock()
+        mock_put.side_effect = [
+            DataFailureException(url, 412, "Precondition Failed"),
+            {'Covid19StatusCode': 3}]
+        mock_get.return_value = ({}, '"2/fresh"')
+        results = update_registration_blocks([block])
+        self.assertEqual(mock_put.call_count, 2)
+        self.assertEqual(mock_put.call_args.kwargs['etag'], '"2/fresh"')
+        self.assertEqual(
+            results[block.uwregid].covid19_status_code, 3)
+
+        # Other failures are not retried
+        mock_put.reset_mock()
+        mock_put.side_effect = DataFailureException(url, 500, "Error")
+        results = update_registration_blocks([block])
+        self.assertEqual(mock_put.call_count, 1)
+        self.assertEqual(results[block.uwregid].status, 500)
+
+        # A second 412 is reported
+        mock_put.reset_mock()
+        mock_put.side_effect = DataFailureException(url, 412, "Failed")
+        results = update_registration_blocks([block])
+        self.assertEqual(mock_put.call_count, 2)
+        self.assertEqual(results[block.uwregid].status, 412)
@@ -0,0 +1,180 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase, mock
+from commonconf import override_settings
+from restclients_core.exceptions import DataFailureException
+from uw_pws.util import fdao_pws_override
+from uw_sws import DAO, get_resource, put_resource
+from uw_sws.exceptions import CircuitOpenError, DeadlineExceeded
+from uw_sws.metrics import InMemoryMetrics, set_metrics_sink
+from uw_sws.registration import get_schedule_by_regid_and_term
+from uw_sws.retry import (
+    BREAKER, CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, backoff_delay)
+from uw_sws.term import get_current_term
+from uw_sws.tests.helpers import mock_response
+from uw_sws.util import fdao_sws_override
+
+TERM_URL = "/student/v5/term/2013,spring.json"
+TERM_TEMPLATE = "/student/v5/term/{term}.json"
+
+
+class BackoffTest(TestCase):
+    def test_backoff_delay(self):
+        for attempt in range(6):
+            delay = backoff_delay(attempt, 0.1, 2.0)
+            self.assertTrue(0 <= delay <= min(2.0, 0.1 * 2 ** attempt))
+        self.assertEqual(backoff_delay(0, 0.1, 2.0, mock_response(
+            429, headers={"Retry-After": "1"})), 1.0)
+        self.assertEqual(backoff_delay(0, 0.1, 2.0, mock_response(
+            429, headers={"Retry-After": "60"})), 2.0)
+
+
+@fdao_pws_override
+@fdao_sws_override
+class RetryTest(TestCase):
+    def setUp(self):
+        BREAKER.reset()
+        self.metrics = InMemoryMetrics()
+        self.previous = set_metrics_sink(self.metrics)
+
+    def tearDown(self):
+        set_metrics_sink(self.previous)
+        BREAKER.reset()
+
+    def test_disabled(self):
+        with mock.patch.object(DAO, "getURL", side_effect=[
+                mock_response(503), mock_response(200)]) as mock_get:
+            self.assertRaises(DataFailureException, get_resource, TERM_URL)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @override_settings(RESTCLIENTS_SWS_RETRY_ATTEMPTS=2,
+                       RESTCLIENTS_SWS_RETRY_BACKOFF=0)
+    def test_retry(self):
+        with mock.patch.object(DAO, "getURL", side_effect=[
+                mock_response(503),
+                DataFailureException(TERM_URL, 0, "timeout"),
+                mock_response(200, '{"Year": 2013}')]) as mock_get:
+            self.assertEqual(get_resource(TERM_URL), {"Year": 2013})
+        self.assertEqual(mock_get.call_count, 3)
+        stats = self.metrics.snapshot()["GET " + TERM_TEMPLATE]
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["statuses"], {503: 1, 0: 1, 200: 1})
+
+        with mock.patch.object(DAO, "getURL", side_effect=[
+                mock_response(503), mock_response(503),
+                mock_response(503)]) as mock_get:
+            with self.assertRaises(DataFailureException) as cm:
+                get_resource(TERM_URL)
+        self.assertEqual(cm.exception.status, 503)
+        self.assertEqual(mock_get.call_count, 3)
+
+        # not transient
+        with mock.patch.object(DAO, "getURL", side_effect=[
+                mock_response(404), mock_response(200)]) as mock_get:
+            self.assertRaises(DataFailureException, get_resource, TERM_URL)
+        self.assertEqual(mock_get.call_count, 1)
+
+        # only GETs are retried
+        with mock.patch.object(DAO, "putURL", side_effect=[
+                mock_response(503), mock_response(200)]) as mock_put:
+            self.assertRaises(DataFailureException, put_resource,
+                              TERM_URL, etag="abc")
+        self.assertEqual(mock_put.call_count, 1)
+
+    @override_settings(RESTCLIENTS_SWS_RETRY_ATTEMPTS=1,
+                       RESTCLIENTS_SWS_RETRY_BACKOFF=0)
+    def test_schedule_transient_failure(self):
+        term = get_current_term()
+        get_url = DAO.getURL
+        failed = set()
+
+        def flaky_get(url, headers):
+            if "/course/" in url and url not in failed:
+                failed.add(url)
+                return mock_response(503)
+            return get_url(url, headers)
+
+        with mock.patch.object(DAO, "getURL", side_effect=flaky_get):
+            schedule = get_schedule_by_regid_and_term(
+                "9136CCB8F66711D5BE060004AC494FFE", term)
+        self.assertEqual(len(schedule.sections), 5)
+        self.assertEqual(self.metrics.snapshot()[
+            "GET /student/v5/course/{label}.json"]["retries"], 5)
+
+    @override_settings(RESTCLIENTS_SWS_CIRCUIT_BREAKER_THRESHOLD=2,
+                       RESTCLIENTS_SWS_CIRCUIT_BREAKER_RESET=60)
+    def test_circuit_breaker(self):
+        with mock.patch.object(DAO, "getURL",
+                               return_value=mock_response(503)) as mock_get:
+            for i in range(2):
+                self.assertRaises(DataFailureException, get_resource,
+                                  TERM_URL)
+            self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_OPEN)
+
+            self.assertRaises(CircuitOpenError, get_resource,
+                              "/student/v5/term/2013,summer.json")
+            self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.metrics.circuits,
+                         {TERM_TEMPLATE: CIRCUIT_OPEN})
+
+        # other endpoints are unaffected
+        self.assertIsNotNone(get_resource("/student/v5/campus.json"))
+
+        with override_settings(RESTCLIENTS_SWS_CIRCUIT_BREAKER_THRESHOLD=2,
+                               RESTCLIENTS_SWS_CIRCUIT_BREAKER_RESET=0):
+            with mock.patch.object(DAO, "getURL",
+                                   return_value=mock_response(503)):
+                self.assertRaises(DataFailureException, get_resource,
+                                  TERM_URL)
+            self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_OPEN)
+
+            self.assertEqual(get_resource(TERM_URL)["Year"], 2013)
+        self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_CLOSED)
+        self.assertEqual(BREAKER.states(), {TERM_TEMPLATE: CIRCUIT_CLOSED})
+
+    def test_half_open(self):
+        BREAKER.failure(TERM_TEMPLATE, 1)
+        BREAKER.before(TERM_TEMPLATE, 0)
+        self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_HALF_OPEN)
+        # a single probe at a time
+        self.assertRaises(CircuitOpenError, BREAKER.before, TERM_TEMPLATE, 0)
+        BREAKER.failure(TERM_TEMPLATE, 1)
+        self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_OPEN)
+
+    @override_settings(RESTCLIENTS_SWS_CIRCUIT_BREAKER_THRESHOLD=1,
+                       RESTCLIENTS_SWS_CIRCUIT_BREAKER_RESET=0)
+    def test_probe_deadline_exceeded(self):
+        BREAKER.failure(TERM_TEMPLATE, 1)
+        with mock.patch.object(DAO, "getURL",
+                               side_effect=DeadlineExceeded(TERM_URL)):
+            self.assertRaises(DeadlineExceeded, get_resource, TERM_URL)
+        # the probe is released rather than left half-open
+        self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_OPEN)
+        self.assertEqual(get_resource(TERM_URL)["Year"], 2013)
+        self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_CLOSED)
+
+    @override_settings(RESTCLIENTS_SWS_CIRCUIT_BREAKER_THRESHOLD=1,
+                       RESTCLIENTS_SWS_CIRCUIT_BREAKER_RESET=0)
+    def test_probe_not_found(self):
+        BREAKER.failure(TERM_TEMPLATE, 1)
+        url = "/student/v5/term/1900,spring.json"
+        with mock.patch.object(DAO, "getURL", side_effect=[
+                mock_response(404),
+                DataFailureException(url, 404, "Not Found")]):
+            self.assertRaises(DataFailureException, get_resource, url)
+            BREAKER.failure(TERM_TEMPLATE, 1)
+            self.assertRaises(DataFailureException, get_resource, url)
+        # the endpoint responded, so the probe closes the circuit
+        self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_CLOSED)
+        self.assertEqual(get_resource(TERM_URL)["Year"], 2013)
+
+    @override_settings(RESTCLIENTS_SWS_CIRCUIT_BREAKER_THRESHOLD=1,
+                       RESTCLIENTS_SWS_CIRCUIT_BREAKER_RESET=0)
+    def test_probe_interrupted(self):
+        BREAKER.failure(TERM_TEMPLATE, 1)
+        with mock.patch.object(DAO, "getURL",
+                               side_effect=KeyboardInterrupt):
+            self.assertRaises(KeyboardInterrupt, get_resource, TERM_URL)
+        self.assertEqual(BREAKER.state(TERM_TEMPLATE), CIRCUIT_OPEN)
+        self.assertEqual(get_resource(TERM_URL)["Year"], 2013)
@@ -462,6 +462,16 @@ class SWSTestSectionData(TestCase):
 
         self.assertEqual(len(sections), 3)
 
+    def test_changed_sections_by_term_pages(self):
+        changed_date = datetime(2013, 12, 1).date()
+        term = Term(quarter="winter", year=2013)
+        sections = get_changed_sections_by_term(changed_date, term)
+
+        self.assertEqual([s.section_label() for s in sections],
+                         ["2013,winter,ENDO,535/A", "2013,winter,ENDO,630/A",
+                          "2013,winter,C LIT,396/A",
+                          "2013,winter,ASL,101/A"])
+
     def test_instructor_published(self):
         # Published Instructors
         pi_section = get_section_by_label('2013,summer,B BIO,180/A')
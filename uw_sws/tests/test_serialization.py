@@ -0,0 +1,120 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import marshal
+from datetime import date, datetime, time
+from decimal import Decimal
+from unittest import TestCase
+from commonconf import override_settings
+from uw_pws.util import fdao_pws_override
+from uw_sws.enrollment import get_enrollment_history_by_regid
+from uw_sws.exceptions import SerializationError
+from uw_sws.lite import LazyEnrollment, LiteSection
+from uw_sws.models import Section, Term
+from uw_sws.registration import (
+    get_active_registrations_by_section, get_schedule_by_regid_and_term)
+from uw_sws.section import get_section_by_label
+from uw_sws.serialization import (
+    FORMAT_VERSION, HEADER, MAGIC, PYTHON_VERSION, dumps, loads)
+from uw_sws.term import get_term_by_year_and_quarter
+from uw_sws.util import fdao_sws_override
+
+REGID = "9136CCB8F66711D5BE060004AC494FFE"
+SECTION_LABEL = "2013,spring,MATH,125/H"
+
+
+@fdao_pws_override
+@fdao_sws_override
+class SerializationTest(TestCase):
+    def test_values(self):
+        value = {"a": [1, 2.5, None, True, "x", b"y"],
+                 "b": (date(2013, 4, 1), datetime(2013, 4, 1, 8, 30)),
+                 "c": {time(8, 30), Decimal("5.0")},
+                 "d": frozenset(["e"])}
+        self.assertEqual(loads(dumps(value)), value)
+
+    def test_term(self):
+        term = get_term_by_year_and_quarter(2013, "spring")
+        loaded = loads(dumps(term))
+        self.assertIsInstance(loaded, Term)
+        self.assertEqual(loaded.json_data(), term.json_data())
+        self.assertEqual(loaded.get_quarter_display(), "Spring")
+        self.assertEqual(loaded.first_day_quarter, date(2013, 4, 1))
+        self.assertEqual(loaded.time_schedule_published,
+                         term.time_schedule_published)
+
+        # unset fields keep their defaults
+        self.assertEqual(loads(dumps(Term(year=2013))).quarter,
+                         Term().quarter)
+
+    def test_section(self):
+        section = get_section_by_label(SECTION_LABEL)
+        loaded = loads(dumps(section))
+        self.assertIsInstance(loaded, Section)
+        self.assertEqual(loaded.json_data(), section.json_data())
+        meeting = loaded.meetings[0]
+        self.assertIs(meeting.section, loaded)
+        self.assertIs(meeting.term, loaded.term)
+        self.assertEqual(meeting.instructors[0].uwregid,
+                         section.meetings[0].instructors[0].uwregid)
+        self.assertEqual(loaded.get_instructors()[0].display_name,
+                         section.get_instructors()[0].display_name)
+
+    def test_schedule(self):
+        term = get_term_by_year_and_quarter(2013, "spring")
+        schedule = get_schedule_by_regid_and_term(REGID, term)
+        loaded = loads(dumps(schedule))
+        self.assertEqual(loaded.json_data(), schedule.json_data())
+        self.assertEqual(loaded.term.credits, schedule.term.credits)
+        self.assertEqual(loaded.sections[0].student_credits,
+                         schedule.sections[0].student_credits)
+        self.assertIs(loaded.sections[0].term, loaded.sections[1].term)
+
+    def test_registrations(self):
+        section = get_section_by_label("2017,autumn,EDC&I,552/A")
+        registrations = get_active_registrations_by_section(
+            section, transcriptable_course="all")
+        loaded = loads(dumps(registrations))
+        self.assertEqual(len(loaded), len(registrations))
+        self.assertEqual([r.json_data() for r in loaded],
+                         [r.json_data() for r in registrations])
+        self.assertEqual(loaded[1].person.uwnetid, "javerage")
+
+    def test_lite_and_lazy(self):
+        with override_settings(RESTCLIENTS_SWS_LITE_MODELS=True):
+            section = get_section_by_label(SECTION_LABEL)
+        loaded = loads(dumps(section))
+        self.assertIsInstance(loaded, LiteSection)
+        self.assertEqual(loaded.json_data(), section.json_data())
+
+        with override_settings(RESTCLIENTS_SWS_LAZY_MODELS=True):
+            history = get_enrollment_history_by_regid(REGID)
+        loaded = loads(dumps(history))
+        self.assertIsInstance(loaded[0], LazyEnrollment)
+        self.assertEqual([e.json_data() for e in loaded],
+                         [e.json_data() for e in history])
+
+    def test_errors(self):
+        self.assertRaises(SerializationError, dumps, object())
+        self.assertRaises(SerializationError, dumps, {date(2013, 4, 1): 1})
+        self.assertRaises(SerializationError, loads, b"")
+        self.assertRaises(SerializationError, loads, b"not a model")
+
+        data = dumps(Term(year=2013))
+        self.assertRaises(SerializationError, loads, data[:-3])
+        self.assertRaises(
+            SerializationError, loads,
+            HEADER.pack(MAGIC, FORMAT_VERSION + 1, marshal.version,
+                        *PYTHON_VERSION) + data[HEADER.size:])
+        # written by another Python version with the same marshal version
+        self.assertRaises(
+            SerializationError, loads,
+            HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version,
+                        PYTHON_VERSION[0], PYTHON_VERSION[1] + 1) +
+            data[HEADER.size:])
+
+        payload = marshal.dumps((["os:system"], [], [], None))
+        self.assertRaises(
+            SerializationError, loads,
+            HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version,
+                        *PYTHON_VERSION) + payload)
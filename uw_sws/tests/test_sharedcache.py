@@ -0,0 +1,129 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import multiprocessing
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
+from commonconf import override_settings
+from uw_sws import DAO
+from uw_sws.cache import MemoryCache, ResponseCache, get_cache
+from uw_sws.tests.helpers import mock_response
+from uw_sws.sharedcache import (
+    HEADER_SIZE, SLOT, SharedMemoryStore, fcntl)
+from uw_sws.ttl import CacheRule, TTLPolicy
+
+TERM_URL = "/student/v5/term/2013,spring.json"
+SECTION_URL = "/student/v5/course/2013,spring,MATH,125/H.json"
+
+
+def _set_in_child(path, url):
+    SharedMemoryStore(path).set(url, (b'{"child": true}', "2", None))
+
+
+@skipIf(fcntl is None, "requires fcntl")
+class SharedMemoryStoreTest(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "sws.cache")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_entries(self):
+        store = SharedMemoryStore(self.path, size=1024 * 1024, slots=64)
+        self.assertIsNone(store.get(TERM_URL))
+        store.set(TERM_URL, (b'{"Year": 2013}', "1", None))
+        store.set(SECTION_URL, (b"{}", None, 100.0))
+        self.assertEqual(store.get(TERM_URL), (b'{"Year": 2013}', "1", None))
+        self.assertEqual(store.get(SECTION_URL), (b"{}", None, 100.0))
+
+        store.set(TERM_URL, (b'{"Year": 2014}', None, None))
+        self.assertEqual(store.get(TERM_URL), (b'{"Year": 2014}', None, None))
+
+        # another store of the file, sized by its header
+        other = SharedMemoryStore(self.path, size=4096, slots=8)
+        self.assertEqual(other.get(TERM_URL)[0], b'{"Year": 2014}')
+        self.assertEqual(other.slots, 64)
+        self.assertEqual(other.items(10, now=50),
+                         [(TERM_URL, (b'{"Year": 2014}', None, None)),
+                          (SECTION_URL, (b"{}", None, 100.0))])
+        self.assertEqual(len(other.items(1, now=50)), 1)
+        self.assertEqual(len(other.items(10, now=200)), 1)
+
+        other.purge(now=200)
+        self.assertIsNone(store.get(SECTION_URL))
+        store.delete(TERM_URL)
+        self.assertIsNone(other.get(TERM_URL))
+
+        store.set(TERM_URL, (b"{}", None, None))
+        store.clear()
+        self.assertEqual(store.items(10), [])
+        store.close()
+        other.close()
+
+    def test_log_wraps(self):
+        slots = 64
+        store = SharedMemoryStore(
+            self.path, size=HEADER_SIZE + slots * SLOT.size + 4096,
+            slots=slots)
+        urls = ["/student/v5/course/2013,spring,MATH,{}/A.json".format(i)
+                for i in range(100)]
+        for url in urls:
+            store.set(url, (url.encode() * 4, None, None))
+        # the oldest records were overwritten, the newest are intact
+        self.assertIsNone(store.get(urls[0]))
+        for url in urls[-10:]:
+            self.assertEqual(store.get(url)[0], url.encode() * 4)
+        for url, entry in store.items(100):
+            self.assertEqual(entry[0], url.encode() * 4)
+
+        # too large to store
+        store.set(TERM_URL, (b"x" * 1024, None, None))
+        self.assertIsNone(store.get(TERM_URL))
+        store.close()
+
+    def test_processes(self):
+        store = SharedMemoryStore(self.path, size=1024 * 1024, slots=64)
+        store.set(SECTION_URL, (b"{}", None, None))
+        context = multiprocessing.get_context("fork")
+        child = context.Process(target=_set_in_child,
+                                args=(self.path, TERM_URL))
+        child.start()
+        child.join(10)
+        self.assertEqual(child.exitcode, 0)
+        self.assertEqual(store.get(TERM_URL), (b'{"child": true}', "2", None))
+        self.assertEqual(store.get(SECTION_URL), (b"{}", None, None))
+        store.close()
+
+    def test_workers(self):
+        store = SharedMemoryStore(self.path, size=1024 * 1024, slots=64)
+        policy = TTLPolicy((CacheRule(r"course", 60, persist=True),))
+        first = ResponseCache(MemoryCache(10), store, policy)
+        second = ResponseCache(MemoryCache(10), store, policy)
+
+        first.set(SECTION_URL, mock_response(data=b"1"), now=1000)
+        self.assertEqual(second.fetch(
+            SECTION_URL, None, now=1000).data, b"1")
+        # refreshed by the first worker after the second's entry expired,
+        # within and past max_stale
+        for data, stored, now in ((b"2", 1050, 1070), (b"3", 1200, 1250)):
+            first.set(SECTION_URL, mock_response(data=data), now=stored)
+            self.assertEqual(second.fetch(
+                SECTION_URL, None, now=now).data, data)
+        self.assertEqual(second.hits, 3)
+        self.assertEqual(second.stale_hits, 0)
+        store.close()
+
+    def test_get_cache(self):
+        with override_settings(RESTCLIENTS_SWS_CACHE_PATH=self.path,
+                               RESTCLIENTS_SWS_CACHE_STORE="shared",
+                               RESTCLIENTS_SWS_CACHE_SHARED_SIZE=1024 * 1024):
+            cache = get_cache(DAO)
+            self.assertIsInstance(cache.store, SharedMemoryStore)
+            self.assertEqual(cache.memory.max_size, 0)
+            cache.store.close()
+
+        with override_settings(RESTCLIENTS_SWS_CACHE_PATH=self.path,
+                               RESTCLIENTS_SWS_CACHE_STORE="redis"):
+            self.assertRaises(ValueError, get_cache, DAO)
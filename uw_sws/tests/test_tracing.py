@@ -0,0 +1,111 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from io import StringIO
+from unittest import TestCase, skipIf
+from commonconf import override_settings
+from uw_pws.util import fdao_pws_override
+from uw_sws import get_resource, tracing
+from uw_sws.registration import get_schedule_by_regid_and_term
+from uw_sws.term import get_current_term
+from uw_sws.tracing import (
+    InMemoryCollector, JSONCollector, OpenTelemetryCollector,
+    set_trace_collector, span, traced)
+from uw_sws.util import fdao_sws_override
+from uw_sws.worker import Worker
+
+REGID = "9136CCB8F66711D5BE060004AC494FFE"
+
+
+class CampusGetter(Worker):
+    def get_task_ids(self):
+        return ["1", "2", "3"]
+
+    def task(self, tid):
+        return get_resource("/student/v5/campus.json")
+
+
+@fdao_pws_override
+@fdao_sws_override
+class TracingTest(TestCase):
+    def setUp(self):
+        self.collector = InMemoryCollector()
+        self.previous = set_trace_collector(self.collector)
+
+    def tearDown(self):
+        set_trace_collector(self.previous)
+
+    def test_disabled(self):
+        set_trace_collector(None)
+        with span("nothing") as s:
+            self.assertIsNone(s)
+        self.assertEqual(traced()(lambda x: x + 1)(1), 2)
+        get_current_term()
+        self.assertEqual(self.collector.spans, [])
+
+    def test_spans(self):
+        term = get_current_term()
+        roots = self.collector.roots()
+        self.assertEqual([s.name for s in roots], ["get_current_term"])
+        children = self.collector.children(roots[0])
+        self.assertEqual(children[0].name, "http GET")
+        self.assertEqual(children[0].attributes["status"], 200)
+        self.assertEqual(children[0].attributes["url"],
+                         "/student/v5/term/current.json")
+        self.assertEqual(children[1].name, "json decode")
+        self.assertTrue(all(s.trace_id == roots[0].trace_id
+                            for s in self.collector.spans))
+        self.assertTrue(roots[0].duration >= children[0].duration)
+
+        with self.assertRaises(ValueError):
+            with span("failing"):
+                raise ValueError("bad")
+        self.assertEqual(self.collector.spans[-1].attributes["error"],
+                         "ValueError('bad')")
+
+    def test_schedule_threads(self):
+        term = get_current_term()
+        self.collector.clear()
+        with override_settings(RESTCLIENTS_USE_THREADING=True):
+            get_schedule_by_regid_and_term(REGID, term)
+
+        roots = self.collector.roots()
+        self.assertEqual([s.name for s in roots],
+                         ["get_schedule_by_regid_and_term"])
+        trace_id = roots[0].trace_id
+        self.assertTrue(all(s.trace_id == trace_id
+                            for s in self.collector.spans))
+
+        names = [s.name for s in self.collector.spans]
+        self.assertIn("_json_to_stud_reg_schedule", names)
+        self.assertIn("wait SWSCourseThread", names)
+        self.assertIn("_json_to_section", names)
+        threads = set(s.thread for s in self.collector.spans
+                      if s.name == "http GET")
+        self.assertTrue(len(threads) > 1)
+
+    def test_worker(self):
+        with override_settings(RESTCLIENTS_SWS_THREAD_POOL_SIZE=3):
+            with span("outer") as outer:
+                CampusGetter().run_tasks()
+        tasks = self.collector.children(outer)
+        self.assertEqual([s.name for s in tasks], ["CampusGetter.task"] * 3)
+        self.assertEqual(sorted(s.attributes["tid"] for s in tasks),
+                         ["1", "2", "3"])
+        for task in tasks:
+            self.assertEqual([s.name for s in self.collector.children(task)],
+                             ["http GET", "json decode"])
+
+    def test_json_collector(self):
+        stream = StringIO()
+        set_trace_collector(JSONCollector(stream))
+        get_resource("/student/v5/campus.json")
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([line["name"] for line in lines],
+                         ["http GET", "json decode"])
+        self.assertIsNone(lines[0]["parent_id"])
+
+    @skipIf(tracing.otel_trace is not None, "opentelemetry installed")
+    def test_opentelemetry_missing(self):
+        self.assertRaises(ImportError, OpenTelemetryCollector)
@@ -0,0 +1,106 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+from datetime import date, datetime
+from unittest import TestCase
+from uw_sws.ttl import (
+    ADD_DROP, CLOSED, CLOSING, FUTURE, GRADING, HOUR, INSTRUCTION, MINUTE,
+    REGISTRATION, WEEK, TermCalendar, TTLPolicy, is_past_term, url_term)
+
+TERM_URL = "/student/v5/term/2013,spring.json"
+SECTION_URL = "/student/v5/course/2013,spring,MATH,125/H.json"
+REGISTRATION_URL = (
+    "/student/v5/registration.json?curriculum_abbreviation=MATH"
+    "&course_number=125&verbose=true&year=2013&quarter=spring"
+    "&is_active=true&section_id=H")
+ENROLLMENT_URL = (
+    "/student/v5/enrollment/2013,spring,9136CCB8F66711D5BE060004AC494FFE.json")
+
+# the resource file, as the mock dao moves its grading period to today
+with open(os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "resources", "sws",
+        "file", "student", "v5", "term", "2013_spring.json")) as f:
+    TERM_DATA = f.read()
+
+
+class TTLPolicyTest(TestCase):
+    def test_url_term(self):
+        self.assertEqual(url_term(TERM_URL), (2013, "spring"))
+        self.assertEqual(url_term(SECTION_URL), (2013, "spring"))
+        self.assertEqual(url_term(REGISTRATION_URL), (2013, "spring"))
+        self.assertIsNone(url_term("/student/v5/campus.json"))
+        self.assertIsNone(url_term("/student/v5/section.json?year=x"))
+
+    def test_is_past_term(self):
+        today = date(2013, 7, 1)
+        self.assertTrue(is_past_term((2013, "winter"), today))
+        self.assertFalse(is_past_term((2013, "spring"), today))
+        self.assertFalse(is_past_term((2013, "summer"), today))
+        self.assertFalse(is_past_term(None, today))
+
+    def test_calendar(self):
+        calendar = TermCalendar.from_json(json.loads(TERM_DATA))
+        self.assertEqual(calendar.phase(datetime(2013, 2, 1)),
+                         (FUTURE, datetime(2013, 2, 15)))
+        self.assertEqual(calendar.phase(datetime(2013, 3, 4, 12)),
+                         (REGISTRATION, datetime(2013, 4, 8)))
+        self.assertEqual(calendar.phase(datetime(2013, 4, 10)),
+                         (ADD_DROP, datetime(2013, 5, 20)))
+        self.assertEqual(calendar.phase(datetime(2013, 5, 21)),
+                         (INSTRUCTION, datetime(2013, 5, 27, 8)))
+        self.assertEqual(calendar.phase(datetime(2013, 6, 1)),
+                         (GRADING, datetime(2013, 6, 18, 17)))
+        self.assertEqual(calendar.phase(datetime(2013, 6, 20)),
+                         (CLOSING, datetime(2013, 7, 3, 17)))
+        self.assertEqual(calendar.phase(datetime(2013, 7, 4)), (CLOSED, None))
+        self.assertEqual(TermCalendar.from_json({}).phase(datetime.now()),
+                         (FUTURE, None))
+
+    def test_rules(self):
+        policy = TTLPolicy()
+        now = datetime(2013, 4, 10)
+        self.assertEqual(policy.get(TERM_URL, now)[0], 24 * HOUR)
+        self.assertEqual(policy.get("/student/v5/college.json", now),
+                         (WEEK, True))
+        self.assertEqual(policy.get(
+            "/student/v5/course/2013,spring,MATH,125/H/status.json", now),
+            (MINUTE, False))
+        self.assertEqual(policy.get("/student/v5/person/{}.json".format(
+            "9136CCB8F66711D5BE060004AC494FFE"), now), (0, False))
+        self.assertEqual(policy.get(
+            "/student/v5/enrollment.json?reg_id=9136CCB8F66711D5BE060004AC4"
+            "94FFE&verbose=true", now), (0, True))
+
+        # the term's calendar is not known yet
+        self.assertEqual(policy.get(REGISTRATION_URL, now), (MINUTE, True))
+        self.assertEqual(policy.get(SECTION_URL, now)[0], 5 * MINUTE)
+        self.assertIsNone(policy.get(SECTION_URL, datetime(2014, 1, 1))[0])
+
+    def test_term_ttls(self):
+        policy = TTLPolicy()
+        policy.observe("/student/v5/person.json", TERM_DATA)
+        self.assertIsNone(policy.calendar((2013, "spring")))
+        policy.observe(TERM_URL, b"not json")
+        self.assertIsNone(policy.calendar((2013, "spring")))
+        policy.observe(TERM_URL, TERM_DATA)
+        self.assertIsNotNone(policy.calendar((2013, "spring")))
+
+        def ttl(url, *now):
+            return policy.get(url, datetime(*now))[0]
+
+        self.assertEqual(ttl(REGISTRATION_URL, 2013, 1, 10), 15 * MINUTE)
+        self.assertEqual(ttl(REGISTRATION_URL, 2013, 3, 4), MINUTE)
+        self.assertEqual(ttl(ENROLLMENT_URL, 2013, 4, 10), 5 * MINUTE)
+        self.assertEqual(ttl(SECTION_URL, 2013, 3, 4), 5 * MINUTE)
+        self.assertEqual(ttl(SECTION_URL, 2013, 5, 21), HOUR)
+        self.assertEqual(ttl(REGISTRATION_URL, 2013, 6, 1), 5 * MINUTE)
+
+        # capped at the start of the next phase
+        self.assertEqual(ttl(SECTION_URL, 2013, 2, 14, 23, 59, 30), 30)
+        self.assertEqual(ttl(REGISTRATION_URL, 2013, 6, 18, 16, 58), 2 * 60)
+
+        # frozen once the grading period closes
+        self.assertIsNone(ttl(SECTION_URL, 2013, 7, 4))
+        self.assertIsNone(ttl(ENROLLMENT_URL, 2013, 7, 4))
@@ -0,0 +1,44 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from unittest import TestCase
+from uw_sws.util import iter_json_array
+
+
+class SWSTestUtil(TestCase):
+    DATA = json.dumps({
+        "Current": {"Href": "/a.json"},
+        "Registrations": [{"RegID": "A", "Credits": 3.5},
+                          {"RegID": "B", "Nested": {"Registrations": []}},
+                          []],
+        "TotalCount": 3,
+        "Next": None,
+    }, indent=2)
+
+    def test_iter_json_array(self):
+        items = iter_json_array(self.DATA, "Registrations")
+        self.assertEqual(next(items), {"RegID": "A", "Credits": 3.5})
+        self.assertEqual(list(items), [
+            {"RegID": "B", "Nested": {"Registrations": []}}, []])
+
+        self.assertEqual(
+            list(iter_json_array(self.DATA.encode("utf-8"),
+                                 "Registrations")),
+            json.loads(self.DATA)["Registrations"])
+        self.assertEqual(list(iter_json_array(self.DATA, "Missing")), [])
+        self.assertEqual(list(iter_json_array(self.DATA, "Next")), [])
+        self.assertEqual(list(iter_json_array("{}", "Registrations")), [])
+        self.assertEqual(
+            list(iter_json_array(' { "Registrations" : [ ] } ',
+                                 "Registrations")), [])
+
+    def test_iter_json_array_invalid(self):
+        self.assertRaises(
+            ValueError, list, iter_json_array("[]", "Registrations"))
+        self.assertRaises(
+            ValueError, list,
+            iter_json_array('{"Registrations": [1 2]}', "Registrations"))
+        self.assertRaises(
+            ValueError, list,
+            iter_json_array('{"A": 1 "B": 2}', "Registrations"))
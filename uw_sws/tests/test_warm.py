@@ -0,0 +1,103 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+from commonconf import override_settings
+from uw_pws.util import fdao_pws_override
+from uw_sws import DAO
+from uw_sws.cache import get_cache
+from uw_sws.models import Curriculum
+from uw_sws.ratelimit import PRIORITY_BULK, current_priority
+from uw_sws.term import get_term_by_year_and_quarter
+from uw_sws.util import fdao_sws_override
+from uw_sws.warm import TermWarmer, warm_term
+
+SECTION_URLS = ["/student/v5/course/2013,winter,ENDO,535/A.json",
+                "/student/v5/course/2013,winter,ENDO,630/A.json"]
+
+
+def curricula(*labels):
+    return mock.patch("uw_sws.warm.get_curricula_by_term",
+                      return_value=[Curriculum(label=label)
+                                    for label in labels])
+
+
+@fdao_pws_override
+@fdao_sws_override
+class WarmTest(TestCase):
+    def setUp(self):
+        self.term = get_term_by_year_and_quarter(2013, "winter")
+        self.directory = TemporaryDirectory()
+        self.checkpoint = os.path.join(self.directory.name, "warm.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_warm(self):
+        progress = []
+
+        def report(stage, done, total):
+            progress.append((stage, done, total, current_priority()))
+
+        with override_settings(RESTCLIENTS_SWS_CACHE_MEMORY_SIZE=100):
+            with curricula("ENDO"):
+                counts = warm_term(self.term, sections=True,
+                                   checkpoint=self.checkpoint,
+                                   progress=report)
+            cache = get_cache(DAO)
+            for url in SECTION_URLS:
+                self.assertIsNotNone(cache.get(url))
+            cache.clear()
+
+        self.assertEqual(counts, {"terms": 4, "curricula": 1,
+                                  "section_refs": 1, "sections": 2})
+        self.assertEqual(progress[0], ("terms", 1, 4, PRIORITY_BULK))
+        self.assertEqual(progress[-1][:3], ("sections", 2, 2))
+        self.assertEqual(set(p[3] for p in progress), {PRIORITY_BULK})
+        # completed, so a next warm-up starts over
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+    @override_settings(RESTCLIENTS_SWS_CACHE_MEMORY_SIZE=100)
+    def test_resume(self):
+        self.addCleanup(get_cache(DAO).clear)
+        warmer = TermWarmer(self.term, instructors=True,
+                            checkpoint=self.checkpoint, concurrency=2)
+        with curricula("ENDO", "NONE"), self.assertLogs(
+                "uw_sws.worker", "ERROR"):
+            counts = warmer.run()
+        self.assertEqual(counts["section_refs"], 1)
+        self.assertEqual(counts["sections"], 2)
+        self.assertEqual(warmer.failed, {"section_refs": 1, "sections": 0})
+
+        # kept, as a curriculum failed
+        with open(self.checkpoint) as f:
+            saved = json.load(f)
+        self.assertEqual(saved["term"], "2013,winter")
+        self.assertEqual(saved["section_refs"], {"ENDO": SECTION_URLS})
+        self.assertEqual(sorted(saved["sections"]), SECTION_URLS)
+
+        progress = []
+        with curricula("ENDO"):
+            counts = warm_term(
+                self.term, sections=True, checkpoint=self.checkpoint,
+                progress=lambda *args: progress.append(args))
+        self.assertEqual(counts["section_refs"], 0)
+        self.assertEqual(counts["sections"], 0)
+        self.assertNotIn("section_refs", [p[0] for p in progress])
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+        # another term's checkpoint is ignored
+        with open(self.checkpoint, "w") as f:
+            json.dump({"term": "2013,spring",
+                       "section_refs": {"ENDO": []}}, f)
+        with curricula("ENDO"):
+            counts = warm_term(self.term, sections=True,
+                               checkpoint=self.checkpoint)
+        self.assertEqual(counts["sections"], 2)
+
+    def test_no_cache(self):
+        with curricula(), self.assertLogs("uw_sws.warm", "WARNING"):
+            self.assertEqual(warm_term(self.term)["section_refs"], 0)
@@ -1,8 +1,10 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
-from uw_sws.dao import SWS_DAO
+import threading
 from restclients_core.thread import Thread
+from uw_sws import _load
+from uw_sws.util import propagate_context
 
 
 class SWSCourseThread(Thread):
@@ -11,6 +13,12 @@ class SWSCourseThread(Thread):
     headers = None
     response = None
     exception = None
+    done = None  # an optional queue the finished thread is put on
+
+    def __init__(self, *args, **kwargs):
+        super(SWSCourseThread, self).__init__(*args, **kwargs)
+        # created in the caller's thread, so requests run in its context
+        self._load = propagate_context(_load)
 
     def run(self):
         if self.url is None:
@@ -19,8 +27,21 @@ class SWSCourseThread(Thread):
         args = self.headers or {}
 
         try:
-            self.response = SWS_DAO().getURL(self.url, args)
+            self.response = self._load("GET", self.url, args)
         except Exception as ex:
             self.exception = ex
 
+        if self.done is not None:
+            self.done.put(self)
         self.final()
+
+
+def join_thread(thread, deadline=None):
+    """
+    Waits for a restclients_core Thread, for no longer than the time
+    remaining to the deadline.
+    """
+    remaining = None if deadline is None else deadline.remaining()
+    if remaining is None or not thread._use_thread:
+        return thread.join()
+    threading.Thread.join(thread, remaining)
@@ -0,0 +1,208 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+In-process tracing of SWS client calls. Public API calls, http requests
+and model parsing are recorded as nested spans, and the current span is
+carried into the threads the client fans out to (see propagate_context
+in uw_sws.util). Spans are exported to the installed collector; with
+none installed, tracing is a None check.
+"""
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+_collector = None
+_current_span = ContextVar("uw_sws_span", default=None)
+
+
+def set_trace_collector(collector):
+    """
+    Installs the collector receiving spans; None disables tracing.
+    Returns the previously installed collector.
+    """
+    global _collector
+    previous = _collector
+    _collector = collector
+    return previous
+
+
+def get_trace_collector():
+    return _collector
+
+
+def current_span():
+    return _current_span.get()
+
+
+class Span(object):
+    """
+    A timed operation, with times in nanoseconds since the epoch.
+    """
+    def __init__(self, name, parent=None, attributes=None):
+        self.name = name
+        self.parent = parent
+        self.trace_id = (parent.trace_id if parent is not None
+                         else "{:032x}".format(random.getrandbits(128)))
+        self.span_id = "{:016x}".format(random.getrandbits(64))
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = dict(attributes or {})
+        self.thread = threading.current_thread().name
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.native = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    @property
+    def duration(self):
+        """
+        The span's duration in seconds, once ended.
+        """
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def json_data(self):
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "thread": self.thread,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration": self.duration,
+            "attributes": self.attributes,
+        }
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Records the block as a child span of the current span. Yields the
+    Span, or None when tracing is disabled.
+    """
+    collector = _collector
+    if collector is None:
+        yield None
+        return
+
+    new_span = Span(name, _current_span.get(), attributes)
+    collector.start(new_span)
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except Exception as ex:
+        new_span.set_attribute("error", repr(ex))
+        raise
+    finally:
+        _current_span.reset(token)
+        new_span.end_ns = time.time_ns()
+        collector.end(new_span)
+
+
+def traced(name=None):
+    """
+    Decorator recording each call of the function as a span.
+    """
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _collector is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TraceCollector(object):
+    """
+    The collector interface: start() is called as a span begins and
+    end() once it has ended.
+    """
+    def start(self, span):
+        pass
+
+    def end(self, span):
+        pass
+
+
+class InMemoryCollector(TraceCollector):
+    """
+    Keeps ended spans in memory.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans = []
+
+    def end(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def children(self, parent):
+        return sorted([s for s in self.spans if s.parent_id == parent.span_id],
+                      key=lambda s: s.start_ns)
+
+    def roots(self):
+        return sorted([s for s in self.spans if s.parent_id is None],
+                      key=lambda s: s.start_ns)
+
+    def clear(self):
+        with self._lock:
+            self.spans = []
+
+
+class JSONCollector(TraceCollector):
+    """
+    Writes each ended span as a json line to the stream.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def end(self, span):
+        line = json.dumps(span.json_data(), default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+
+
+class OpenTelemetryCollector(TraceCollector):
+    """
+    Mirrors spans into OpenTelemetry, using the given tracer or the
+    global tracer provider's. Requires the opentelemetry-api package.
+    """
+    def __init__(self, tracer=None):
+        if otel_trace is None:
+            raise ImportError("OpenTelemetryCollector requires the "
+                              "opentelemetry-api package")
+        self.tracer = tracer or otel_trace.get_tracer(__name__)
+
+    def start(self, span):
+        context = None
+        if span.parent is not None and span.parent.native is not None:
+            context = otel_trace.set_span_in_context(span.parent.native)
+        span.native = self.tracer.start_span(
+            span.name, context=context, start_time=span.start_ns)
+
+    def end(self, span):
+        if span.native is None:
+            return
+        for key, value in span.attributes.items():
+            if not isinstance(value, (str, bool, int, float)):
+                value = str(value)
+            span.native.set_attribute(key, value)
+        span.native.end(end_time=span.end_ns)
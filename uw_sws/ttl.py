@@ -0,0 +1,251 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+The time-to-live policy of cached SWS responses, by endpoint and, for
+the resources of a term, by where the term is in its calendar.
+
+A term's calendar is split into phases by its dates: FUTURE until the
+first registration period, REGISTRATION through the registration
+periods, ADD_DROP to the last drop day, INSTRUCTION to the grading
+period, GRADING to the grade submission deadline, CLOSING to the close
+of the grading period, and CLOSED after it. Registrations change by the
+minute during registration, sections as their enrollment moves, and
+both are frozen once the term is CLOSED. A term-resource ttl never
+extends past the start of the term's next phase, so that no response
+is served stale into a phase in which it changes faster.
+
+The policy learns each term's calendar from the term responses it is
+shown (see TTLPolicy.observe); for a term whose calendar is not yet
+known, it estimates whether the term is closed by calendar quarter,
+and otherwise uses the ttl of its most volatile phase.
+"""
+import json
+import re
+from datetime import timedelta
+from threading import Lock
+from urllib.parse import parse_qs
+from uw_sws.dao import sws_now
+from uw_sws.metrics import url_template
+from uw_sws.util import str_to_datetime
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+QUARTERS = ("winter", "spring", "summer", "autumn")
+
+FUTURE = "future"
+REGISTRATION = "registration"
+ADD_DROP = "add_drop"
+INSTRUCTION = "instruction"
+GRADING = "grading"
+CLOSING = "closing"
+CLOSED = "closed"
+PHASES = (FUTURE, REGISTRATION, ADD_DROP, INSTRUCTION, GRADING, CLOSING,
+          CLOSED)
+
+_TERM_PATH = re.compile(r"(\d{4}),(winter|spring|summer|autumn)\b", re.I)
+_TERM_ENDPOINT = re.compile(r"^/student/v5/term/")
+
+
+class TermCalendar(object):
+    """
+    The phases of a term: a list of (start, phase), by start.
+    """
+    def __init__(self, boundaries):
+        self.boundaries = sorted(boundaries, key=lambda b: b[0])
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        Returns the calendar of a term resource's json data.
+        """
+        def dates(values):
+            values = [str_to_datetime(value) for value in values]
+            return [value.replace(tzinfo=None) for value in values
+                    if value is not None]
+
+        def date(*names):
+            values = dates(data.get(name) for name in names)
+            return min(values) if values else None
+
+        periods = data.get("RegistrationPeriods") or []
+        starts = dates(period.get("StartDate") for period in periods)
+        ends = dates(period.get("EndDate") for period in periods)
+        last_drop = date("LastDropDay")
+
+        boundaries = [
+            (min(starts) if starts else None, REGISTRATION),
+            (max(ends) + timedelta(days=1) if ends else None, ADD_DROP),
+            (last_drop + timedelta(days=1) if last_drop else None,
+             INSTRUCTION),
+            (date("GradingPeriodOpen", "GradingPeriodOpenATerm"), GRADING),
+            (date("GradeSubmissionDeadline"), CLOSING),
+            (date("GradingPeriodClose"), CLOSED),
+        ]
+        return cls([(start, phase) for start, phase in boundaries
+                    if start is not None])
+
+    def phase(self, now):
+        """
+        Returns the phase of the term at now, a naive SWS datetime, and
+        the start of its next phase, or None.
+        """
+        phase = FUTURE
+        for start, next_phase in self.boundaries:
+            if start > now:
+                return phase, start
+            phase = next_phase
+        return phase, None
+
+
+class PhaseTTL(object):
+    """
+    The ttls of a term's resources by phase, CLOSED being None (no
+    expiry) unless given.
+    """
+    def __init__(self, ttls):
+        self.ttls = dict({CLOSED: None}, **ttls)
+        self.volatile = min(ttl for ttl in self.ttls.values()
+                            if ttl is not None)
+
+    def get_ttl(self, calendar, now):
+        phase, until = calendar.phase(now)
+        ttl = self.ttls.get(phase, self.volatile)
+        if until is not None:
+            remaining = max(0, int((until - now).total_seconds()))
+            ttl = remaining if ttl is None else min(ttl, remaining)
+        return ttl
+
+
+class CacheRule(object):
+    """
+    Caches the responses of endpoints matching pattern for ttl: seconds,
+    None for no expiry, 0 for not at all, or a PhaseTTL for the phase of
+    the url's term; and, if persist, in the persistent tier too.
+    """
+    def __init__(self, pattern, ttl, persist=False):
+        self.pattern = re.compile(pattern)
+        self.ttl = ttl
+        self.persist = persist
+
+    def matches(self, endpoint):
+        return self.pattern.search(endpoint) is not None
+
+
+SECTION_TTL = PhaseTTL({
+    FUTURE: HOUR, REGISTRATION: 5 * MINUTE, ADD_DROP: 5 * MINUTE,
+    INSTRUCTION: HOUR, GRADING: HOUR, CLOSING: HOUR})
+
+REGISTRATION_TTL = PhaseTTL({
+    FUTURE: 15 * MINUTE, REGISTRATION: MINUTE, ADD_DROP: 5 * MINUTE,
+    INSTRUCTION: 15 * MINUTE, GRADING: 5 * MINUTE, CLOSING: 15 * MINUTE})
+
+DEFAULT_RULES = (
+    CacheRule(r"^/student/v5/term/(current|next|previous)\.json$", HOUR,
+              persist=True),
+    CacheRule(r"^/student/v5/term/\{term\}\.json$", DAY, persist=True),
+    CacheRule(r"^/student/v5/(campus|college|department)\.json", WEEK,
+              persist=True),
+    CacheRule(r"^/student/v5/curriculum\.json", DAY, persist=True),
+    CacheRule(r"^/student/v5/course/\{label\}\.json$", SECTION_TTL,
+              persist=True),
+    CacheRule(r"^/student/v5/course/\{label\}/status\.json$",
+              REGISTRATION_TTL),
+    CacheRule(r"^/student/v5/(registration|enrollment)\.json\?",
+              REGISTRATION_TTL, persist=True),
+    CacheRule(r"^/student/v5/(registration/\{label\}|enrollment/\{term\}"
+              r",\{regid\})\.json$", REGISTRATION_TTL, persist=True),
+)
+
+
+def url_term(url):
+    """
+    Returns the (year, quarter) of the term named in url, or None.
+    """
+    path, sep, query = url.partition("?")
+    match = _TERM_PATH.search(path)
+    if match:
+        return int(match.group(1)), match.group(2).lower()
+    params = parse_qs(query)
+    try:
+        year = int(params["year"][0])
+        quarter = params["quarter"][0].lower()
+    except (KeyError, ValueError):
+        return None
+    return (year, quarter) if quarter in QUARTERS else None
+
+
+def is_past_term(term, today=None):
+    """
+    Returns True if term, a (year, quarter), ended before the previous
+    quarter, so that its grades are final.
+    """
+    if term is None:
+        return False
+    today = today or sws_now().date()
+    current = today.year * 4 + (today.month - 1) // 3
+    return term[0] * 4 + QUARTERS.index(term[1]) < current - 1
+
+
+class TTLPolicy(object):
+    """
+    Chooses the ttl of a url's response by the first of rules matching
+    its endpoint, and the calendars of the terms it has observed.
+    """
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = tuple(rules)
+        self._calendars = {}
+        self._lock = Lock()
+
+    def rule_for(self, url):
+        endpoint = url_template(url)
+        for rule in self.rules:
+            if rule.matches(endpoint):
+                return rule
+
+    def get(self, url, now=None):
+        """
+        Returns the (ttl, persist) of url's response; a ttl of 0 if it
+        is not cached.
+        """
+        rule = self.rule_for(url)
+        if rule is None:
+            return 0, False
+        ttl = rule.ttl
+        if isinstance(ttl, PhaseTTL):
+            ttl = self._term_ttl(ttl, url_term(url), now or sws_now())
+        return ttl, rule.persist
+
+    def _term_ttl(self, ttl, term, now):
+        if term is None:
+            return 0
+        calendar = self._calendars.get(term)
+        if calendar is not None:
+            return ttl.get_ttl(calendar, now)
+        if is_past_term(term, now.date()):
+            return ttl.ttls[CLOSED]
+        return ttl.volatile
+
+    def calendar(self, term):
+        return self._calendars.get(term)
+
+    def add_calendar(self, term, calendar):
+        with self._lock:
+            self._calendars[term] = calendar
+
+    def observe(self, url, data):
+        """
+        Learns the calendar of the term in url's response data, if it
+        is a term resource.
+        """
+        if _TERM_ENDPOINT.match(url) is None:
+            return
+        try:
+            data = json.loads(data)
+            term = (int(data["Year"]), data["Quarter"].lower())
+        except (ValueError, TypeError, KeyError, AttributeError):
+            return
+        if term[1] in QUARTERS:
+            self.add_calendar(term, TermCalendar.from_json(data))
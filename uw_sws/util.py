@@ -1,12 +1,17 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import re
+from contextvars import copy_context
 from datetime import datetime, timedelta
+from functools import wraps
 from dateutil.parser import parse
 from restclients_core.util.decorators import use_mock
 from uw_sws.dao import SWS_DAO
 
 fdao_sws_override = use_mock(SWS_DAO())
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
 
 
 def str_to_datetime(s):
@@ -51,3 +56,69 @@ def convert_to_end_of_day(a_date):
     if a_date is None:
         return None
     return convert_to_begin_of_day(a_date) + timedelta(days=1)
+
+
+def iter_json_array(data, key):
+    """
+    Yield the elements of the named array in a top-level json object
+    one at a time, without decoding the whole document at once.
+    """
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return _iter_json_array(data, key)
+
+
+def _iter_json_array(text, key):
+    decoder = json.JSONDecoder()
+    idx = _expect(text, JSON_WHITESPACE.match(text).end(), "{")
+    if text.startswith("}", idx):
+        return
+
+    while True:
+        name, idx = decoder.raw_decode(text, idx)
+        idx = _expect(text, JSON_WHITESPACE.match(text, idx).end(), ":")
+        if name == key and text.startswith("[", idx):
+            idx = JSON_WHITESPACE.match(text, idx + 1).end()
+            if text.startswith("]", idx):
+                idx += 1
+            else:
+                while True:
+                    item, idx = decoder.raw_decode(text, idx)
+                    yield item
+                    idx = JSON_WHITESPACE.match(text, idx).end()
+                    if text.startswith("]", idx):
+                        idx += 1
+                        break
+                    idx = _expect(text, idx, ",")
+        else:
+            idx = decoder.raw_decode(text, idx)[1]
+
+        idx = JSON_WHITESPACE.match(text, idx).end()
+        if text.startswith("}", idx):
+            return
+        idx = _expect(text, idx, ",")
+
+
+def _expect(text, idx, char):
+    """
+    Return the index of the first non-whitespace character after the
+    expected char at idx.
+    """
+    if not text.startswith(char, idx):
+        raise json.JSONDecodeError(
+            "Expecting '{}'".format(char), text, idx)
+    return JSON_WHITESPACE.match(text, idx + 1).end()
+
+
+def propagate_context(func):
+    """
+    Returns func wrapped to run in a copy of the caller's context, so
+    that the current trace span and request priority carry over into
+    the thread it is handed to.
+    """
+    context = copy_context()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,233 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Preloads the response cache (see uw_sws.cache) with a term's resources,
+such as before its first registration period opens:
+
+    from uw_sws.warm import warm_term
+    warm_term(term, sections=True, checkpoint="/path/to/warm.json")
+
+The term, current, next and previous terms and the term's curricula are
+loaded first, then the section references of each curriculum, and
+optionally each section and its instructors, concurrently by Workers.
+Requests are made with bulk priority (see uw_sws.ratelimit), so that
+they leave interactive requests their reserve of the rate limit.
+
+Progress is logged, or passed to a progress(stage, done, total)
+callback. With a checkpoint file, the curricula and sections done are
+recorded as they finish, and a warm-up that was interrupted resumes
+from them; the file is removed once the warm-up completes.
+"""
+import json
+import logging
+import os
+from threading import Lock
+from uw_sws import DAO, get_resource
+from uw_sws.cache import get_cache
+from uw_sws.curriculum import get_curricula_by_term
+from uw_sws.ratelimit import PRIORITY_BULK, request_priority
+from uw_sws.section import (
+    get_section_by_url, get_sections_by_curriculum_and_term)
+from uw_sws.term import (
+    get_current_term, get_next_term, get_previous_term,
+    get_term_by_year_and_quarter)
+from uw_sws.worker import Worker
+
+logger = logging.getLogger(__name__)
+
+STAGE_TERMS = "terms"
+STAGE_CURRICULA = "curricula"
+STAGE_SECTION_REFS = "section_refs"
+STAGE_SECTIONS = "sections"
+
+# Completions between checkpoint writes
+CHECKPOINT_INTERVAL = 50
+
+
+class WarmLoader(Worker):
+    """
+    Loads a stage's resources, reporting each one done to the warmer.
+    """
+    def __init__(self, warmer, stage, task_ids, load):
+        self.warmer = warmer
+        self.stage = stage
+        self.task_ids = list(task_ids)
+        self.load = load
+
+    @property
+    def concurrency(self):
+        if self.warmer.concurrency:
+            return self.warmer.concurrency
+        return super(WarmLoader, self).concurrency
+
+    def get_task_ids(self):
+        return self.task_ids
+
+    def task(self, tid):
+        result = self.load(tid)
+        self.warmer.done(self.stage, tid, result)
+        return result
+
+
+class TermWarmer(object):
+    """
+    Warms the cache with the resources of term; with sections, each of
+    its sections too, and with instructors, also their PWS persons.
+    """
+    def __init__(self, term, sections=False, instructors=False,
+                 checkpoint=None, progress=None, concurrency=None):
+        self.term = term
+        self.sections = sections or instructors
+        self.instructors = instructors
+        self.checkpoint = checkpoint
+        self.progress = progress or _log_progress
+        self.concurrency = concurrency
+        self.counts = {}
+        self.failed = {}
+        self._lock = Lock()
+        self._totals = {}
+        self._resumed = {}
+        self._unsaved = 0
+        self._state = None
+        self._curricula = {}
+
+    def run(self):
+        """
+        Returns a dictionary of {stage: resources loaded}, and records
+        the number of failed ones by stage in failed.
+        """
+        if get_cache(DAO) is None:
+            logger.warning("Warming the {} {} resources with no "
+                           "cache configured".format(
+                               self.term.year, self.term.quarter))
+        self._state = self._load_checkpoint()
+        with request_priority(PRIORITY_BULK):
+            self._warm_terms()
+            self._warm_curricula()
+
+            refs = self._state[STAGE_SECTION_REFS]
+            self._run(STAGE_SECTION_REFS, sorted(self._curricula), refs,
+                      self._load_section_refs)
+            if self.sections:
+                urls = sorted(set(url for label in refs
+                                  for url in refs[label]))
+                self._run(STAGE_SECTIONS, urls, self._state[STAGE_SECTIONS],
+                          self._load_section)
+
+        self._remove_checkpoint()
+        return dict(self.counts)
+
+    def _warm_terms(self):
+        loads = (lambda: get_term_by_year_and_quarter(
+                     self.term.year, self.term.quarter),
+                 get_current_term, get_next_term, get_previous_term)
+        self._start(STAGE_TERMS, len(loads))
+        for load in loads:
+            load()
+            self.done(STAGE_TERMS, None, None)
+
+    def _warm_curricula(self):
+        self._start(STAGE_CURRICULA, 1)
+        self._curricula = {curriculum.label: curriculum for curriculum in
+                           get_curricula_by_term(self.term)}
+        self.done(STAGE_CURRICULA, None, None)
+
+    def _load_section_refs(self, label):
+        return [ref.url for ref in get_sections_by_curriculum_and_term(
+            self._curricula[label], self.term)]
+
+    def _load_section(self, url):
+        if self.instructors:
+            get_section_by_url(url)
+        else:
+            get_resource(url)
+        return True
+
+    def _run(self, stage, task_ids, done, load):
+        pending = [tid for tid in task_ids if tid not in done]
+        self._start(stage, len(task_ids), len(task_ids) - len(pending))
+        try:
+            if pending:
+                WarmLoader(self, stage, pending, load).run_tasks()
+        finally:
+            with self._lock:
+                self.failed[stage] = (self._totals[stage] -
+                                      self._resumed[stage] -
+                                      self.counts[stage])
+                self._save_checkpoint()
+
+    def _start(self, stage, total, resumed=0):
+        with self._lock:
+            self._totals[stage] = total
+            self._resumed[stage] = resumed
+            self.counts[stage] = 0
+
+    def done(self, stage, tid, result):
+        """
+        Records a resource of the stage as loaded.
+        """
+        with self._lock:
+            self.counts[stage] += 1
+            if stage in (STAGE_SECTION_REFS, STAGE_SECTIONS):
+                self._state[stage][tid] = result
+                self._unsaved += 1
+                if self._unsaved >= CHECKPOINT_INTERVAL:
+                    self._save_checkpoint()
+            done = self._resumed[stage] + self.counts[stage]
+            total = self._totals[stage]
+        self.progress(stage, done, total)
+
+    def _term_key(self):
+        return "{},{}".format(self.term.year, self.term.quarter.lower())
+
+    def _load_checkpoint(self):
+        state = {STAGE_SECTION_REFS: {}, STAGE_SECTIONS: {}}
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return state
+        try:
+            with open(self.checkpoint) as f:
+                saved = json.load(f)
+        except ValueError:
+            logger.warning("Ignoring the unreadable checkpoint {}".format(
+                self.checkpoint))
+            return state
+        if saved.get("term") != self._term_key():
+            return state
+        state[STAGE_SECTION_REFS].update(saved.get(STAGE_SECTION_REFS, {}))
+        state[STAGE_SECTIONS].update(
+            (url, True) for url in saved.get(STAGE_SECTIONS, []))
+        return state
+
+    def _save_checkpoint(self):
+        self._unsaved = 0
+        if self.checkpoint is None:
+            return
+        path = "{}.tmp".format(self.checkpoint)
+        with open(path, "w") as f:
+            json.dump({
+                "term": self._term_key(),
+                STAGE_SECTION_REFS: self._state[STAGE_SECTION_REFS],
+                STAGE_SECTIONS: list(self._state[STAGE_SECTIONS]),
+            }, f)
+        os.replace(path, self.checkpoint)
+
+    def _remove_checkpoint(self):
+        if (self.checkpoint is not None and
+                not any(self.failed.values()) and
+                os.path.exists(self.checkpoint)):
+            os.remove(self.checkpoint)
+
+
+def _log_progress(stage, done, total):
+    logger.info("Warmed {} {}/{}".format(stage, done, total))
+
+
+def warm_term(term, sections=False, instructors=False, checkpoint=None,
+              progress=None, concurrency=None):
+    """
+    Warms the cache with the resources of the passed Term, and returns a
+    dictionary of {stage: resources loaded}.
+    """
+    return TermWarmer(term, sections, instructors, checkpoint, progress,
+                      concurrency).run()
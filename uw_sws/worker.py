@@ -3,8 +3,11 @@
 
 from abc import ABC, abstractmethod
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from uw_sws import DAO
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from uw_sws import DAO, tracing
+from uw_sws.deadline import deadline_scope
+from uw_sws.exceptions import DeadlineExceeded
+from uw_sws.util import propagate_context
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +29,11 @@ class Worker(ABC):
     def concurrency(self):
         return DAO.get_service_setting("THREAD_POOL_SIZE", 10)
 
-    def run_tasks(self):
+    def run_tasks(self, timeout=None):
         """
-        Return a dictionary of task-ids to results
+        Return a dictionary of task-ids to results. Raises
+        DeadlineExceeded, dropping the unfinished tasks, if they are not
+        done within timeout seconds or the current deadline.
         """
         results = {}
         task_ids = self.get_task_ids() or []
@@ -39,25 +44,47 @@ class Worker(ABC):
         max_workers = min(self.concurrency, total_tasks)
         batch_size = min(max_workers * 4, total_tasks)
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for i in range(0, total_tasks, batch_size):
-                chunk = task_ids[i:i + batch_size]
-                futures = {
-                    executor.submit(self.task, tid): tid
-                    for tid in chunk
-                }
-
-                # Handle tasks in their completion order
-                for future in as_completed(futures):
-                    # As soon as any finishes, store its result immediately
-                    tid = futures[future]
-                    try:
-                        results[tid] = future.result()
-                    except Exception as ex:
-                        logger.error(f"Task failed for {tid}: {ex}")
-        # Upon block exits, Python automatically shutdown the executor
+        with deadline_scope(timeout) as deadline:
+            task = propagate_context(
+                self.task if tracing.get_trace_collector() is None
+                else self._traced_task)
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            try:
+                for i in range(0, total_tasks, batch_size):
+                    chunk = task_ids[i:i + batch_size]
+                    futures = {
+                        executor.submit(task, tid): tid
+                        for tid in chunk
+                    }
+                    self._collect(futures, results, deadline)
+            finally:
+                # Don't wait on tasks still running past the deadline
+                executor.shutdown(wait=not deadline.expired(),
+                                  cancel_futures=True)
         return results
 
+    def _collect(self, futures, results, deadline):
+        try:
+            # Handle tasks in their completion order
+            for future in as_completed(futures, deadline.remaining()):
+                # As soon as any finishes, store its result immediately
+                tid = futures[future]
+                try:
+                    results[tid] = future.result()
+                except DeadlineExceeded:
+                    deadline.cancel()
+                    raise
+                except Exception as ex:
+                    logger.error(f"Task failed for {tid}: {ex}")
+        except TimeoutError:
+            deadline.cancel()
+            raise DeadlineExceeded(None, "{} tasks not done".format(
+                type(self).__name__))
+
+    def _traced_task(self, tid):
+        with tracing.span("{}.task".format(type(self).__name__), tid=tid):
+            return self.task(tid)
+
 
 class PersonGetter(Worker):
     """